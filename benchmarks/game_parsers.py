@@ -0,0 +1,92 @@
+"""Time the game data parsers on the game center fixtures
+
+This compares key normalization and numeric key checks done with
+uncompiled regular expressions on every key, as the parsers used to,
+against the precompiled, memoized versions on GameDataParser, then
+times each parser over the fixtures. Run from the root of the
+repository with:
+
+    python -m benchmarks.game_parsers [--repeat N]
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import timeit
+from nflapi.GameDataParser import GameDataParser
+from nflapi.GameSummary import GameSummary
+from nflapi.GameScore import GameScore
+from nflapi.GameDrive import GameDrive
+from nflapi.GamePlay import GamePlay
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "data")
+
+def loadGames() -> list:
+    """Load the (gsis_id, game data) of each fixture"""
+    games = []
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "game_*_gtd.json"))):
+        with open(path, "rt") as fp:
+            gdata = json.load(fp)
+        gsisid = [k for k in gdata.keys() if re.search(r"^\d+$", k)][0]
+        games.append((gsisid, gdata[gsisid]))
+    return games
+
+def collectKeys(games : list) -> tuple:
+    """Collect the keys the parsers test, in the order they meet them
+
+    Returns
+    -------
+    tuple of (list, list)
+        The drive level keys and the player statistic item keys
+    """
+    dkeys = []
+    ikeys = []
+    for _, srcdata in games:
+        for driveid, drive in srcdata["drives"].items():
+            dkeys.append(driveid)
+            if re.search(r"^\d+$", driveid):
+                for playdict in drive["plays"].values():
+                    for pllist in playdict.get("players", {}).values():
+                        for plitem in pllist:
+                            ikeys.extend(k for k in plitem.keys() if k != "yards")
+    return (dkeys, ikeys)
+
+def main():
+    argp = argparse.ArgumentParser(description="Time the game data parsers")
+    argp.add_argument("--repeat", type=int, default=20, help="passes over the fixtures")
+    args = argp.parse_args()
+    games = loadGames()
+    dkeys, ikeys = collectKeys(games)
+
+    def uncachedNumeric():
+        for k in dkeys:
+            re.search(r"^\d+$", k)
+    def cachedNumeric():
+        for k in dkeys:
+            GameDataParser._isNumericKey(k)
+    def uncachedNormalize():
+        for k in ikeys:
+            re.sub(r"([a-z])([A-Z])", r"\1_\2", k).lower()
+    def cachedNormalize():
+        for k in ikeys:
+            GameDataParser._normalizeKey(k)
+
+    print("{} games, {} drive keys, {} player statistic keys".format(len(games), len(dkeys), len(ikeys)))
+    print("{:30s}{:>14s}{:>14s}{:>10s}".format("per pass", "uncached", "cached", "speedup"))
+    for name, uncached, cached in [("numeric key checks", uncachedNumeric, cachedNumeric),
+                                   ("key normalization", uncachedNormalize, cachedNormalize)]:
+        tu = min(timeit.repeat(uncached, number=1, repeat=args.repeat))
+        tc = min(timeit.repeat(cached, number=1, repeat=args.repeat))
+        print("{:30s}{:>11.3f} ms{:>11.3f} ms{:>9.1f}x".format(name, tu * 1000, tc * 1000, tu / tc))
+
+    print("{:30s}{:>14s}".format("parser, all games", "per pass"))
+    for parser in [GameSummary(False), GameScore(False), GameDrive(False), GamePlay(False)]:
+        def parseAll():
+            for gsisid, srcdata in games:
+                parser._doParse(srcdata, {"gsis_id": gsisid})
+        t = min(timeit.repeat(parseAll, number=1, repeat=args.repeat))
+        print("{:30s}{:>11.3f} ms".format(type(parser).__name__, t * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Time the parsing of the html fixtures with each BeautifulSoup tree builder,
+with and without restricting the parse to the tags of interest
+
+Run from the root of the repository with:
+
+    python -m benchmarks.html_parsers [--repeat N]
+"""
+import argparse
+import glob
+import os
+import re
+import time
+from nflapi.BSContentHandler import BSContentHandler
+from nflapi.RosterContentHandler import RosterContentHandler
+from nflapi.PlayerProfileContentHandler import PlayerProfileContentHandler
+from nflapi.PlayerGameLogsContentHandler import PlayerGameLogsContentHandler
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "data")
+
+def getParsers() -> list:
+    parsers = ["html.parser"]
+    try:
+        import lxml
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+def getHandler(fname : str) -> BSContentHandler:
+    if fname.startswith("roster_"):
+        handler = RosterContentHandler(fname[7:-5].upper())
+    elif fname.startswith("profile_"):
+        handler = PlayerProfileContentHandler()
+    else:
+        season = int(re.search(r"_(\d{4})\.html$", fname).group(1))
+        handler = PlayerGameLogsContentHandler(season)
+    return handler
+
+def timeParse(handler : BSContentHandler, docstr : str, repeat : int) -> float:
+    """Return the best time, in seconds, of repeat parses of docstr"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        handler.parse(docstr)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    argp = argparse.ArgumentParser(description="Time parsing of the html fixtures")
+    argp.add_argument("--repeat", type=int, default=5, help="parses per page and parser")
+    args = argp.parse_args()
+    configs = [(p, s) for p in getParsers() for s in (False, True)]
+    labels = ["{}{}".format(p, "+strain" if s else "") for p, s in configs]
+    print("{:45s}".format("page") + "".join("{:>20s}".format(l) for l in labels))
+    totals = dict((c, 0.0) for c in configs)
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "*.html"))):
+        fname = os.path.basename(path)
+        if fname.startswith("invalid_"):
+            continue
+        with open(path, "rt") as fp:
+            docstr = fp.read()
+        line = "{:45s}".format(fname)
+        for parser, strain in configs:
+            BSContentHandler.STRAIN_PAGES = strain
+            handler = getHandler(fname)
+            handler.parser = parser
+            secs = timeParse(handler, docstr, args.repeat)
+            totals[(parser, strain)] += secs
+            line += "{:>17.1f} ms".format(secs * 1000)
+        print(line)
+    print("{:45s}".format("total") + "".join("{:>17.1f} ms".format(totals[c] * 1000) for c in configs))
+
+if __name__ == "__main__":
+    main()
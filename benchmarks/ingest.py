@@ -0,0 +1,161 @@
+"""Measure the throughput of every parser and handler on the tests/data fixtures
+
+Each fixture is replayed through the handler, or parser, that reads
+its kind of document: schedule xml, roster, profile and game log html
+and game center json, the latter through each of the game data
+parsers. For each one this reports documents and rows parsed per
+second over a number of passes, and the peak memory allocated while
+parsing one pass, as measured by tracemalloc. Nothing is retrieved
+from the network.
+
+The results may be saved as JSON, with the commit they were measured
+at, and compared with those saved earlier. Run from the root of the
+repository with:
+
+    python -m benchmarks.ingest [--repeat N] [--output FILE] [--compare FILE]
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import re
+import subprocess
+import time
+import tracemalloc
+import xml.sax
+from nflapi.ScheduleContentHandler import ScheduleContentHandler
+from nflapi.GameSummary import GameSummary
+from nflapi.GameScore import GameScore
+from nflapi.GameDrive import GameDrive
+from nflapi.GamePlay import GamePlay
+from nflapi.GameTables import GameTables
+from benchmarks.html_parsers import DATA_DIR, getHandler
+
+def parseSchedule(fname : str) -> callable:
+    handler = ScheduleContentHandler()
+    def parse(docstr : str) -> int:
+        xml.sax.parseString(docstr, handler)
+        return len(handler.list)
+    return parse
+
+def parseHtml(fname : str) -> callable:
+    handler = getHandler(fname)
+    def parse(docstr : str) -> int:
+        handler.parse(docstr)
+        return len(handler.list)
+    return parse
+
+def parseGame(cls : type) -> callable:
+    def factory(fname : str) -> callable:
+        parser = cls(False)
+        def parse(docstr : str) -> int:
+            data = parser._doParse(*_gameSource(docstr))
+            if isinstance(data, dict):
+                # GameTables produces several tables at once
+                return sum(len(d) for d in data.values())
+            return len(data)
+        return parse
+    return factory
+
+def _gameSource(docstr : str) -> tuple:
+    # As GameDataParser._getGameSource does with the retrieved document
+    gdata = json.loads(docstr)
+    gsisid = [k for k in gdata.keys() if re.search(r"^\d+$", k)][0]
+    return (gdata[gsisid], {"gsis_id": gsisid})
+
+# The name, fixture pattern and parse function factory of each parser
+PARSERS = [
+    ("ScheduleContentHandler", "schedule_*.xml", parseSchedule),
+    ("RosterContentHandler", "roster_*.html", parseHtml),
+    ("PlayerProfileContentHandler", "profile_*.html", parseHtml),
+    ("PlayerGameLogsContentHandler", "gamelogs_*.html", parseHtml),
+    ("GameSummary", "game_*_gtd.json", parseGame(GameSummary)),
+    ("GameScore", "game_*_gtd.json", parseGame(GameScore)),
+    ("GameDrive", "game_*_gtd.json", parseGame(GameDrive)),
+    ("GamePlay", "game_*_gtd.json", parseGame(GamePlay)),
+    ("GameTables", "game_*_gtd.json", parseGame(GameTables))
+]
+
+def loadFixtures(pattern : str) -> list:
+    """Load the (file name, document) of each fixture matching pattern"""
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, pattern))):
+        with open(path, "rt") as fp:
+            fixtures.append((os.path.basename(path), fp.read()))
+    return fixtures
+
+def measure(factory : callable, fixtures : list, repeat : int) -> dict:
+    """Parse the fixtures repeat times and return the measurements"""
+    parses = [(factory(fname), docstr) for fname, docstr in fixtures]
+    # The first pass warms up caches and is not timed
+    rows = sum(parse(docstr) for parse, docstr in parses)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for parse, docstr in parses:
+            parse(docstr)
+    secs = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        for parse, docstr in parses:
+            parse(docstr)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    ndocs = len(fixtures) * repeat
+    return {
+        "documents": len(fixtures),
+        "rows": rows,
+        "seconds": secs,
+        "docs_per_sec": ndocs / secs,
+        "rows_per_sec": rows * repeat / secs,
+        "peak_bytes": peak
+    }
+
+def getCommit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(DATA_DIR))
+        commit = out.stdout.strip() or None
+    except OSError:
+        commit = None
+    return commit
+
+def main():
+    argp = argparse.ArgumentParser(description="Measure parser throughput on the test fixtures")
+    argp.add_argument("--repeat", type=int, default=20, help="timed passes over the fixtures")
+    argp.add_argument("--output", help="file to save the results to as JSON")
+    argp.add_argument("--compare", help="JSON file of earlier results to compare with")
+    args = argp.parse_args()
+    report = {
+        "created": datetime.datetime.now().isoformat(),
+        "commit": getCommit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": {}
+    }
+    for name, pattern, factory in PARSERS:
+        report["results"][name] = measure(factory, loadFixtures(pattern), args.repeat)
+    baseline = {}
+    if args.compare is not None:
+        with open(args.compare, "rt") as fp:
+            baseline = json.load(fp)["results"]
+
+    header = "{:30s}{:>6s}{:>8s}{:>12s}{:>14s}{:>12s}".format("parser", "docs", "rows", "docs/sec", "rows/sec", "peak KiB")
+    if len(baseline) > 0:
+        header += "{:>12s}".format("vs base")
+    print(header)
+    for name, r in report["results"].items():
+        line = "{:30s}{:>6d}{:>8d}{:>12.1f}{:>14.1f}{:>12.1f}".format(
+            name, r["documents"], r["rows"], r["docs_per_sec"], r["rows_per_sec"], r["peak_bytes"] / 1024)
+        if name in baseline:
+            line += "{:>11.2f}x".format(r["docs_per_sec"] / baseline[name]["docs_per_sec"])
+        print(line)
+    if args.output is not None:
+        with open(args.output, "wt") as fp:
+            json.dump(report, fp, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Drive a Client against a local StandInServer and report its throughput
+
+The server serves the tests/data fixtures, substituting them for
+documents that have no fixture, with the given latency and error
+rate. For each number of workers a new Client retrieves a season's
+schedule, its finished games, the rosters of every team and the
+profiles and game logs of a number of players. Items that fail are
+counted and the run continues. The latency of every request is
+recorded through the Client's APIStats, and the retries and
+connections of its HttpPool are reported. Run from the root of the
+repository with:
+
+    python -m benchmarks.load_test [--workers 1,4,16] [--latency 0.05] [--error-rate 0.01] [--retries 3]
+"""
+import argparse
+import time
+from nflapi.API import API
+from nflapi.Client import Client
+from nflapi.HttpPool import HttpPool
+from nflapi.StandInServer import StandInServer
+from benchmarks.html_parsers import DATA_DIR
+
+def runItems(client : Client, api : API, fun : callable, items : list) -> tuple:
+    """Call fun(api, item) for each item as the Client does
+
+    Returns
+    -------
+    tuple of (list, int)
+        The return values of the calls that succeeded and the number that failed
+    """
+    def call(worker : API, item) -> tuple:
+        try:
+            return (fun(worker, item), None)
+        except Exception as e:
+            return (None, e)
+    rslts = []
+    failed = 0
+    for rslt, error in client._fanIter(api, call, items):
+        if error is None:
+            rslts.append(rslt)
+        else:
+            failed += 1
+    return (rslts, failed)
+
+def runLoad(client : Client, season : int, players : int) -> int:
+    """Retrieve a season's data and return the number of failed items"""
+    weeks = client._scheduleWeeks(season, "regular_season")
+    scheds, failed = runItems(client, client._schedule, lambda s, w: s.getSchedule(*w, list), weeks)
+    games = [g for sched in scheds for g in sched if g["finished"]]
+    _, nfail = runItems(client, client._gmtables, lambda gt, g: gt.getGameTables(g), games)
+    failed += nfail
+    teams = [t["team"] for t in client.getTeams()]
+    rosters, nfail = runItems(client, client._roster, lambda r, t: r.getRoster(t, list), teams)
+    failed += nfail
+    rplayers = [r for roster in rosters for r in roster][:players]
+    _, nfail = runItems(client, client._plprof, lambda pp, r: pp.getProfile(r, list), rplayers)
+    failed += nfail
+    _, nfail = runItems(client, client._plgmlog, lambda pgl, r: pgl.getGameLogs(r, season, list), rplayers)
+    return failed + nfail
+
+def percentile(values : list, p : float) -> float:
+    values = sorted(values)
+    if len(values) == 0:
+        return float("nan")
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def main():
+    argp = argparse.ArgumentParser(description="Load test a Client against a local stand-in for nfl.com")
+    argp.add_argument("--workers", default="1,4,16", help="comma separated Client max_workers values")
+    argp.add_argument("--latency", type=float, default=0.05, help="seconds the server waits before responding")
+    argp.add_argument("--jitter", type=float, default=0.02, help="up to this many more seconds are waited")
+    argp.add_argument("--error-rate", type=float, default=0.0, help="proportion of requests answered with 503")
+    argp.add_argument("--retries", type=int, default=3, help="retries of failed requests by the HttpPool")
+    argp.add_argument("--maxsize", type=int, default=None, help="HttpPool connections per host [default: the workers]")
+    argp.add_argument("--no-compress", action="store_true", help="do not ask for compressed responses")
+    argp.add_argument("--season", type=int, default=2018)
+    argp.add_argument("--players", type=int, default=100, help="players whose profiles and game logs are retrieved")
+    argp.add_argument("--seed", type=int, default=1)
+    args = argp.parse_args()
+    print("{:>8s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}".format(
+        "workers", "requests", "errors", "failed", "req/sec", "p50 ms", "p95 ms", "p99 ms",
+        "retries", "opened", "discarded", "MB recv"))
+    for workers in [int(w) for w in args.workers.split(",")]:
+        with StandInServer(DATA_DIR, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           substitute=True, seed=args.seed) as server:
+            # By default a connection per worker, so that none are discarded
+            http = HttpPool(maxsize=args.maxsize or workers, retries=args.retries, backoff_factor=0.1,
+                            compress=not args.no_compress)
+            client = Client(max_workers=workers, endpoints=server.endpoints(http))
+            latencies = []
+            errors = [0]
+            def onEvent(event : dict):
+                if event["event"] == "fetch":
+                    latencies.append(event["seconds"])
+                    if event["status"] is None or event["status"] >= 400:
+                        errors[0] += 1
+            client.stats.subscribe(onEvent)
+            start = time.perf_counter()
+            failed = runLoad(client, args.season, args.players)
+            secs = time.perf_counter() - start
+        pool = http.metrics()
+        print("{:>8d}{:>10d}{:>10d}{:>10d}{:>10.1f}{:>10.1f}{:>10.1f}{:>10.1f}{:>10d}{:>10d}{:>10d}{:>10.2f}".format(
+            workers, len(latencies), errors[0], failed, len(latencies) / secs,
+            percentile(latencies, 50) * 1000, percentile(latencies, 95) * 1000, percentile(latencies, 99) * 1000,
+            pool["retries"], pool["connections_opened"], pool["connections_discarded"],
+            pool["bytes_received"] / 1e6))
+
+if __name__ == "__main__":
+    main()
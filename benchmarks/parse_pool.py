@@ -0,0 +1,74 @@
+"""Time parsing the html fixtures with a ParsePool of each number of workers
+
+Documents are handed to parsers by a pool of threads, as a Client
+with max_workers greater than 1 does. With 0 processes they are
+parsed in those threads, as without a ParsePool, so they are limited
+to one core by the GIL. With N processes they are parsed by a
+ParsePool of N worker processes. The worker processes are started
+before timing begins. Run from the root of the repository with:
+
+    python -m benchmarks.parse_pool [--copies N] [--threads N] [--processes 0,1,2,4]
+"""
+import argparse
+import copy
+import glob
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from nflapi.ParsePool import ParsePool
+from benchmarks.html_parsers import DATA_DIR, getHandler
+
+def loadDocuments(copies : int) -> list:
+    """Load the (handler, document) of each html fixture copies times"""
+    docs = []
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "*.html"))):
+        fname = os.path.basename(path)
+        if fname.startswith("invalid_"):
+            continue
+        with open(path, "rt") as fp:
+            docs.append((getHandler(fname), fp.read()))
+    return docs * copies
+
+def parseAll(docs : list, threads : int, pool : ParsePool) -> int:
+    """Parse the documents and return the number of rows"""
+    def parse(item) -> int:
+        handler, docstr = item
+        handler = copy.copy(handler)
+        if pool is None:
+            handler.parse(docstr)
+            rows = handler.list
+        else:
+            rows = pool.parse(handler, docstr)
+        return len(rows)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return sum(executor.map(parse, docs))
+
+def main():
+    argp = argparse.ArgumentParser(description="Time parsing with a ParsePool of each number of workers")
+    argp.add_argument("--copies", type=int, default=10, help="times each fixture is parsed")
+    argp.add_argument("--threads", type=int, default=8, help="threads handing documents to the parsers")
+    argp.add_argument("--processes", default="0,1,2,4", help="comma separated ParsePool sizes; 0 is no pool")
+    args = argp.parse_args()
+    docs = loadDocuments(args.copies)
+    print("{} documents, {} threads, {} processors".format(len(docs), args.threads, os.cpu_count()))
+    print("{:>10s}{:>12s}{:>12s}{:>10s}".format("processes", "seconds", "docs/sec", "speedup"))
+    base = None
+    for nproc in [int(n) for n in args.processes.split(",")]:
+        pool = None
+        if nproc > 0:
+            pool = ParsePool(nproc)
+            # Start the worker processes before timing
+            parseAll(docs[:nproc], nproc, pool)
+        try:
+            start = time.perf_counter()
+            parseAll(docs, args.threads, pool)
+            secs = time.perf_counter() - start
+        finally:
+            if pool is not None:
+                pool.close()
+        if base is None:
+            base = secs
+        print("{:>10d}{:>12.3f}{:>12.1f}{:>9.2f}x".format(nproc, secs, len(docs) / secs, base / secs))
+
+if __name__ == "__main__":
+    main()
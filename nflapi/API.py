@@ -1,16 +1,57 @@
 import xml.sax
+import copy
 from urllib3 import PoolManager, HTTPResponse
-import re
+import time
+from typing import Union
+from urllib.parse import urlparse
 from nflapi.AbstractContentHandler import AbstractContentHandler
-from nflapi.Exceptions import MissingDocumentException
+from nflapi.Exceptions import MissingDocumentException, ResponseStatusException
+from nflapi.DiskCache import DiskCache
+from nflapi.APIStats import APIStats
+from nflapi.Endpoints import Endpoints
+from nflapi.HttpPool import HttpPool
 
 class API(object):
     """Base class for classes that retrieve data from the NFL APIs"""
-    __http__ : PoolManager = PoolManager()
+    # Replace this with an HttpPool of other settings, e.g. a larger
+    # maxsize for many workers, for the objects created afterwards
+    __http__ : PoolManager = HttpPool()
+    # Set this to a DiskCache to persist responses for all objects
+    __disk_cache__ : DiskCache = None
+    # The DiskCache resource name used to look up the TTL of responses
+    _diskCacheResource : str = None
+    # Set this to an APIStats to record the requests of all objects
+    __stats__ : APIStats = None
+    # Set this to an Endpoints to send the requests of all objects
+    # to another base URL, or with another transport
+    __endpoints__ : Endpoints = Endpoints()
+    # The URL pattern requests are recorded under in the APIStats. If
+    # None then the path of the URL is used.
+    _urlPattern : str = None
+    # Should UTF-8 documents be given to _parseDocument as the bytes
+    # of the response rather than decoded to a str. Set this when the
+    # parser reads bytes itself, as the SAX parser and json do.
+    _parseBytes : bool = False
 
     def __init__(self, srcurl : str, handler : AbstractContentHandler):
+        """Constructor for the API class
+
+        Parameters
+        ----------
+        srcurl : str
+            The path of the document on the site, e.g. /teams/roster,
+            or its absolute URL. See `Endpoints`.
+        handler : AbstractContentHandler
+            Parses the document
+        """
         self._handler = handler
         self._http = API.__http__
+        self._endpoints = API.__endpoints__
+        self._diskCache = API.__disk_cache__
+        self._stats = API.__stats__
+        self._diskCacheDigest : str = None
+        self._diskCacheReused = False
+        self._diskCachePending : tuple = None
         self._url = srcurl
 
     @property
@@ -21,26 +62,202 @@ class API(object):
     def _url(self, srcurl : str):
         self._srcurl = srcurl
 
+    @property
+    def _requestUrl(self) -> str:
+        """The URL the document is requested from"""
+        return self._endpoints.url(self._url)
+
+    @property
+    def _siteUrl(self) -> str:
+        """The URL of the document on the site, which names it in the DiskCache"""
+        return Endpoints.siteUrl(self._url)
+
+    @property
+    def _endpoints(self) -> Endpoints:
+        return self._endpoints_v
+
+    @_endpoints.setter
+    def _endpoints(self, endpoints : Endpoints):
+        self._endpoints_v = endpoints
+        if endpoints.transport is not None:
+            self._http = endpoints.transport
+
+    def _copy(self) -> "API":
+        """Create a copy of this object for use in another thread
+
+        The copy shares the connection pool, and any cache, with this
+        object but has its own handler so that documents parsed by
+        the copy do not interfere with those parsed by this object.
+        """
+        other = copy.copy(self)
+        other._handler = copy.copy(self._handler)
+        return other
+
     def _processQuery(self, query_doc : dict = None):
         """Query nfl.com and process the results
 
         This will send the query to the nfl.com API/website
         and send the results to the `_parseDocument` method.
         """
-        self._parseDocument(self._queryAPI(query_doc))
+        docstr = self._queryAPI(query_doc)
+        start = time.perf_counter()
+        self._parseDocument(docstr)
+        if self._stats is not None:
+            self._stats.recordParse(self._statsPattern, time.perf_counter() - start)
+        self._storeDocument()
+
+    @property
+    def _diskCache(self) -> DiskCache:
+        return self._disk_cache_v
+
+    @_diskCache.setter
+    def _diskCache(self, cache : DiskCache):
+        self._disk_cache_v = cache
+
+    @property
+    def _stats(self) -> APIStats:
+        return self._stats_v
+
+    @_stats.setter
+    def _stats(self, stats : APIStats):
+        self._stats_v = stats
+
+    @property
+    def _statsPattern(self) -> str:
+        pattern = self._urlPattern
+        if pattern is None:
+            pattern = urlparse(self._url).path
+        return pattern
+
+    def _diskCacheTTL(self, query_doc : dict = None) -> float:
+        """The number of seconds the response to a query may be reused
+
+        Override this in your subclass when the TTL depends upon the
+        query. None means the response never expires and 0 means the
+        response is not stored.
+        """
+        return self._diskCache.ttl(self._diskCacheResource)
 
-    def _queryAPI(self, query_doc : dict = None) -> str:
-        rslt = self._http.request("GET", self._url, fields=query_doc)
+    def _queryAPI(self, query_doc : dict = None) -> Union[str, bytes]:
+        cache = self._diskCache
+        stats = self._stats
+        ttl = 0
+        entry = None
+        headers = None
+        # These record whether the returned document is one that was
+        # already stored in the disk cache, and which version it is.
+        self._diskCacheDigest = None
+        self._diskCacheReused = False
+        self._diskCachePending = None
+        if cache is not None:
+            ttl = self._diskCacheTTL(query_doc)
+            if ttl is None or ttl > 0:
+                entry = cache.getEntry(self._siteUrl, query_doc, include_expired=True, binary=True)
+        if entry is not None:
+            meta, data = entry
+            if not cache.isExpired(meta):
+                if stats is not None:
+                    stats.recordCache(self._statsPattern, "disk", True)
+                self._diskCacheDigest = meta["digest"]
+                self._diskCacheReused = True
+                return self._document(data, meta.get("charset"))
+            # Ask the source to only send the document if it has
+            # changed since we stored it.
+            headers = self._revalidationHeaders(meta)
+        rslt = self._request(query_doc, headers)
+        if rslt.status == 304 and entry is not None:
+            if stats is not None:
+                stats.recordCache(self._statsPattern, "disk", True)
+            self._diskCacheDigest = cache.refresh(self._siteUrl, query_doc, ttl)
+            self._diskCacheReused = self._diskCacheDigest is not None
+            return self._document(entry[1], entry[0].get("charset"))
+        if stats is not None and cache is not None and (ttl is None or ttl > 0):
+            stats.recordCache(self._statsPattern, "disk", False)
         if rslt.status == 404:
-            raise MissingDocumentException("document {} does not exist".format(self._url))
-        return rslt.data.decode(self._getResponseEncoding(rslt))
+            raise MissingDocumentException("document {} does not exist".format(self._requestUrl))
+        if rslt.status >= 400:
+            # e.g. a 503 that was still returned once the retries of the
+            # HttpPool were exhausted, which is not the document
+            raise ResponseStatusException("request for document {} failed with status {}".format(
+                self._requestUrl, rslt.status))
+        start = time.perf_counter()
+        charset = self._getResponseCharset(rslt)
+        docstr = self._document(rslt.data, charset)
+        if stats is not None:
+            stats.recordDecode(self._statsPattern, time.perf_counter() - start)
+        if cache is not None and 200 <= rslt.status < 300:
+            # The response is stored as received, with its charset, by
+            # _storeDocument once it has been parsed, so that an error
+            # page or a document that cannot be parsed is not stored.
+            self._diskCachePending = (query_doc, rslt.data, ttl, rslt.headers.get("ETag"),
+                                      rslt.headers.get("Last-Modified"), charset)
+        return docstr
+
+    def _storeDocument(self):
+        """Store the document last returned by `_queryAPI` in the DiskCache
+
+        Call this once the document has been parsed. It does nothing
+        if the document was not a new response to be stored.
+        """
+        pending = self._diskCachePending
+        self._diskCachePending = None
+        if pending is not None:
+            self._diskCacheDigest = self._diskCache.put(self._siteUrl, *pending)
+
+    def _request(self, query_doc : dict = None, headers : dict = None) -> HTTPResponse:
+        """Send a GET request for the URL and record it in the APIStats"""
+        stats = self._stats
+        if stats is None:
+            return self._http.request("GET", self._requestUrl, fields=query_doc, headers=headers)
+        start = time.perf_counter()
+        try:
+            rslt = self._http.request("GET", self._requestUrl, fields=query_doc, headers=headers)
+        except Exception:
+            stats.recordFetch(self._statsPattern, time.perf_counter() - start, 0, None)
+            raise
+        stats.recordFetch(self._statsPattern, time.perf_counter() - start, self._receivedBytes(rslt), rslt.status)
+        return rslt
+
+    def _receivedBytes(self, response : HTTPResponse) -> int:
+        """The size of the body of a response as it was received, before any decompression
+
+        Responses read by an HttpPool record this. For other responses
+        the size of the body, as given to the API, is used.
+        """
+        received = getattr(response, "received", None)
+        if received is None:
+            received = len(response.data or b"")
+        return received
 
-    def _getResponseEncoding(self, response : HTTPResponse) -> str:
-        enc = "utf-8"
-        ctype = response.headers["Content-Type"]
-        if re.search(r"charset=", ctype) is not None:
-            enc = re.sub(r"^.+charset=", "", ctype)
-        return enc
+    def _revalidationHeaders(self, meta : dict) -> dict:
+        headers = None
+        if meta.get("etag") is not None or meta.get("last_modified") is not None:
+            headers = {}
+            if meta.get("etag") is not None:
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified") is not None:
+                headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _getResponseCharset(self, response : HTTPResponse) -> str:
+        """The charset of the Content-Type header of a response, or None if it has none"""
+        charset = None
+        ctype = response.headers.get("Content-Type")
+        if ctype is not None and "charset=" in ctype:
+            charset = ctype.split("charset=", 1)[1].split(";", 1)[0].strip().strip('"').lower()
+        return charset
+
+    def _document(self, data : bytes, charset : str = None) -> Union[str, bytes]:
+        """Get the document to parse from the body of a response
+
+        The body is decoded with its charset, UTF-8 if None, unless
+        `_parseBytes` is True and it is UTF-8.
+        """
+        if charset is None or charset in ("utf-8", "utf8"):
+            if self._parseBytes:
+                return data
+            charset = "utf-8"
+        return data.decode(charset)
 
     def _parseDocument(self, docstr : str):
         """Implement this in your subclass
@@ -52,7 +269,8 @@ class API(object):
 
         Parameters
         ----------
-        docstr : str
-            The document text to be parsed.
+        docstr : str or bytes
+            The document text to be parsed, or the UTF-8 bytes of
+            the document when `_parseBytes` is True.
         """
         raise NotImplementedError("abstract base class API method _parseDocument has not been implemented")
@@ -0,0 +1,127 @@
+import threading
+from typing import List, Dict
+
+class APIStats(object):
+    """Collects timings and sizes of the requests made by API objects
+
+    API objects given an APIStats record, by URL pattern, e.g.
+    "/ajax/scorestrip", each request sent with its duration, the
+    size and status of the response and the time to decode it, the
+    time taken to parse each document, and whether the rows for a
+    query were found in the in-memory cache, or the document in the
+    disk cache. `summary` totals these per URL pattern.
+
+    Functions added with `subscribe` are called with a dict of each
+    event as it is recorded, e.g. to feed a metrics system. They are
+    called in the thread that made the request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._patterns : Dict[str, dict] = {}
+        self._listeners : List[callable] = []
+
+    def subscribe(self, listener : callable):
+        """Call listener(event) for each event recorded
+
+        Parameters
+        ----------
+        listener : callable
+            Called with a dict with keys "pattern" and "event", which
+            is one of "fetch", "decode", "parse" or "cache", and the
+            values recorded for the event
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def recordFetch(self, pattern : str, seconds : float, nbytes : int, status : int):
+        """Record a request
+
+        nbytes is the size of the body as received, before any
+        decompression, and status is None if no response was received.
+        """
+        with self._lock:
+            s = self._stats(pattern)
+            s["requests"] += 1
+            s["fetch_seconds"] += seconds
+            s["fetch_max_seconds"] = max(s["fetch_max_seconds"], seconds)
+            s["bytes"] += nbytes
+            s["status"][status] = s["status"].get(status, 0) + 1
+            if status is None or status >= 400:
+                s["errors"] += 1
+        self._notify(pattern, "fetch", seconds=seconds, bytes=nbytes, status=status)
+
+    def recordDecode(self, pattern : str, seconds : float):
+        """Record the time taken to decode a response body"""
+        with self._lock:
+            self._stats(pattern)["decode_seconds"] += seconds
+        self._notify(pattern, "decode", seconds=seconds)
+
+    def recordParse(self, pattern : str, seconds : float):
+        """Record the time taken to parse a document"""
+        with self._lock:
+            s = self._stats(pattern)
+            s["parses"] += 1
+            s["parse_seconds"] += seconds
+        self._notify(pattern, "parse", seconds=seconds)
+
+    def recordCache(self, pattern : str, cache : str, hit : bool):
+        """Record a cache lookup
+
+        Parameters
+        ----------
+        pattern : str
+            The URL pattern
+        cache : str {"memory", "disk"}
+            The cache looked in
+        hit : bool
+            Was the lookup answered by the cache
+        """
+        with self._lock:
+            self._stats(pattern)[f"{cache}_{'hits' if hit else 'misses'}"] += 1
+        self._notify(pattern, "cache", cache=cache, hit=hit)
+
+    def summary(self) -> List[dict]:
+        """Get the totals of each URL pattern
+
+        Returns
+        -------
+        list of dict
+            A dict per URL pattern, in the order first seen, with the
+            counts of requests, errors, parses and cache hits and
+            misses, the total bytes of the bodies received, before
+            any decompression, the total and maximum
+            fetch seconds, the mean fetch seconds, the total decode
+            and parse seconds, and the count of each response status
+        """
+        with self._lock:
+            rslt = []
+            for pattern, s in self._patterns.items():
+                d = dict(s, pattern=pattern, status=dict(s["status"]))
+                d["fetch_mean_seconds"] = s["fetch_seconds"] / s["requests"] if s["requests"] > 0 else None
+                rslt.append(d)
+        return rslt
+
+    def clear(self):
+        """Discard everything recorded so far"""
+        with self._lock:
+            self._patterns = {}
+
+    def _stats(self, pattern : str) -> dict:
+        s = self._patterns.get(pattern)
+        if s is None:
+            s = {
+                "requests": 0, "errors": 0, "bytes": 0,
+                "fetch_seconds": 0.0, "fetch_max_seconds": 0.0, "decode_seconds": 0.0,
+                "parses": 0, "parse_seconds": 0.0,
+                "memory_hits": 0, "memory_misses": 0, "disk_hits": 0, "disk_misses": 0,
+                "status": {}
+            }
+            self._patterns[pattern] = s
+        return s
+
+    def _notify(self, pattern : str, event : str, **values):
+        if len(self._listeners) > 0:
+            values.update(pattern=pattern, event=event)
+            for listener in list(self._listeners):
+                listener(dict(values))
@@ -0,0 +1,226 @@
+import asyncio
+import collections
+import logging
+import pandas
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterable, AsyncIterator
+from nflapi.API import API
+from nflapi.AsyncTransport import AsyncTransport, AsyncResponse, ThreadedTransport
+from nflapi.CachedAPI import ListOrDataFrame
+from nflapi.Client import Client
+from nflapi.Endpoints import Endpoints
+from nflapi.ColumnTable import ColumnTable
+from nflapi.GameTables import GameTables
+from nflapi.Roster import Roster
+
+class _LoopBridge(object):
+    """Stands in for the urllib3 PoolManager of an API object
+
+    Requests made by the API object, which runs in an executor
+    thread, are sent by the AsyncClient on its event loop and
+    the calling thread waits for the response.
+    """
+
+    def __init__(self, client : "AsyncClient", loop : asyncio.AbstractEventLoop):
+        self._client = client
+        self._loop = loop
+
+    def request(self, method : str, url : str, fields : dict = None, headers : dict = None) -> AsyncResponse:
+        coro = self._client._request(method, url, fields, headers)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+class AsyncClient(object):
+    """Provides access to nfl.com data from asyncio code
+
+    This mirrors the methods of `Client` as coroutines. Requests
+    are sent by a pluggable `AsyncTransport` with at most
+    `max_concurrency` in flight at once, and the requests for the
+    inputs of a method, e.g. all games of a week, are gathered
+    concurrently. Documents are parsed by the same handlers and
+    parsers as `Client` uses, in executor threads so that the
+    event loop is not blocked.
+    """
+
+    def __init__(self, transport : AsyncTransport = None, max_concurrency : int = 10, base_url : str = None):
+        """Constructor for the AsyncClient class
+
+        Parameters
+        ----------
+        transport : AsyncTransport
+            The transport used to send requests. If None then a
+            ThreadedTransport is used. [default: None]
+        max_concurrency : int
+            The maximum number of requests to have in flight at once [default: 10]
+        base_url : str
+            Where to request documents from, e.g. a caching proxy, in
+            place of nfl.com. See `Endpoints`. [default: None]
+        """
+        assert max_concurrency >= 1, f"max_concurrency {max_concurrency} is not valid"
+        if transport is None:
+            transport = ThreadedTransport()
+        self._transport = transport
+        self._max_concurrency = max_concurrency
+        self._semaphore : asyncio.Semaphore = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        endpoints = None
+        if base_url is not None:
+            endpoints = Endpoints(base_url)
+        self._client = Client(endpoints=endpoints)
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Release the executor and transport resources"""
+        self._executor.shutdown(wait=False)
+        await self._transport.close()
+
+    async def getSchedule(self, season : int = None, season_type : str = None,
+                          week : int = None, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve games played or to be played
+
+        See `Client.getSchedule`. When a whole season, or season
+        type, is requested the weeks are retrieved concurrently.
+        """
+        client = self._client
+        if season is not None and week is None:
+            weeks = client._scheduleWeeks(season, season_type)
+        else:
+            if season is None and season_type is None and week is None:
+                season, season_type, week = client._currentScheduleWeek
+            weeks = [(season, season_type, week)]
+        rslt = await self._gather(client._schedule, lambda sch, w: sch.getSchedule(*w, list), weeks)
+        return client._castReturnType(rslt, return_type)
+
+    async def getGameSummary(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve game summaries; see `Client.getGameSummary`"""
+        gsums = await self._gather(self._client._gmsummary, lambda gs, sched: gs.getGameSummary(sched, list), schedules)
+        return self._client._castReturnType(gsums, return_type)
+
+    async def getGameScore(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve game scoring information; see `Client.getGameScore`"""
+        gscores = await self._gather(self._client._gmscore, lambda gs, sched: gs.getGameScore(sched, list), schedules)
+        return self._client._castReturnType(gscores, return_type)
+
+    async def getGamePlay(self, schedules : List[dict], return_type : ListOrDataFrame = list,
+                          columnar : bool = False) -> ListOrDataFrame:
+        """Retrieve play data for games; see `Client.getGamePlay`"""
+        if columnar and return_type == pandas.DataFrame:
+            gplays = ColumnTable()
+            async for table in self._gatherIter(self._client._gmplay, lambda gp, sched: gp.getGamePlayColumns(sched), schedules):
+                gplays.extend(table)
+            return gplays.toDataFrame(clear=True)
+        gplays = await self._gather(self._client._gmplay, lambda gp, sched: gp.getGamePlay(sched, list), schedules)
+        return self._client._castReturnType(gplays, return_type)
+
+    async def getGameDrive(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve drive data for games; see `Client.getGameDrive`"""
+        gdrives = await self._gather(self._client._gmdrive, lambda gd, sched: gd.getGameDrive(sched, list), schedules)
+        return self._client._castReturnType(gdrives, return_type)
+
+    async def getGameTables(self, schedules : List[dict], tables : List[str] = None,
+                            return_type : ListOrDataFrame = list) -> Dict[str, ListOrDataFrame]:
+        """Retrieve several tables of game data at once; see `Client.getGameTables`"""
+        client = self._client
+        if tables is None:
+            tables = GameTables.TABLES
+        gts = await self._gatherMap(client._gmtables, lambda gt, sched: gt.getGameTables(sched, tables, list), schedules)
+        gtables : Dict[str, List[dict]] = dict((t, []) for t in tables)
+        for gt in gts:
+            for t, data in gt.items():
+                gtables[t].extend(data)
+        return dict((t, client._castReturnType(data, return_type)) for t, data in gtables.items())
+
+    async def getTeams(self, active_only : bool = True, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Get the current teams; see `Client.getTeams`"""
+        return self._client.getTeams(active_only, return_type)
+
+    async def getRoster(self, teams : List[str], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve team rosters; see `Client.getRoster`"""
+        def getTeamRoster(roster : Roster, team : str) -> List[dict]:
+            logging.info("Retrieving roster for team {}...".format(team))
+            return roster.getRoster(team, list)
+        rosters = await self._gather(self._client._roster, getTeamRoster, teams)
+        return self._client._castReturnType(rosters, return_type)
+
+    async def getPlayerProfile(self, rosters : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve player profile information; see `Client.getPlayerProfile`"""
+        profs = await self._gather(self._client._plprof, lambda pp, rost: pp.getProfile(rost, list), rosters)
+        return self._client._castReturnType(profs, return_type)
+
+    async def getPlayerGameLog(self, rosters : List[dict], season : int = None,
+                               return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve player game logs; see `Client.getPlayerGameLog`"""
+        if season is None:
+            season = self._client._currentSeason
+        gmlogs = await self._gather(self._client._plgmlog, lambda pgl, rost: pgl.getGameLogs(rost, season, list), rosters)
+        return self._client._castReturnType(gmlogs, return_type)
+
+    async def _request(self, method : str, url : str, fields : dict = None, headers : dict = None) -> AsyncResponse:
+        if self._semaphore is None:
+            # The semaphore is created here so that it belongs
+            # to the event loop that is running the client.
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            return await self._transport.request(method, url, fields, headers)
+
+    async def _gatherMap(self, api : API, fun : callable, items : list) -> list:
+        """Call fun(api, item) concurrently for each item
+
+        Each call is given its own copy of `api` whose requests are
+        sent by the transport on the running event loop.
+
+        Returns
+        -------
+        list
+            The return values of the calls in the order of `items`
+        """
+        loop = asyncio.get_running_loop()
+        bridge = _LoopBridge(self, loop)
+        def call(item):
+            worker = api._copy()
+            worker._http = bridge
+            return fun(worker, item)
+        return await asyncio.gather(*[loop.run_in_executor(self._executor, call, item) for item in items])
+
+    async def _gatherIter(self, api : API, fun : callable, items : Iterable) -> AsyncIterator:
+        """Call fun(api, item) for each item and generate the return values
+
+        As with `Client._fanIter` each call is given its own copy of
+        `api` with its own cache, and up to max_concurrency calls are
+        in progress at once while the caller consumes earlier results.
+
+        Returns
+        -------
+        async iterator
+            The return values of the calls in the order of `items`
+        """
+        loop = asyncio.get_running_loop()
+        bridge = _LoopBridge(self, loop)
+        def call(item):
+            worker = api._copy()
+            worker._http = bridge
+            worker._detachCache()
+            return fun(worker, item)
+        pending = collections.deque()
+        try:
+            for item in items:
+                pending.append(loop.run_in_executor(self._executor, call, item))
+                if len(pending) >= self._max_concurrency:
+                    yield await pending.popleft()
+            while len(pending) > 0:
+                yield await pending.popleft()
+        finally:
+            # The caller may stop consuming early
+            for future in pending:
+                future.cancel()
+
+    async def _gather(self, api : API, fun : callable, items : list) -> List[dict]:
+        """Call fun(api, item) concurrently for each item and concatenate the returned lists"""
+        data : List[dict] = []
+        for rslt in await self._gatherMap(api, fun, items):
+            data.extend(rslt)
+        return data
@@ -0,0 +1,113 @@
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from urllib3 import PoolManager
+from nflapi.API import API
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+class AsyncResponse(object):
+    """The response to a request made by an AsyncTransport
+
+    This provides the subset of the urllib3 HTTPResponse interface
+    used by `API._queryAPI`.
+    """
+
+    def __init__(self, status : int, headers : dict, data : bytes):
+        self.status = status
+        self.headers = headers
+        self.data = data
+
+class AsyncTransport(ABC):
+    """Base class for transports used by the AsyncClient"""
+
+    @abstractmethod
+    async def request(self, method : str, url : str, fields : dict = None, headers : dict = None) -> AsyncResponse:
+        """Implement this in your subclass
+
+        Send a request and return the response.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method, e.g. GET
+        url : str
+            The URL to send the request to
+        fields : dict
+            The query parameters for the request, or None
+        headers : dict
+            Headers to send with the request, or None
+
+        Returns
+        -------
+        AsyncResponse
+            Or any object with status, headers and data attributes
+        """
+        pass
+
+    async def close(self):
+        """Release any resources held by the transport"""
+        pass
+
+class ThreadedTransport(AsyncTransport):
+    """Transport that runs the blocking urllib3 request in an executor
+
+    This needs no dependencies beyond those of the package. The
+    event loop is not blocked while the request is in progress.
+    """
+
+    def __init__(self, http : PoolManager = None):
+        """Constructor for the ThreadedTransport class
+
+        Parameters
+        ----------
+        http : PoolManager
+            The pool to send requests with. If None then the
+            pool shared by the API classes is used.
+        """
+        if http is None:
+            http = API.__http__
+        self._http = http
+
+    async def request(self, method : str, url : str, fields : dict = None, headers : dict = None) -> AsyncResponse:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self._http.request, method, url,
+                                                                  fields=fields, headers=headers))
+
+class AiohttpTransport(AsyncTransport):
+    """Transport that sends requests with aiohttp
+
+    This requires the aiohttp package to be installed.
+    """
+
+    def __init__(self, session : "aiohttp.ClientSession" = None):
+        """Constructor for the AiohttpTransport class
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The session to send requests with. If None then a
+            session is created on first use and closed by `close`.
+        """
+        if aiohttp is None:
+            raise ImportError("AiohttpTransport requires the aiohttp package")
+        self._session = session
+        self._owns_session = session is None
+
+    async def request(self, method : str, url : str, fields : dict = None, headers : dict = None) -> AsyncResponse:
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        params = None
+        if fields is not None:
+            params = dict((k, str(v)) for k, v in fields.items())
+        async with self._session.request(method, url, params=params, headers=headers) as rslt:
+            data = await rslt.read()
+            return AsyncResponse(rslt.status, rslt.headers, data)
+
+    async def close(self):
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
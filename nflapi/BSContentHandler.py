@@ -0,0 +1,63 @@
+from bs4 import BeautifulSoup
+from nflapi.AbstractContentHandler import AbstractContentHandler
+from nflapi.BSTagFilter import BSTagFilter
+
+def _defaultParser() -> str:
+    # lxml builds trees considerably faster than the pure python
+    # html.parser, but it is an optional dependency.
+    try:
+        import lxml
+        parser = "lxml"
+    except ImportError:
+        parser = "html.parser"
+    return parser
+
+class BSContentHandler(AbstractContentHandler):
+    """Base ContentHandler for html pages parsed with BeautifulSoup"""
+
+    # The BeautifulSoup tree builder used when none is given
+    # to the constructor; lxml when installed, else html.parser
+    DEFAULT_PARSER : str = _defaultParser()
+
+    # Should pages be restricted at parse time to the tags that
+    # may match the BSTagFilter given to _makeSoup
+    STRAIN_PAGES : bool = True
+
+    def __init__(self, parser : str = None):
+        """Constructor for the BSContentHandler class
+
+        Parameters
+        ----------
+        parser : str {"lxml", "html.parser", "html5lib"}
+            The BeautifulSoup tree builder to parse pages with.
+            If None then `BSContentHandler.DEFAULT_PARSER` is used.
+        """
+        self.parser = parser
+
+    @property
+    def parser(self) -> str:
+        parser = self._parser
+        if parser is None:
+            parser = BSContentHandler.DEFAULT_PARSER
+        return parser
+
+    @parser.setter
+    def parser(self, parser : str):
+        self._parser = parser
+
+    def _makeSoup(self, docstr : str, tag_filter : BSTagFilter = None) -> BeautifulSoup:
+        """Parse a page into a BeautifulSoup tree
+
+        Parameters
+        ----------
+        docstr : str
+            The html document as a string
+        tag_filter : BSTagFilter
+            If given, and `BSContentHandler.STRAIN_PAGES` is True, only
+            the parts of the page accepted by its strainer are built
+            into the tree. [default: None]
+        """
+        strainer = None
+        if tag_filter is not None and BSContentHandler.STRAIN_PAGES:
+            strainer = tag_filter.strainer
+        return BeautifulSoup(docstr, self.parser, parse_only=strainer)
@@ -1,4 +1,4 @@
-from bs4 import Tag
+from bs4 import Tag, SoupStrainer
 from abc import ABC, abstractmethod
 
 class BSTagFilter(ABC):
@@ -15,3 +15,20 @@ class BSTagFilter(ABC):
             The subject tag from BeautifulSoup
         """
         pass
+
+    @property
+    def strainer(self) -> SoupStrainer:
+        """Override this in your subclass
+
+        A SoupStrainer that restricts parsing to the tags that
+        may match this filter, so that the rest of the page is
+        never built into the tree. It must accept every tag that
+        `match` accepts, or a tag that contains it; `match` is
+        still applied to the restricted tree.
+
+        Returns
+        -------
+        SoupStrainer
+            The restriction, or None to parse the whole page
+        """
+        return None
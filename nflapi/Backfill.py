@@ -0,0 +1,320 @@
+import os
+import json
+import pickle
+import logging
+import datetime
+import tempfile
+import threading
+import time
+import pandas
+from typing import List, Dict, Iterable
+from nflapi.API import API
+from nflapi.CachedAPI import ListOrDataFrame
+from nflapi.Client import Client
+from nflapi.DiskCache import DiskCache
+from nflapi.GameTables import GameTables
+from nflapi.TableSchema import SCHEMAS
+
+class Backfill(object):
+    """Retrieve the data of many seasons into a local store
+
+    The work is divided into units, e.g. the schedule of a season,
+    the tables of a game or the game logs of a player for a season,
+    whose rows are written to their own file in the store directory
+    as soon as they have been retrieved. Each finished unit is
+    recorded in a manifest, which is appended to as units finish, so
+    that when a run is interrupted, or some units fail, running it
+    again only retrieves the units that are not yet complete. The
+    tables written by a game unit are recorded with it, so that a game
+    is retrieved again when a run asks for tables it has not written.
+
+    Units are retrieved by up to the `Client`'s max_workers threads.
+    The rows of a unit are not retained in memory once written.
+
+    Rosters, and therefore the players whose profiles and game logs
+    are retrieved, are those of the current season, as nfl.com does
+    not provide rosters of past seasons.
+
+    The rosters, and the schedule and game logs of the current season,
+    change as the season goes on, so these units are only complete for
+    the number of seconds given in `SNAPSHOT_TTLS`. A later run then
+    retrieves them again, e.g. picking up games that have finished.
+    """
+
+    # The tables of each kind of unit
+    GAME_TABLES = GameTables.TABLES
+    PLAYER_TABLES = ["profile", "gamelogs"]
+
+    # The seconds for which units whose data still changes are complete,
+    # by kind of unit. None means they never expire.
+    SNAPSHOT_TTLS = dict((k, DiskCache.TTLS[k]) for k in ["schedule", "roster", "gamelogs"])
+
+    def __init__(self, directory : str, client : Client = None, snapshot_ttls : dict = None):
+        """Constructor for the Backfill class
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the store. It is created if it does not exist.
+        client : Client
+            The client used to retrieve data. If None then a Client
+            with max_workers 4 is used. [default: None]
+        snapshot_ttls : dict
+            TTLs, in seconds, by kind of unit that override those in
+            `Backfill.SNAPSHOT_TTLS` [default: None]
+        """
+        self._dir = directory
+        os.makedirs(directory, exist_ok=True)
+        if client is None:
+            client = Client(max_workers=4)
+        self._client = client
+        self._snapshot_ttls = dict(Backfill.SNAPSHOT_TTLS)
+        if snapshot_ttls is not None:
+            self._snapshot_ttls.update(snapshot_ttls)
+        self._lock = threading.Lock()
+        self._completed : Dict[str, dict] = {}
+        self._failed : Dict[str, str] = {}
+        self._readManifest()
+
+    @property
+    def directory(self) -> str:
+        return self._dir
+
+    @property
+    def client(self) -> Client:
+        return self._client
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self._dir, "manifest.jsonl")
+
+    @property
+    def completed(self) -> List[str]:
+        """The ids of the units that are complete"""
+        with self._lock:
+            return [u for u in self._completed if self._isComplete(u)]
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        """The error of each unit whose last attempt failed, by unit id"""
+        with self._lock:
+            return dict(self._failed)
+
+    def run(self, seasons : Iterable[int], tables : List[str] = None) -> dict:
+        """Retrieve the units of the given seasons and tables that are not complete
+
+        Parameters
+        ----------
+        seasons : iterable of int
+            The four digit years at the beginning of the NFL seasons, e.g.
+            range(2009, 2019)
+        tables : list of str {"schedule", "summary", "score", "drive", "play", "roster", "profile", "gamelogs"}
+            The tables to retrieve. The schedule is always retrieved when
+            game tables are requested, and the rosters when player tables
+            are. If None then all tables are retrieved. [default: None]
+
+        Returns
+        -------
+        dict
+            The number of units that were "completed", "skipped" as
+            they were already complete, and that "failed" in this run
+        """
+        if tables is None:
+            tables = list(SCHEMAS)
+        for t in tables:
+            assert t in SCHEMAS, f"table {t} not valid"
+        counts = {"completed": 0, "skipped": 0, "failed": 0}
+        game_tables = [t for t in Backfill.GAME_TABLES if t in tables]
+        player_tables = [t for t in Backfill.PLAYER_TABLES if t in tables]
+        seasons = list(seasons)
+        if "schedule" in tables or len(game_tables) > 0:
+            units = [f"schedule/{season}" for season in seasons]
+            self._runUnits(self._client._schedule, self._fetchSchedule, units, counts)
+            if len(game_tables) > 0:
+                games = [g for season in seasons for g in self.read("schedule", season=season) if g.get("finished")]
+                units = [(f"game/{g['gsis_id']}", g, game_tables) for g in games]
+                self._runUnits(self._client._gmtables, self._fetchGame, units, counts, game_tables)
+        if "roster" in tables or len(player_tables) > 0:
+            units = [f"roster/{t['team']}" for t in self._client.getTeams()]
+            self._runUnits(self._client._roster, self._fetchRoster, units, counts)
+            if len(player_tables) > 0:
+                players = dict((r["profile_id"], r) for r in self.read("roster"))
+                if "profile" in player_tables:
+                    units = [(f"profile/{pid}", r) for pid, r in players.items()]
+                    self._runUnits(self._client._plprof, self._fetchProfile, units, counts)
+                if "gamelogs" in player_tables:
+                    units = [(f"gamelogs/{season}/{pid}", r, season) for season in seasons
+                             for pid, r in players.items()]
+                    self._runUnits(self._client._plgmlog, self._fetchGameLogs, units, counts)
+        return counts
+
+    def read(self, table : str, return_type : ListOrDataFrame = list, season : int = None) -> ListOrDataFrame:
+        """Read the rows of a table from the store
+
+        Parameters
+        ----------
+        table : str
+            The table to read; see `run`
+        return_type : list or pandas.DataFrame
+            This defines the return type you would like. If the value is list
+            then a list of dicts will be returned, if the value is pandas.DataFrame
+            then a pandas.DataFrame will be returned. The default is list.
+        season : int
+            If given then only rows of units of this season are read. This
+            applies to the schedule and gamelogs tables. [default: None]
+
+        Returns
+        -------
+        list or pandas.DataFrame
+            Which type is returned is determined by the `return_type` parameter
+        """
+        assert table in SCHEMAS, f"table {table} not valid"
+        tdir = os.path.join(self._dir, table)
+        if season is not None:
+            tdir = os.path.join(tdir, str(season))
+        # A unit's rows are in {unit}.pkl, e.g. schedule/2018.pkl
+        # or gamelogs/2018/2560800.pkl
+        paths = [tdir + ".pkl"] if os.path.isfile(tdir + ".pkl") else []
+        for pdir, _, files in sorted(os.walk(tdir)):
+            paths.extend(os.path.join(pdir, f) for f in sorted(files) if f.endswith(".pkl"))
+        rows : List[dict] = []
+        for path in paths:
+            with open(path, "rb") as fp:
+                rows.extend(pickle.load(fp))
+        if return_type == pandas.DataFrame:
+            rows = pandas.DataFrame(rows)
+        return rows
+
+    def _runUnits(self, api : API, fun : callable, units : list, counts : dict, tables : List[str] = None):
+        """Retrieve the units that are not complete
+
+        Parameters
+        ----------
+        api : API
+            The API object of the client that retrieves the units
+        fun : callable
+            Called as fun(api, unit) to retrieve and store a unit,
+            returning the number of rows stored
+        units : list
+            Unit ids, or tuples whose first value is the unit id
+        counts : dict
+            The counts returned by `run`, which are updated
+        tables : list of str
+            The tables each unit writes, if it writes more than one. A
+            unit is only complete once it has written all of them. [default: None]
+        """
+        uid = lambda unit: unit[0] if isinstance(unit, tuple) else unit
+        with self._lock:
+            todo = [u for u in units if not self._isComplete(uid(u), tables)]
+        counts["skipped"] += len(units) - len(todo)
+        def call(worker : API, unit) -> tuple:
+            try:
+                return (unit, fun(worker, unit), None)
+            except Exception as e:
+                return (unit, None, e)
+        for unit, nrows, error in self._client._fanIter(api, call, todo):
+            if error is None:
+                entry = {"status": "completed", "rows": nrows}
+                ttl = self._unitTTL(uid(unit))
+                if ttl is not None:
+                    entry["expires"] = time.time() + ttl
+                if tables is not None:
+                    # The tables written by earlier runs are still stored
+                    with self._lock:
+                        done = self._completed.get(uid(unit), {}).get("tables", [])
+                    entry["tables"] = sorted(set(done) | set(tables))
+                self._record(uid(unit), entry)
+                counts["completed"] += 1
+            else:
+                logging.warning("Backfill unit {} failed: {}".format(uid(unit), error))
+                self._record(uid(unit), {"status": "failed", "error": repr(error)})
+                counts["failed"] += 1
+
+    def _isComplete(self, unitid : str, tables : List[str] = None) -> bool:
+        """Has a unit been completed, with all of the given tables; call with the lock held"""
+        entry = self._completed.get(unitid)
+        if entry is None:
+            return False
+        if entry.get("expires") is not None and entry["expires"] <= time.time():
+            return False
+        return tables is None or set(tables) <= set(entry.get("tables", []))
+
+    def _unitTTL(self, unitid : str) -> float:
+        """The seconds for which a unit is complete, or None if it does not change once complete"""
+        kind, *parts = unitid.split("/")
+        ttl = None
+        if kind == "roster" or (kind in ["schedule", "gamelogs"] and int(parts[0]) == self._client._currentSeason):
+            ttl = self._snapshot_ttls.get(kind)
+        return ttl
+
+    def _fetchSchedule(self, schedule : API, unit : str) -> int:
+        # The weeks of a season are retrieved one after another by the
+        # worker, so that its detached cache is used rather than that
+        # of the client, and the seasons by up to max_workers threads.
+        rows : List[dict] = []
+        for week in self._client._scheduleWeeks(int(unit.split("/")[1])):
+            rows.extend(schedule.getSchedule(*week, list))
+        return self._write(unit, rows)
+
+    def _fetchGame(self, gmtables : GameTables, unit : tuple) -> int:
+        unitid, schedule_game, tables = unit
+        nrows = 0
+        for t, data in gmtables.getGameTables(schedule_game, tables, list).items():
+            nrows += self._write(f"{t}/{schedule_game['gsis_id']}", data)
+        return nrows
+
+    def _fetchRoster(self, roster : API, unit : str) -> int:
+        return self._write(unit, roster.getRoster(unit.split("/")[1], list))
+
+    def _fetchProfile(self, plprof : API, unit : tuple) -> int:
+        unitid, rost = unit
+        return self._write(unitid, plprof.getProfile(rost, list))
+
+    def _fetchGameLogs(self, plgmlog : API, unit : tuple) -> int:
+        unitid, rost, season = unit
+        return self._write(unitid, plgmlog.getGameLogs(rost, season, list))
+
+    def _write(self, name : str, rows : List[dict]) -> int:
+        """Store the rows of a unit in the file {directory}/{name}.pkl"""
+        path = os.path.join(self._dir, *name.split("/")) + ".pkl"
+        pdir = os.path.dirname(path)
+        os.makedirs(pdir, exist_ok=True)
+        fd, tmppath = tempfile.mkstemp(dir=pdir, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(rows, fp)
+            # The unit is recorded as complete after this so a file
+            # is never left partially written under its own name.
+            os.replace(tmppath, path)
+        except BaseException:
+            if os.path.exists(tmppath):
+                os.remove(tmppath)
+            raise
+        return len(rows)
+
+    def _record(self, unitid : str, entry : dict):
+        """Append the outcome of a unit to the manifest"""
+        entry = dict(entry, unit=unitid, at=datetime.datetime.now().isoformat())
+        with self._lock:
+            with open(self.manifest_path, "at") as fp:
+                fp.write(json.dumps(entry) + "\n")
+            self._apply(entry)
+
+    def _readManifest(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "rt") as fp:
+                for line in fp:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line of an interrupted run may be partial
+                        continue
+                    self._apply(entry)
+
+    def _apply(self, entry : dict):
+        unitid = entry["unit"]
+        if entry["status"] == "completed":
+            self._completed[unitid] = entry
+            self._failed.pop(unitid, None)
+        else:
+            self._failed[unitid] = entry.get("error")
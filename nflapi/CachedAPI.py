@@ -1,13 +1,28 @@
 import os
+import copy
 from urllib3 import PoolManager
 import pandas
-from typing import TypeVar, List
+import threading
+import time
+from typing import TypeVar, List, Dict
 from nflapi.API import API
 from nflapi.AbstractContentHandler import AbstractContentHandler
+from nflapi.ParsePool import ParsePool
 
 ListOrDataFrame = TypeVar("ListOrDataFrame", list, pandas.DataFrame)
 
 class CachedRowFilter(object):
+    @property
+    def key(self) -> tuple:
+        """The cache index key of the rows this filter matches
+
+        Subclasses should override this to return a hashable value
+        identifying the query, e.g. (season, season_type, week).
+        When the value is None the cache falls back to calling
+        `test` on every cached row.
+        """
+        return None
+
     def test(self, row : dict) -> bool:
         raise NotImplementedError("abstract base class CachedRowFilter method test has not been implemented")
 
@@ -15,10 +30,19 @@ class CachedAPI(API):
     """
     Base class for classes that retrieve data from the NFL APIs where caching is desired
     """
+    # Set this to True in your subclass if _parseDocument only calls
+    # the handler's parse method, and _restoreParsed does whatever
+    # else it does, so that documents may be parsed in a ParsePool.
+    _parseInPool : bool = False
 
     def __init__(self, srcurl : str, handler : AbstractContentHandler):
         super(CachedAPI, self).__init__(srcurl, handler)
-        self._cache : List[dict] = None
+        # The cache is created up front, rather than on first use, so
+        # that copies made by `_copy` for worker threads share it.
+        self._cache : List[dict] = []
+        self._cacheIndex : Dict[tuple, List[dict]] = {}
+        self._cacheLock = threading.RLock()
+        self._parsePool : ParsePool = None
 
     @property
     def _cache(self) -> List[dict]:
@@ -28,6 +52,41 @@ class CachedAPI(API):
     def _cache(self, newcache : List[dict]) -> List[dict]:
         self._cache_v = newcache
 
+    @property
+    def _cacheIndex(self) -> Dict[tuple, List[dict]]:
+        return self._cache_index_v
+
+    @_cacheIndex.setter
+    def _cacheIndex(self, newindex : Dict[tuple, List[dict]]):
+        self._cache_index_v = newindex
+
+    @property
+    def _cacheLock(self) -> threading.RLock:
+        return self._cache_lock_v
+
+    @_cacheLock.setter
+    def _cacheLock(self, newlock : threading.RLock):
+        self._cache_lock_v = newlock
+
+    @property
+    def _parsePool(self) -> ParsePool:
+        return self._parse_pool_v
+
+    @_parsePool.setter
+    def _parsePool(self, pool : ParsePool):
+        self._parse_pool_v = pool
+
+    def _detachCache(self):
+        """Give this object its own empty cache
+
+        This is used on copies made by `_copy` whose results should
+        not be retained by the cache of the original, e.g. when
+        results are streamed to the caller.
+        """
+        self._cache = []
+        self._cacheIndex = {}
+        self._cacheLock = threading.RLock()
+
     def _fetch(self, query : dict, row_filter : CachedRowFilter, return_type : ListOrDataFrame) -> ListOrDataFrame:
         """The main method of this class
 
@@ -52,7 +111,10 @@ class CachedAPI(API):
         -------
         A list of dicts or pandas.DataFrame
         """
-        if self._isInCache(row_filter):
+        cached = self._isInCache(row_filter)
+        if self._stats is not None:
+            self._stats.recordCache(self._statsPattern, "memory", cached)
+        if cached:
             data = self._fromCache(row_filter, return_type)
         else:
             self._processQuery(query)
@@ -60,11 +122,86 @@ class CachedAPI(API):
             # process the document, and therefore that we can
             # retrieve the results from the handler properties.
             data = self._getResultList()
-            self._toCache(data)
+            self._toCache(data, row_filter)
             if return_type == pandas.DataFrame:
                 data = self._getResultDataFrame()
         return data
 
+    def _fetchRows(self, query : dict) -> List[dict]:
+        """Process a query and return its rows without caching them
+
+        This is used to retrieve the results of several queries
+        concurrently, on copies made by `_copy`, and then add them
+        all to the cache at once with `_toCacheMany`.
+        """
+        self._processQuery(query)
+        return self._getResultList()
+
+    def _processQuery(self, query_doc : dict = None):
+        """Query nfl.com and process the results
+
+        This extends `API._processQuery` so that when the document
+        returned by `_queryAPI` is one already stored in the disk
+        cache the rows parsed from it are restored, with
+        `_restoreParsed`, rather than parsing the document again.
+        """
+        docstr = self._queryAPI(query_doc)
+        cache = self._diskCache
+        rows = None
+        if self._diskCacheReused:
+            rows = cache.getRows(self._siteUrl, query_doc, self._rowsDigest)
+        if rows is not None:
+            self._restoreParsed(rows)
+        else:
+            start = time.perf_counter()
+            if self._parsePool is not None and self._parseInPool:
+                # Only the rows come back from the worker process, so the
+                # state they imply is restored just as from the disk cache
+                handler = copy.copy(self._handler)
+                # The rows of the last document need not be sent along
+                handler._data = []
+                self._restoreParsed(self._parsePool.parse(handler, docstr))
+            else:
+                self._parseDocument(docstr)
+            if self._stats is not None:
+                self._stats.recordParse(self._statsPattern, time.perf_counter() - start)
+            self._storeDocument()
+            digest = self._rowsDigest
+            if digest is not None:
+                cache.putRows(self._siteUrl, query_doc, digest, self._getResultList())
+
+    @property
+    def _rowsDigest(self) -> str:
+        """The DiskCache digest the rows parsed from the current document are stored under"""
+        digest = self._diskCacheDigest
+        if digest is not None and self._parseVariant is not None:
+            # Rows parsed with other options must not be restored
+            digest = f"{digest}/{self._parseVariant}"
+        return digest
+
+    @property
+    def _parseVariant(self) -> str:
+        """Identifies options that change the rows parsed from a document
+
+        Override this in your subclass if it has such options. Rows
+        stored in the disk cache are only restored by objects with
+        the same variant. None is the variant of the default options.
+        """
+        return None
+
+    def _restoreParsed(self, rows : List[dict]):
+        """Restore the state left by `_parseDocument`
+
+        Override this in your subclass if `_parseDocument` does more
+        than store the rows in the handler.
+
+        Parameters
+        ----------
+        rows : list of dict
+            The rows returned by `_getResultList` after the document was parsed
+        """
+        self._handler._data = rows
+
     def _getResultDataFrame(self) -> pandas.DataFrame:
         return self._handler.dataframe
 
@@ -75,8 +212,14 @@ class CachedAPI(API):
         # Use the provided row filter to determine if there
         # are rows in the cache meeting the query criteria
         cached = False
-        if self._cache is not None:
-            cached = any(self._getCacheRowVec(row_filter))
+        key = row_filter.key
+        with self._cacheLock:
+            if key is not None:
+                # The filter identifies its rows by key so we can
+                # answer from the index without visiting any rows
+                cached = len(self._cacheIndex.get(key, [])) > 0
+            else:
+                cached = any(self._getCacheRowVec(row_filter))
         return cached
 
     def _getCacheRowVec(self, row_filter : CachedRowFilter) -> list:
@@ -86,16 +229,46 @@ class CachedAPI(API):
         # same length as the cache
         return [row_filter.test(row) for row in self._cache]
 
-    def _toCache(self, data : List[dict]):
-        if self._cache is None:
-            self._cache = data
-        else:
+    def _toCache(self, data : List[dict], row_filter : CachedRowFilter = None):
+        key = None
+        if row_filter is not None:
+            key = row_filter.key
+        # The cache may be shared with copies of this object
+        # running in other threads so it is updated under lock.
+        with self._cacheLock:
+            if key is not None and len(self._cacheIndex.get(key, [])) > 0:
+                # Another thread already fetched the same rows
+                return
             self._cache.extend(data)
+            if key is not None:
+                # Index the rows by the key of the query that produced
+                # them so that later lookups are a dict access
+                self._cacheIndex.setdefault(key, []).extend(data)
+
+    def _toCacheMany(self, results : List[tuple]):
+        """Add the rows of several queries to the cache in one update
+
+        The lock is held for the whole update so that other threads
+        see the rows of either all or none of the queries.
+
+        Parameters
+        ----------
+        results : list of tuple
+            (rows, row_filter) tuples as would be passed to `_toCache`
+        """
+        with self._cacheLock:
+            for data, row_filter in results:
+                self._toCache(data, row_filter)
 
     def _fromCache(self, row_filter : CachedRowFilter, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
-        x = self._getCacheRowVec(row_filter)
-        # Extract each row from the cache where the x value is True
-        data = [self._cache[i] for i in range(0, len(self._cache)) if x[i]]
+        key = row_filter.key
+        with self._cacheLock:
+            if key is not None:
+                data = list(self._cacheIndex.get(key, []))
+            else:
+                x = self._getCacheRowVec(row_filter)
+                # Extract each row from the cache where the x value is True
+                data = [self._cache[i] for i in range(0, len(self._cache)) if x[i]]
         if issubclass(return_type, pandas.DataFrame):
             data = pandas.DataFrame(data)
         return data
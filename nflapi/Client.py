@@ -1,21 +1,34 @@
-from typing import List
+from typing import List, Dict, Iterable, Iterator, Union
+import collections
 import datetime
+import time
 from dateutil import relativedelta
 import pandas
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from nflapi.API import API
+from nflapi.APIStats import APIStats
+from nflapi.DiskCache import DiskCache
+from nflapi.Endpoints import Endpoints
+from nflapi.ParsePool import ParsePool
 from nflapi.CachedAPI import ListOrDataFrame
+from nflapi.ColumnTable import ColumnTable
 from nflapi.Team import Team
 from nflapi.Schedule import Schedule
 from nflapi.GameSummary import GameSummary
 from nflapi.GameScore import GameScore
 from nflapi.GamePlay import GamePlay
 from nflapi.GameDrive import GameDrive
+from nflapi.GameTables import GameTables
 from nflapi.Team import Team
 from nflapi.Roster import Roster
 from nflapi.PlayerProfile import PlayerProfile
 from nflapi.PlayerGameLogs import PlayerGameLogs
+from nflapi.TableSchema import SCHEMAS
 import nflapi.Utilities as util
 
+RowOrDataFrame = Union[dict, pandas.DataFrame]
+
 class Client:
     """Provides access to nfl.com data
     
@@ -23,16 +36,81 @@ class Client:
     provides access to all data available for the package.
     """
 
-    def __init__(self):
-        self._schedule = Schedule()
+    def __init__(self, max_workers : int = 1, disk_cache : DiskCache = None, native_datetimes : bool = False,
+                 parse_processes : int = None, stats : APIStats = None, transport = None,
+                 endpoints : Endpoints = None):
+        """Constructor for the Client class
+
+        Parameters
+        ----------
+        max_workers : int
+            The maximum number of requests to have in flight at once
+            when a method retrieves data for more than one input. When
+            1 the inputs are processed one at a time. More than the
+            maxsize of the `HttpPool` sending the requests opens
+            connections that are not kept alive. [default: 1]
+        disk_cache : DiskCache
+            Where to persist responses so that they may be reused by
+            later processes. If None then `API.__disk_cache__` is
+            used, which by default is None, i.e. no persistence. [default: None]
+        native_datetimes : bool
+            If True then schedule start_time and date, and game log
+            game_date, values are timezone aware (US Eastern)
+            pandas.Timestamp values, which become datetime64 columns in
+            a pandas.DataFrame, rather than time.struct_time values. [default: False]
+        parse_processes : int
+            If given then roster, profile and game log pages are parsed by
+            a `ParsePool` of this many processes, so that pages retrieved
+            by max_workers threads are parsed on several cores. Call
+            `close` to stop the processes. [default: None]
+        stats : APIStats
+            Where to record the timings and sizes of requests. If None
+            then a new APIStats is used. See `getStats`. [default: None]
+        transport : object
+            Sends the requests in place of the urllib3 PoolManager shared
+            by the API classes, e.g. a `RecordingTransport` or a
+            `ReplayTransport`. It must provide the PoolManager request
+            method. If None then the shared PoolManager is used. [default: None]
+        endpoints : Endpoints
+            The base URL, e.g. of a caching proxy, to request documents
+            from, and any transport to send the requests with. The
+            transport parameter, if given, takes precedence. If None then
+            `API.__endpoints__` is used, which by default requests them
+            from nfl.com. [default: None]
+        """
+        self.max_workers = max_workers
+        self._schedule = Schedule(native_datetimes)
         self._gmsummary = GameSummary()
         self._gmscore = GameScore()
         self._gmplay = GamePlay()
         self._gmdrive = GameDrive()
+        self._gmtables = GameTables()
         self._roster = Roster()
         self._plprof = PlayerProfile()
-        self._plgmlog = PlayerGameLogs()
+        self._plgmlog = PlayerGameLogs(native_datetimes)
         self._curdt = datetime.date.today()
+        self._schedule_latencies : Dict[tuple, float] = {}
+        apis = [self._schedule, self._gmsummary, self._gmscore, self._gmplay, self._gmdrive,
+                self._gmtables, self._roster, self._plprof, self._plgmlog]
+        if disk_cache is not None:
+            for api in apis:
+                api._diskCache = disk_cache
+        if endpoints is not None:
+            for api in apis:
+                api._endpoints = endpoints
+        if transport is not None:
+            for api in apis:
+                api._http = transport
+        if stats is None:
+            stats = APIStats()
+        self._stats = stats
+        for api in apis:
+            api._stats = stats
+        self._parsePool : ParsePool = None
+        if parse_processes is not None:
+            self._parsePool = ParsePool(parse_processes)
+            for api in [self._roster, self._plprof, self._plgmlog]:
+                api._parsePool = self._parsePool
 
     def getSchedule(self, season : int = None, season_type : str = None,
                     week : int = None, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
@@ -64,31 +142,59 @@ class Client:
         """
         sched = self._schedule
         rslt : list = []
-        if season is not None and season_type is None and week is None:
-            for st in ["preseason", "regular_season", "postseason"]:
-                rslt.extend(self.getSchedule(season, st, return_type=list))
-        elif season is not None and season_type is not None and week is None:
-            if season_type == "preseason":
-                si = 0
-                ei = 5
-            elif season_type == "postseason":
-                si = 1
-                ei = 5
-            else:
-                si = 1
-                ei = 18
-            for wk in range(si, ei):
-                rslt.extend(self.getSchedule(season, season_type, wk, return_type=list))
+        if season is not None and week is None:
+            rslt = self.getSeasonSchedule([season], season_type, list)
         else:
             if season is None and season_type is None and week is None:
-                season = self._currentSeason
-                season_type = self._currentSeasonType
-                week = self._currentWeek
-                if week < 0:
-                    week = 5 + week
+                season, season_type, week = self._currentScheduleWeek
             rslt = sched.getSchedule(season, season_type, week, return_type)
         return self._castReturnType(rslt, return_type)
 
+    def getSeasonSchedule(self, seasons : List[int], season_type : str = None,
+                          return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Retrieve the games of every week of one or more seasons
+
+        The weeks that are not already cached are retrieved by up
+        to max_workers threads and added to the cache in a single
+        update once all of them have been retrieved. The time taken
+        to retrieve each week is then available from the
+        `schedule_latencies` property.
+
+        Parameters
+        ----------
+        seasons : list of int
+            The four digit years at the beginning of the NFL seasons
+        season_type : str {"preseason", "regular_season", "postseason"}
+            If given then only the weeks of this season type are retrieved,
+            otherwise the weeks of all season types are. [default: None]
+        return_type : list or pandas.DataFrame
+            This defines the return type you would like. If the value is list
+            then a list of dicts will be returned, if the value is pandas.DataFrame
+            then a pandas.DataFrame will be returned. The default is list.
+
+        Returns
+        -------
+        list or pandas.DataFrame
+            The games in the order of the weeks in which they are played.
+            Which type is returned is determined by the `return_type` parameter
+        """
+        sched = self._schedule
+        weeks = [w for s in seasons for w in self._scheduleWeeks(s, season_type)]
+        queries = [sched._weekQuery(*w) for w in weeks]
+        missing = [(w, q) for w, q in zip(weeks, queries) if not sched._isInCache(q[1])]
+        def fetchWeek(schedule : Schedule, item : tuple) -> tuple:
+            week, (query, row_filter) = item
+            start = time.perf_counter()
+            rows = schedule._fetchRows(query)
+            return (rows, row_filter, time.perf_counter() - start)
+        fetched = self._fanMap(sched, fetchWeek, missing)
+        sched._toCacheMany([(rows, row_filter) for rows, row_filter, _ in fetched])
+        self._schedule_latencies = dict((w, f[2]) for (w, _), f in zip(missing, fetched))
+        rslt : List[dict] = []
+        for _, row_filter in queries:
+            rslt.extend(sched._fromCache(row_filter, list))
+        return self._castReturnType(rslt, return_type)
+
     def getGameSummary(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
         """Retrieve game summaries
         
@@ -108,9 +214,7 @@ class Client:
         list or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
-        gsums : List[dict] = []
-        for sched in schedules:
-            gsums.extend(self._gmsummary.getGameSummary(sched, list))
+        gsums = self._fanOut(self._gmsummary, lambda gs, sched: gs.getGameSummary(sched, list), schedules)
         return self._castReturnType(gsums, return_type)
 
     def getGameScore(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
@@ -132,12 +236,11 @@ class Client:
         list or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
-        gscores : List[dict] = []
-        for sched in schedules:
-            gscores.extend(self._gmscore.getGameScore(sched, list))
+        gscores = self._fanOut(self._gmscore, lambda gs, sched: gs.getGameScore(sched, list), schedules)
         return self._castReturnType(gscores, return_type)
 
-    def getGamePlay(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+    def getGamePlay(self, schedules : List[dict], return_type : ListOrDataFrame = list,
+                    columnar : bool = False) -> ListOrDataFrame:
         """Retrieve play data for games
         
         This retrieves play data for each game in the provide schedules
@@ -150,17 +253,59 @@ class Client:
             This defines the return type you would like. If the value is list
             then a list of dicts will be returned, if the value is pandas.DataFrame
             then a pandas.DataFrame will be returned. The default is list.
+        columnar : bool
+            When return_type is pandas.DataFrame, should the plays be collected
+            by column rather than as a dict per row. This produces the same
+            pandas.DataFrame with much lower peak memory use, as each game is
+            merged into the table as it is retrieved and the plays are not
+            retained in the in-memory caches. [default: False]
 
         Returns
         -------
         list or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
-        gplays : List[dict] = []
-        for sched in schedules:
-            gplays.extend(self._gmplay.getGamePlay(sched, list))
+        if columnar and return_type == pandas.DataFrame:
+            gplays = ColumnTable()
+            for table in self._fanIter(self._gmplay, lambda gp, sched: gp.getGamePlayColumns(sched), schedules):
+                gplays.extend(table)
+            return gplays.toDataFrame(clear=True)
+        gplays = self._fanOut(self._gmplay, lambda gp, sched: gp.getGamePlay(sched, list), schedules)
         return self._castReturnType(gplays, return_type)
 
+    def iterGamePlay(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> Iterator[RowOrDataFrame]:
+        """Generate play data for games as each game is retrieved
+
+        Unlike `getGamePlay` this does not wait for every game before
+        returning, and plays are not retained in the in-memory caches,
+        so that a large number of games can be processed in bounded
+        memory. Games are retrieved by up to max_workers threads and
+        their data is generated in the order of `schedules`.
+
+        Parameters
+        ----------
+        schedules : iterable of dict
+            Schedules as returned by `getSchedule` with return_type set to list
+        return_type : list or pandas.DataFrame
+            If the value is list then a dict is generated for each play record,
+            if the value is pandas.DataFrame then a pandas.DataFrame is
+            generated for each game. The default is list.
+
+        Returns
+        -------
+        iterator of dict or pandas.DataFrame
+            Which type is generated is determined by the `return_type` parameter
+        """
+        if return_type == pandas.DataFrame:
+            fun = lambda gp, sched: gp.getGamePlayColumns(sched).toDataFrame(clear=True)
+        else:
+            fun = lambda gp, sched: gp.getGamePlay(sched, list)
+        for gplays in self._fanIter(self._gmplay, fun, schedules):
+            if return_type == pandas.DataFrame:
+                yield gplays
+            else:
+                yield from gplays
+
     def getGameDrive(self, schedules : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
         """Retrieve drive data for games
         
@@ -180,11 +325,43 @@ class Client:
         list or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
-        gdrives : List[dict] = []
-        for sched in schedules:
-            gdrives.extend(self._gmdrive.getGameDrive(sched, list))
+        gdrives = self._fanOut(self._gmdrive, lambda gd, sched: gd.getGameDrive(sched, list), schedules)
         return self._castReturnType(gdrives, return_type)
 
+    def getGameTables(self, schedules : List[dict], tables : List[str] = None,
+                      return_type : ListOrDataFrame = list) -> Dict[str, ListOrDataFrame]:
+        """Retrieve several tables of game data at once
+        
+        This retrieves the requested tables for each game in the provided
+        schedules. Each game's data is traversed once to produce all of
+        the tables, which is cheaper than calling `getGameSummary`,
+        `getGameScore`, `getGameDrive` and `getGamePlay` separately.
+
+        Parameters
+        ----------
+        schedules : list of dict
+            List of chedules as returned by `getSchedule` with return_type set to list
+        tables : list of str {"summary", "score", "drive", "play"}
+            The tables to retrieve. If None then all tables are retrieved.
+        return_type : list or pandas.DataFrame
+            This defines the return type you would like for each table. If the
+            value is list then a list of dicts will be returned, if the value is
+            pandas.DataFrame then a pandas.DataFrame will be returned. The default is list.
+
+        Returns
+        -------
+        dict of list or pandas.DataFrame
+            The keys are the table names and the values are the table data.
+            Which type is returned is determined by the `return_type` parameter
+        """
+        if tables is None:
+            tables = GameTables.TABLES
+        gtables : Dict[str, List[dict]] = dict((t, []) for t in tables)
+        for gt in self._fanMap(self._gmtables, lambda gt, sched: gt.getGameTables(sched, tables, list), schedules):
+            for t, data in gt.items():
+                gtables[t].extend(data)
+        return dict((t, self._castReturnType(data, return_type)) for t, data in gtables.items())
+
     def getTeams(self, active_only : bool = True, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
         """Get the current teams
         
@@ -233,10 +410,10 @@ class Client:
         list or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
-        rosters : List[dict] = []
-        for team in teams:
+        def getTeamRoster(roster : Roster, team : str) -> List[dict]:
             logging.info("Retrieving roster for team {}...".format(team))
-            rosters.extend(self._roster.getRoster(team, list))
+            return roster.getRoster(team, list)
+        rosters = self._fanOut(self._roster, getTeamRoster, teams)
         return self._castReturnType(rosters, return_type)
 
     def getPlayerProfile(self, rosters : List[dict], return_type : ListOrDataFrame = list) -> ListOrDataFrame:
@@ -258,9 +435,7 @@ class Client:
         list or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
-        profs : List[dict] = []
-        for rost in rosters:
-            profs.extend(self._plprof.getProfile(rost, list))
+        profs = self._fanOut(self._plprof, lambda pp, rost: pp.getProfile(rost, list), rosters)
         return self._castReturnType(profs, return_type)
 
     def getPlayerGameLog(self, rosters : List[dict], season : int = None, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
@@ -289,17 +464,226 @@ class Client:
         """
         if season is None:
             season = self._currentSeason
-        gmlogs : List[dict] = []
-        for rost in rosters:
-            gmlogs.extend(self._plgmlog.getGameLogs(rost, season, list))
+        gmlogs = self._fanOut(self._plgmlog, lambda pgl, rost: pgl.getGameLogs(rost, season, list), rosters)
         return self._castReturnType(gmlogs, return_type)
 
+    def iterPlayerGameLog(self, rosters : List[dict], season : int = None,
+                          return_type : ListOrDataFrame = list) -> Iterator[RowOrDataFrame]:
+        """Generate player game logs as each player's logs are retrieved
+
+        Unlike `getPlayerGameLog` this does not wait for every player
+        before returning, and game logs are not retained in the
+        in-memory caches, so that a large number of players can be
+        processed in bounded memory. Game logs are retrieved by up to
+        max_workers threads and generated in the order of `rosters`.
+
+        Parameters
+        ----------
+        rosters : iterable of dict
+            Roster dicts as returned by `getRoster` with return_type set to list
+        season : int
+            The season to retrieve data for. If not provided then game
+            log data will be for the current season, or most recently
+            completed season.
+        return_type : list or pandas.DataFrame
+            If the value is list then a dict is generated for each game log
+            record, if the value is pandas.DataFrame then a pandas.DataFrame
+            is generated for each player. The default is list.
+
+        Returns
+        -------
+        iterator of dict or pandas.DataFrame
+            Which type is generated is determined by the `return_type` parameter
+        """
+        if season is None:
+            season = self._currentSeason
+        fun = lambda pgl, rost: pgl.getGameLogs(rost, season, return_type)
+        for gmlogs in self._fanIter(self._plgmlog, fun, rosters):
+            if return_type == pandas.DataFrame:
+                yield gmlogs
+            else:
+                yield from gmlogs
+
+    def export(self, data : ListOrDataFrame, table : str, path : str, format : str = "parquet", **kwargs):
+        """Write table data to a file with typed columns
+
+        The columns are converted to the types given by the table's
+        schema in `nflapi.TableSchema.SCHEMAS` before writing, e.g.
+        integer columns with missing values stay integers and the
+        schedule and game log dates become UTC timestamps.
+
+        Parameters
+        ----------
+        data : list of dict or pandas.DataFrame
+            The data as returned by one of the get methods
+        table : str {"schedule", "roster", "profile", "gamelogs", "play", "drive", "summary", "score"}
+            The table the data is from
+        path : str
+            The file to write
+        format : str {"parquet", "feather", "csv"}
+            The file format. parquet and feather, i.e. Arrow IPC, require
+            the pyarrow package. [default: "parquet"]
+        kwargs
+            Passed on to the pandas.DataFrame writer for the format, e.g.
+            coerce_timestamps="us" for parquet files read by Spark
+        """
+        assert table in SCHEMAS, f"table {table} not valid"
+        writers = {"parquet": "to_parquet", "feather": "to_feather", "csv": "to_csv"}
+        assert format in writers, f"format {format} not valid"
+        df = SCHEMAS[table].apply(data)
+        if format == "feather":
+            df = df.reset_index(drop=True)
+        else:
+            kwargs.setdefault("index", False)
+        getattr(df, writers[format])(path, **kwargs)
+
+    def getStats(self, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        """Summarize the requests made so far by URL pattern
+
+        This shows where the time goes when retrieving data: the
+        number of requests, bytes received, errors, fetch, decode
+        and parse seconds, and in-memory and disk cache hits and
+        misses of each kind of document. See `APIStats.summary`.
+
+        Parameters
+        ----------
+        return_type : list or pandas.DataFrame
+            This defines the return type you would like. If the value is list
+            then a list of dicts will be returned, if the value is pandas.DataFrame
+            then a pandas.DataFrame will be returned. The default is list.
+
+        Returns
+        -------
+        list or pandas.DataFrame
+            A record per URL pattern, e.g. "/ajax/scorestrip"
+        """
+        return self._castReturnType(self._stats.summary(), return_type)
+
+    @property
+    def stats(self) -> APIStats:
+        return self._stats
+
+    def close(self):
+        """Stop the parse processes, if any"""
+        if self._parsePool is not None:
+            self._parsePool.close()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers : int):
+        assert max_workers >= 1, f"max_workers {max_workers} is not valid"
+        self._max_workers = max_workers
+
+    @property
+    def schedule_latencies(self) -> Dict[tuple, float]:
+        """The seconds taken to retrieve each week by the last `getSeasonSchedule`
+
+        The keys are (season, season_type, week) tuples. Weeks that
+        were already cached are not included.
+        """
+        return dict(self._schedule_latencies)
+
+    def _fanMap(self, api : API, fun : callable, items : list) -> list:
+        """Call fun(api, item) for each item
+
+        When max_workers is greater than 1 the calls are made
+        concurrently by a pool of threads. Each call is then given
+        its own copy of `api` which shares the connection pool and
+        cache of the original.
+
+        Returns
+        -------
+        list
+            The return values of the calls in the order of `items`
+        """
+        if self.max_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                rslts = list(pool.map(lambda item: fun(api._copy(), item), items))
+        else:
+            rslts = [fun(api, item) for item in items]
+        return rslts
+
+    def _fanOut(self, api : API, fun : callable, items : list) -> List[dict]:
+        """Call fun(api, item) for each item and concatenate the returned lists"""
+        data : List[dict] = []
+        for rslt in self._fanMap(api, fun, items):
+            data.extend(rslt)
+        return data
+
+    def _fanIter(self, api : API, fun : callable, items : Iterable) -> Iterator:
+        """Call fun(api, item) for each item and generate the return values
+
+        Each call is given its own copy of `api` with its own cache, so
+        that the results are not retained once they have been consumed.
+        When max_workers is greater than 1 up to max_workers calls are
+        in progress at once while the caller consumes earlier results.
+
+        Returns
+        -------
+        iterator
+            The return values of the calls in the order of `items`
+        """
+        def call(item):
+            worker = api._copy()
+            worker._detachCache()
+            return fun(worker, item)
+        if self.max_workers > 1:
+            pending = collections.deque()
+            pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            try:
+                for item in items:
+                    pending.append(pool.submit(call, item))
+                    if len(pending) >= self.max_workers:
+                        yield pending.popleft().result()
+                while len(pending) > 0:
+                    yield pending.popleft().result()
+            finally:
+                # The caller may stop consuming early
+                for future in pending:
+                    future.cancel()
+                pool.shutdown(wait=True)
+        else:
+            for item in items:
+                yield call(item)
+
     def _castReturnType(self, data : ListOrDataFrame, return_type : ListOrDataFrame) -> ListOrDataFrame:
         rslt = data
         if return_type == pandas.DataFrame and not isinstance(data, pandas.DataFrame):
             rslt = pandas.DataFrame(data)
         return rslt
 
+    def _scheduleWeeks(self, season : int, season_type : str = None) -> List[tuple]:
+        """Get the (season, season_type, week) values of a season
+
+        Parameters
+        ----------
+        season : int
+            The four digit year at the beginning of the NFL season
+        season_type : str {"preseason", "regular_season", "postseason"}
+            If None then the weeks of all season types are returned
+
+        Returns
+        -------
+        list of tuple
+            The weeks in the order in which they are played
+        """
+        wrngs = {"preseason": range(0, 5), "regular_season": range(1, 18), "postseason": range(1, 5)}
+        stypes = ["preseason", "regular_season", "postseason"]
+        if season_type is not None:
+            stypes = [season_type]
+        return [(season, st, wk) for st in stypes for wk in wrngs[st]]
+
+    @property
+    def _currentScheduleWeek(self) -> tuple:
+        """The (season, season_type, week) of the current week"""
+        week = self._currentWeek
+        if week < 0:
+            week = 5 + week
+        return (self._currentSeason, self._currentSeasonType, week)
+
     @property
     def _schedule(self) -> Schedule:
         return self._schedule_v
@@ -314,11 +698,7 @@ class Client:
 
     @property
     def _currentSeason(self) -> int:
-        crdt = self._currentDate
-        syear = crdt.year
-        if crdt.month < 8:
-            syear -= 1
-        return syear
+        return util.getSeason(self._currentDate)
 
     @property
     def _currentSeasonType(self) -> str:
@@ -0,0 +1,98 @@
+import numpy
+import pandas
+from typing import Dict, List
+
+class ColumnTable(object):
+    """Table data stored as one list of values per column
+
+    Rows are appended straight into the column lists, so no dict
+    is kept per row. A row may be given as several dicts, which
+    are applied in turn as though merged with `dict.update`. The
+    columns are ordered by first appearance and a row with no
+    value for a column holds NaN, as when a pandas.DataFrame is
+    built from a list of dicts, therefore `dataframe` returns the
+    same frame as `pandas.DataFrame(rows)` would have.
+    """
+
+    def __init__(self):
+        self._columns : Dict[str, list] = {}
+        self._nrows = 0
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns.keys())
+
+    def append(self, *parts : dict):
+        """Append a row
+
+        Parameters
+        ----------
+        parts : dict
+            The row values by column name. Values in later dicts
+            replace those for the same column in earlier dicts.
+        """
+        n = self._nrows
+        for part in parts:
+            for k, v in part.items():
+                col = self._columns.get(k)
+                if col is None:
+                    col = self._columns[k] = []
+                ncol = len(col)
+                if ncol > n:
+                    # Set by an earlier part of this row
+                    col[n] = v
+                else:
+                    if ncol < n:
+                        # Missing from the rows since the column was last set
+                        col.extend([numpy.nan] * (n - ncol))
+                    col.append(v)
+        self._nrows = n + 1
+
+    def extend(self, other : "ColumnTable"):
+        """Append the rows of another table"""
+        n = self._nrows
+        for k, ocol in other._columns.items():
+            col = self._columns.get(k)
+            if col is None:
+                col = self._columns[k] = []
+            self._pad(col, n)
+            col.extend(ocol)
+        self._nrows = n + other._nrows
+
+    @property
+    def dataframe(self) -> pandas.DataFrame:
+        return self.toDataFrame()
+
+    def toDataFrame(self, clear : bool = False) -> pandas.DataFrame:
+        """Build a pandas.DataFrame from the table
+
+        Parameters
+        ----------
+        clear : bool
+            Should the rows be removed from the table as their columns
+            are converted. This lowers the peak memory use when the
+            table is not needed afterwards. [default: False]
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        series = {}
+        for k in self.columns:
+            col = self._columns[k]
+            self._pad(col, self._nrows)
+            # Converting one column at a time keeps a single
+            # column's intermediate arrays alive at once
+            series[k] = pandas.Series(col, name=k)
+            if clear:
+                del self._columns[k]
+        if clear:
+            self._nrows = 0
+        return pandas.DataFrame(series, columns=list(series.keys()), copy=False)
+
+    def _pad(self, col : list, nrows : int):
+        if len(col) < nrows:
+            col.extend([numpy.nan] * (nrows - len(col)))
+
+    def __len__(self) -> int:
+        return self._nrows
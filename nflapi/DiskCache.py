@@ -0,0 +1,354 @@
+import os
+import json
+import pickle
+import time
+import hashlib
+import tempfile
+import threading
+
+class DiskCache(object):
+    """Persistent store of API responses
+
+    Responses are stored in a directory, one file per URL and query,
+    so that they survive restarts and can be shared by processes.
+    Files are written to a temporary name and then renamed into
+    place, therefore readers never see a partially written file.
+
+    Each response is stored with an expiry time derived from a time
+    to live (TTL) in seconds. A TTL of None means the response never
+    expires and a TTL of 0 means the response is not stored. The TTL
+    of each kind of resource is looked up in the `ttls` dict, whose
+    defaults are given by `DiskCache.TTLS`.
+
+    Responses are stored with their ETag and Last-Modified headers
+    so that expired responses can be revalidated, and with a digest
+    of their content. The rows parsed from a response may be stored
+    alongside it, see `putRows`, so that a response which has not
+    changed need not be parsed again. The rows are pickled, so only
+    share a cache directory with processes you trust.
+
+    When a maximum size is given the least recently read responses
+    are removed once the files in the directory exceed it.
+    """
+
+    TTLS = {
+        # Schedules for the current season change as games are played
+        "schedule": 60 * 60,
+        # Rosters, profiles and game logs change at most daily
+        "roster": 24 * 60 * 60,
+        "profile": 24 * 60 * 60,
+        "gamelogs": 24 * 60 * 60,
+        # Games in progress change constantly; finished games
+        # never expire, see GameData._diskCacheTTL
+        "game": 0
+    }
+
+    def __init__(self, directory : str, max_bytes : int = None, ttls : dict = None):
+        """Constructor for the DiskCache class
+
+        Parameters
+        ----------
+        directory : str
+            The directory to store responses in. It is created if it
+            does not exist.
+        max_bytes : int
+            The maximum total size of the stored responses. If None
+            then the size is unbounded. [default: None]
+        ttls : dict
+            TTLs, in seconds, by resource name that override those
+            in `DiskCache.TTLS` [default: None]
+        """
+        self._dir = directory
+        os.makedirs(directory, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._ttls = dict(DiskCache.TTLS)
+        if ttls is not None:
+            self._ttls.update(ttls)
+        self._lock = threading.Lock()
+        self._size : int = None
+
+    @property
+    def directory(self) -> str:
+        return self._dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def ttl(self, resource : str) -> float:
+        """Get the TTL, in seconds, for a kind of resource
+
+        Resources that are not configured are not stored.
+        """
+        return self._ttls.get(resource, 0)
+
+    def get(self, url : str, fields : dict = None) -> str:
+        """Retrieve a stored response
+
+        Parameters
+        ----------
+        url : str
+            The URL the response was retrieved from
+        fields : dict
+            The query parameters of the request, or None
+
+        Returns
+        -------
+        str
+            The response document, or None if it is not stored or has expired
+        """
+        rslt = self.getEntry(url, fields)
+        if rslt is not None:
+            rslt = rslt[1]
+        return rslt
+
+    def getEntry(self, url : str, fields : dict = None, include_expired : bool = False,
+                 binary : bool = False) -> tuple:
+        """Retrieve a stored response with its metadata
+
+        Parameters
+        ----------
+        url : str
+            The URL the response was retrieved from
+        fields : dict
+            The query parameters of the request, or None
+        include_expired : bool
+            Should an expired response be returned [default: False]
+        binary : bool
+            Should the document be returned as stored, as bytes, rather
+            than decoded with its charset [default: False]
+
+        Returns
+        -------
+        tuple of (dict, str)
+            The metadata and the response document, or None if it
+            is not stored or has expired. The metadata contains the
+            keys expires, digest, etag, last_modified and charset.
+        """
+        path = self._path(url, fields)
+        try:
+            with open(path, "rb") as fp:
+                meta = json.loads(fp.readline().decode("utf-8"))
+                docstr = fp.read()
+        except (OSError, ValueError):
+            # Not stored, or removed or replaced while being read
+            return None
+        if not include_expired and self.isExpired(meta):
+            return None
+        self._touch(path)
+        if not binary:
+            docstr = docstr.decode(meta.get("charset") or "utf-8")
+        return (meta, docstr)
+
+    def isExpired(self, meta : dict) -> bool:
+        """Has the response with the given metadata expired"""
+        return meta["expires"] is not None and meta["expires"] < time.time()
+
+    def put(self, url : str, fields : dict, docstr : str, ttl : float = None,
+            etag : str = None, last_modified : str = None, charset : str = None) -> str:
+        """Store a response
+
+        Parameters
+        ----------
+        url : str
+            The URL the response was retrieved from
+        fields : dict
+            The query parameters of the request, or None
+        docstr : str or bytes
+            The response document, or the body of the response
+        ttl : float
+            The number of seconds until the response expires. If
+            None then it never expires, if 0 then it is not stored.
+        etag : str
+            The ETag header of the response [default: None]
+        last_modified : str
+            The Last-Modified header of the response [default: None]
+        charset : str
+            The charset of a body given as bytes. If None then it is
+            UTF-8. A str document is stored as UTF-8. [default: None]
+
+        Returns
+        -------
+        str
+            The digest of the stored response, or None if it was not stored
+        """
+        if ttl is not None and ttl <= 0:
+            return None
+        body = docstr
+        if isinstance(docstr, str):
+            body = docstr.encode("utf-8")
+            charset = None
+        meta = {"url": url, "fields": fields, "expires": self._expires(ttl),
+                "digest": hashlib.sha256(body).hexdigest(),
+                "etag": etag, "last_modified": last_modified, "charset": charset}
+        self._write(url, fields, meta, body)
+        return meta["digest"]
+
+    def refresh(self, url : str, fields : dict, ttl : float = None) -> str:
+        """Extend the life of a stored response
+
+        This is used when the source confirms that the response
+        has not changed.
+
+        Parameters
+        ----------
+        url : str
+            The URL the response was retrieved from
+        fields : dict
+            The query parameters of the request, or None
+        ttl : float
+            The number of seconds from now until the response expires.
+            If None then it never expires.
+
+        Returns
+        -------
+        str
+            The digest of the stored response, or None if it is not stored
+        """
+        entry = self.getEntry(url, fields, include_expired=True, binary=True)
+        if entry is None:
+            return None
+        meta, body = entry
+        meta["expires"] = self._expires(ttl)
+        self._write(url, fields, meta, body)
+        return meta["digest"]
+
+    def getRows(self, url : str, fields : dict, digest : str) -> list:
+        """Retrieve the rows parsed from a stored response
+
+        Parameters
+        ----------
+        url : str
+            The URL the response was retrieved from
+        fields : dict
+            The query parameters of the request, or None
+        digest : str
+            The digest of the response the rows must have been parsed from
+
+        Returns
+        -------
+        list
+            The rows, or None if no rows were stored for the response
+        """
+        path = self._path(url, fields) + ".rows"
+        try:
+            with open(path, "rb") as fp:
+                rdigest, rows = pickle.load(fp)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+        if rdigest != digest:
+            # The rows were parsed from a different version of the response
+            return None
+        self._touch(path)
+        return rows
+
+    def putRows(self, url : str, fields : dict, digest : str, rows : list):
+        """Store the rows parsed from a stored response
+
+        Parameters
+        ----------
+        url : str
+            The URL the response was retrieved from
+        fields : dict
+            The query parameters of the request, or None
+        digest : str
+            The digest of the response the rows were parsed from
+        rows : list
+            The parsed rows
+        """
+        path = self._path(url, fields) + ".rows"
+        self._writeFile(path, pickle.dumps((digest, rows), protocol=pickle.HIGHEST_PROTOCOL))
+
+    def clear(self):
+        """Remove all stored responses"""
+        with self._lock:
+            for path, _, _ in self._files():
+                self._remove(path)
+            self._size = 0
+
+    def _expires(self, ttl : float) -> float:
+        expires = None
+        if ttl is not None:
+            expires = time.time() + ttl
+        return expires
+
+    def _write(self, url : str, fields : dict, meta : dict, body : bytes):
+        data = json.dumps(meta, default=str).encode("utf-8") + b"\n" + body
+        self._writeFile(self._path(url, fields), data)
+
+    def _writeFile(self, path : str, data : bytes):
+        pdir = os.path.dirname(path)
+        os.makedirs(pdir, exist_ok=True)
+        fd, tmppath = tempfile.mkstemp(dir=pdir, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+            # Renaming is atomic so concurrent readers see either
+            # the old or the new file, never a partial one.
+            os.replace(tmppath, path)
+        except BaseException:
+            if os.path.exists(tmppath):
+                os.remove(tmppath)
+            raise
+        self._grow(len(data))
+
+    def _touch(self, path : str):
+        try:
+            # Record the access for least recently used eviction
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _key(self, url : str, fields : dict = None) -> str:
+        kfields = None
+        if fields is not None:
+            kfields = sorted((str(k), str(v)) for k, v in fields.items())
+        return hashlib.sha256(json.dumps([url, kfields]).encode("utf-8")).hexdigest()
+
+    def _path(self, url : str, fields : dict = None) -> str:
+        key = self._key(url, fields)
+        # Spread the files over subdirectories so that no single
+        # directory grows too large.
+        return os.path.join(self._dir, key[:2], key)
+
+    def _files(self) -> list:
+        """List the (path, size, last used time) of each stored response"""
+        files = []
+        for pdir, _, fnames in os.walk(self._dir):
+            for fname in fnames:
+                if not fname.startswith(".tmp"):
+                    path = os.path.join(pdir, fname)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    # get updates the modification time on each read
+                    files.append((path, st.st_size, st.st_mtime))
+        return files
+
+    def _remove(self, path : str):
+        try:
+            os.remove(path)
+        except OSError:
+            # Another process may have removed it already
+            pass
+
+    def _grow(self, nbytes : int):
+        if self._max_bytes is None:
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum(f[1] for f in self._files())
+            else:
+                self._size += nbytes
+            if self._size > self._max_bytes:
+                # Other processes may share the directory so the
+                # running total is only an estimate; recount it
+                # from the files before evicting.
+                files = sorted(self._files(), key=lambda f: f[2])
+                self._size = sum(f[1] for f in files)
+                for path, size, _ in files:
+                    if self._size <= self._max_bytes:
+                        break
+                    self._remove(path)
+                    self._size -= size
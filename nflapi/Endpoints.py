@@ -0,0 +1,91 @@
+class Endpoints(object):
+    """Where the API classes send their requests, and how
+
+    The API classes name their documents by paths relative to the
+    site, e.g. /teams/roster, or by absolute URLs on the site, e.g.
+    the profile_url values of roster rows. An Endpoints object maps
+    these names to the URLs requested, so that requests can be sent
+    to a caching proxy, a mirror or a `StandInServer` rather than to
+    nfl.com. URLs on other hosts are requested unchanged.
+
+    Documents are named, e.g. in the rows returned and the keys of a
+    `DiskCache`, by their URL on the site whichever base URL they are
+    requested from, so those do not change when the base URL does.
+
+    It may also carry the transport that sends the requests, any
+    object with the urllib3 PoolManager request method. If None then
+    the API objects keep their own, by default `API.__http__`.
+    """
+
+    # The site that documents are named by
+    SITE_URL = "http://www.nfl.com"
+
+    def __init__(self, base_url : str = SITE_URL, transport = None):
+        """Constructor for the Endpoints class
+
+        Parameters
+        ----------
+        base_url : str
+            The scheme, host and any path prefix to send requests for
+            documents on the site to, e.g. http://proxy.local:8080/nfl
+            [default: Endpoints.SITE_URL]
+        transport : object
+            Sends the requests, e.g. a urllib3 PoolManager with proxy
+            settings or a `RecordingTransport`. [default: None]
+        """
+        assert base_url is not None and "://" in base_url, f"base_url {base_url} is not valid"
+        self._base_url = base_url.rstrip("/")
+        self._transport = transport
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def transport(self):
+        return self._transport
+
+    def url(self, name : str) -> str:
+        """Get the URL to request a document from
+
+        Parameters
+        ----------
+        name : str
+            A path on the site, starting with /, or an absolute URL
+        """
+        if name.startswith("/"):
+            url = self._base_url + name
+        elif name.startswith(Endpoints.SITE_URL + "/"):
+            url = self._base_url + name[len(Endpoints.SITE_URL):]
+        else:
+            url = name
+        return url
+
+    def name(self, url : str) -> str:
+        """Get the name of a document from the URL it is requested from
+
+        This reverses `url`, giving the path on the site of URLs with
+        the base URL, or on the site, and other URLs unchanged.
+
+        Parameters
+        ----------
+        url : str
+            An absolute URL
+        """
+        for base_url in [self._base_url, Endpoints.SITE_URL]:
+            if url.startswith(base_url + "/"):
+                return url[len(base_url):]
+        return url
+
+    @staticmethod
+    def siteUrl(name : str) -> str:
+        """Get the URL of a document on the site
+
+        Parameters
+        ----------
+        name : str
+            A path on the site, starting with /, or an absolute URL
+        """
+        if name.startswith("/"):
+            name = Endpoints.SITE_URL + name
+        return name
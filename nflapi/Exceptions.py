@@ -1,4 +1,12 @@
 
 class MissingDocumentException(Exception):
     def __init__(self, *args, **kwargs):
-        super(MissingDocumentException, self).__init__(*args, **kwargs)
\ No newline at end of file
+        super(MissingDocumentException, self).__init__(*args, **kwargs)
+
+class ResponseStatusException(Exception):
+    def __init__(self, *args, **kwargs):
+        super(ResponseStatusException, self).__init__(*args, **kwargs)
+
+class MissingRecordingException(Exception):
+    def __init__(self, *args, **kwargs):
+        super(MissingRecordingException, self).__init__(*args, **kwargs)
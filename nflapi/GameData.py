@@ -1,6 +1,7 @@
 import json
-from typing import List
+from typing import List, Union
 from nflapi.CachedAPI import CachedAPI, CachedRowFilter, ListOrDataFrame
+from nflapi.GameDataCache import GameDataCache
 
 class GameDataRowFilter(CachedRowFilter):
     """Internal class used by the GameData class
@@ -10,34 +11,88 @@ class GameDataRowFilter(CachedRowFilter):
     def __init__(self, gsisid : str):
         self._gsisid = gsisid
 
+    @property
+    def gsisid(self) -> str:
+        return self._gsisid
+
+    @property
+    def key(self) -> tuple:
+        return (self._gsisid,)
+
     def test(self, row : dict) -> bool:
         return self._gsisid in row.keys()
 
 class GameData(CachedAPI):
-    __cache__ : List[dict] = []
+    __cache__ : GameDataCache = GameDataCache()
+    _diskCacheResource = "game"
+    # Documents are parsed from bytes by the json module
+    _parseBytes = True
+    _urlPattern = "/liveupdate/game-center/{gsisid}/{gsisid}_gtd.json"
 
-    def __init__(self, use_shared_cache : bool = True):
+    def __init__(self, use_shared_cache : bool = True, cache_size : int = None):
         """Constructor for the GameData class
         
         Parameters
         ----------
         use_shared_cache : bool
             Should the shared GameData cache be used for the object [default: True]
+        cache_size : int
+            The maximum number of games to retain in the cache when
+            the shared cache is not used. If None then the number is
+            unbounded. The size of the shared cache is set via
+            `GameData.__cache__.max_size`. [default: None]
         """
         super(GameData, self).__init__(None, None)
         if use_shared_cache:
             self._cache = GameData.__cache__
-        self._url_base = "http://www.nfl.com/liveupdate/game-center/{gsisid}/{gsisid}_gtd.json"
+        else:
+            self._cache = GameDataCache(cache_size)
+        self._url_base = "/liveupdate/game-center/{gsisid}/{gsisid}_gtd.json"
         self._data : dict = None
+        self._cached_doc : dict = None
+        self._finished = False
+
+    @property
+    def cache(self) -> GameDataCache:
+        """The game document store used by this object"""
+        return self._cache
+
+    def _detachCache(self):
+        super(GameData, self)._detachCache()
+        # Only the document being parsed needs to be retained
+        self._cache = GameDataCache(1)
 
     def getGameData(self, schedule_game : dict) -> List[dict]:
         gsisid = schedule_game["gsis_id"]
+        self._finished = schedule_game.get("finished", False)
         # Set the URL which will be used by API._queryAPI
         self._url = self._url_base.format(gsisid=gsisid)
         return self._fetch(None, GameDataRowFilter(gsisid), list)
 
-    def _parseDocument(self, docstr : str):
+    def _diskCacheTTL(self, query_doc : dict = None) -> float:
+        ttl = super(GameData, self)._diskCacheTTL(query_doc)
+        if self._finished:
+            # The data of a finished game will not change
+            ttl = None
+        return ttl
+
+    def _parseDocument(self, docstr : Union[str, bytes]):
         self._data = json.loads(docstr)
 
     def _getResultList(self) -> List[dict]:
         return [self._data]
+
+    def _restoreParsed(self, rows : List[dict]):
+        self._data = rows[0]
+
+    def _isInCache(self, row_filter : GameDataRowFilter) -> bool:
+        # Hold on to the document so that it can not be evicted,
+        # by another thread sharing the cache, before _fromCache
+        self._cached_doc = self._cache.get(row_filter.gsisid)
+        return self._cached_doc is not None
+
+    def _toCache(self, data : List[dict], row_filter : GameDataRowFilter = None):
+        self._cache.put(row_filter.gsisid, data[0])
+
+    def _fromCache(self, row_filter : GameDataRowFilter, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+        return [self._cached_doc]
@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+
+class GameDataCache(object):
+    """Keyed store for game center documents
+
+    Documents are stored by gsis_id. When a maximum size is set
+    the least recently used documents are evicted once the store
+    grows beyond it. The number of lookups that were and were not
+    satisfied by the store are recorded in the hits and misses
+    properties. The store may be shared by threads.
+    """
+
+    def __init__(self, max_size : int = None):
+        """Constructor for the GameDataCache class
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum number of documents to retain. If None
+            then the number of documents is unbounded. [default: None]
+        """
+        self._docs : OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size : int):
+        assert max_size is None or max_size > 0, f"max_size {max_size} is not valid"
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, gsisid : str) -> dict:
+        """Retrieve a document and record the lookup
+
+        Parameters
+        ----------
+        gsisid : str
+            The gsis_id of the game
+
+        Returns
+        -------
+        dict
+            The document, or None if it is not in the store
+        """
+        with self._lock:
+            doc = self._docs.get(gsisid)
+            if doc is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                # Mark the document as the most recently used
+                self._docs.move_to_end(gsisid)
+        return doc
+
+    def peek(self, gsisid : str) -> dict:
+        """Retrieve a document without recording the lookup"""
+        with self._lock:
+            return self._docs.get(gsisid)
+
+    def put(self, gsisid : str, doc : dict):
+        """Add a document to the store
+
+        Parameters
+        ----------
+        gsisid : str
+            The gsis_id of the game
+        doc : dict
+            The parsed game center document
+        """
+        with self._lock:
+            self._docs[gsisid] = doc
+            self._docs.move_to_end(gsisid)
+            self._evict()
+
+    def clear(self):
+        """Remove all documents and reset the counters"""
+        with self._lock:
+            self._docs.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _evict(self):
+        if self._max_size is not None:
+            while len(self._docs) > self._max_size:
+                self._docs.popitem(last=False)
+
+    def __contains__(self, gsisid : str) -> bool:
+        return gsisid in self._docs
+
+    def __len__(self) -> int:
+        return len(self._docs)
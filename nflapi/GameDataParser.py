@@ -1,8 +1,14 @@
 import pandas
 import re
+import functools
 from nflapi.CachedAPI import ListOrDataFrame
 from nflapi.GameData import GameData
 
+# Game and drive data is keyed by all numeric ids
+_NUMERIC_KEY = re.compile(r"^\d+$")
+# The boundaries between words in camelCase keys
+_CAMEL_BOUNDARY = re.compile(r"([a-z])([A-Z])")
+
 class GameDataParser(GameData):
 
     def _process(self, schedule_game : dict, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
@@ -25,15 +31,43 @@ class GameDataParser(GameData):
         list of dict or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
+        data = self._doParse(*self._getGameSource(schedule_game))
+        if return_type == pandas.DataFrame:
+            data = pandas.DataFrame(data)
+        return data
+
+    def _getGameSource(self, schedule_game : dict) -> tuple:
+        """Get the game data to parse and the base data for its records
+
+        Returns
+        -------
+        tuple of (dict, dict)
+            The game data for the game and a dict of its gsis_id
+        """
         gdata = self.getGameData(schedule_game)
         # Game data is an atomic dict list.
         # The all numeric key of the dict is the gsis_id value for the game.
-        gdkeys = [_ for _ in gdata[0].keys() if re.search(r"^\d+$", _)]
+        gdkeys = [_ for _ in gdata[0].keys() if self._isNumericKey(_)]
         gsisid = gdkeys[0]
-        data = self._doParse(gdata[0][gsisid], {"gsis_id": gsisid})
-        if return_type == pandas.DataFrame:
-            data = pandas.DataFrame(data)
-        return data
+        return (gdata[0][gsisid], {"gsis_id": gsisid})
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _isNumericKey(key : str) -> bool:
+        """Is the key an all numeric id
+
+        Results are cached; the same few drive ids recur in every game.
+        """
+        return _NUMERIC_KEY.search(key) is not None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalizeKey(key : str) -> str:
+        """Convert a camelCase key to lower case snake_case
+
+        Results are cached as there are few distinct keys.
+        """
+        return _CAMEL_BOUNDARY.sub(r"\1_\2", key).lower()
 
     def _doParse(self, srcdata : dict, basedata : dict) -> list:
         raise NotImplementedError("abstract base class GameDataParser method _doParse has not been implemented")
@@ -1,5 +1,4 @@
 import pandas
-import re
 from nflapi.CachedAPI import ListOrDataFrame
 from nflapi.GameDataParser import GameDataParser
 import nflapi.Utilities as util
@@ -34,36 +33,39 @@ class GameDrive(GameDataParser):
             # The drive contains children that do not correspond
             # to a drive. If they child key is all numeric then
             # it does contain drive data.
-            if re.search(r"^\d+$", driveid):
-                ddata = basedata.copy()
-                ddata["drive_id"] = driveid
-                for dik, div in drive.items():
-                    # We'll deal with plays elsewhere
-                    if dik != "plays":
-                        if dik in ["start", "end"]:
-                            # The start and end values are dicts
-                            # themselves, therefore we need to
-                            # process each of its values.
-                            for sek, sev in div.items():
-                                ddata[f"{dik}_{sek}"] = sev
-                        else:
-                            ddata[dik] = div
-                for kp in ["start", "end"]:
-                    ylk = f"{kp}_yrdln"
-                    # At the end of the game the end_yrdln may be
-                    # blank. Since we don't actually know what the
-                    # end position was we just don't record the
-                    # normalized position.
-                    if ddata[ylk] != "":
-                        ydl = ddata[ylk]
-                        if kp == "end" and ddata["result"] == "Touchdown":
-                            # The end yrdln value in the data appears to be
-                            # the last snap position that led to the touchdown.
-                            # I would like the end_yrdln_norm - start_yrdln_norm - penyds
-                            # to equal the ydsgained value so by overwritting
-                            # the recorded value with "OPP 0" parseYardLine
-                            # should return the desired result.
-                            ydl = "OPP 0"
-                        ddata[f"{ylk}_norm"] = util.parseYardLine(ydl, ddata["posteam"])
-                data.append(ddata)
-        return data
\ No newline at end of file
+            if self._isNumericKey(driveid):
+                data.append(self._doDriveParse(driveid, drive, basedata))
+        return data
+
+    def _doDriveParse(self, driveid : str, drive : dict, basedata : dict) -> dict:
+        ddata = basedata.copy()
+        ddata["drive_id"] = driveid
+        for dik, div in drive.items():
+            # We'll deal with plays elsewhere
+            if dik != "plays":
+                if dik in ["start", "end"]:
+                    # The start and end values are dicts
+                    # themselves, therefore we need to
+                    # process each of its values.
+                    for sek, sev in div.items():
+                        ddata[f"{dik}_{sek}"] = sev
+                else:
+                    ddata[dik] = div
+        for kp in ["start", "end"]:
+            ylk = f"{kp}_yrdln"
+            # At the end of the game the end_yrdln may be
+            # blank. Since we don't actually know what the
+            # end position was we just don't record the
+            # normalized position.
+            if ddata[ylk] != "":
+                ydl = ddata[ylk]
+                if kp == "end" and ddata["result"] == "Touchdown":
+                    # The end yrdln value in the data appears to be
+                    # the last snap position that led to the touchdown.
+                    # I would like the end_yrdln_norm - start_yrdln_norm - penyds
+                    # to equal the ydsgained value so by overwritting
+                    # the recorded value with "OPP 0" parseYardLine
+                    # should return the desired result.
+                    ydl = "OPP 0"
+                ddata[f"{ylk}_norm"] = util.parseYardLine(ydl, ddata["posteam"])
+        return ddata
\ No newline at end of file
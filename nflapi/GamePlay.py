@@ -1,14 +1,14 @@
 import pandas
-import re
 import logging
 from nflapi.CachedAPI import ListOrDataFrame
+from nflapi.ColumnTable import ColumnTable
 from nflapi.GameDataParser import GameDataParser
 import nflapi.Utilities as util
-import nflgame.statmap as sm
 
 class GamePlay(GameDataParser):
 
-    def getGamePlay(self, schedule_game : dict, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
+    def getGamePlay(self, schedule_game : dict, return_type : ListOrDataFrame = list,
+                    columnar : bool = False) -> ListOrDataFrame:
         """Get play data for a given game
         
         This will use the gsis_id value in the input `schedule_game`
@@ -22,48 +22,96 @@ class GamePlay(GameDataParser):
             This defines the return type you would like. If the value is list
             then a list of dicts will be returned, if the value is pandas.DataFrame
             then a pandas.DataFrame will be returned. The default is list.
+        columnar : bool
+            When return_type is pandas.DataFrame, should the plays be
+            collected by column rather than as a dict per row; see
+            `getGamePlayColumns`. [default: False]
 
         Returns
         -------
         list of dict or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
+        if columnar and return_type == pandas.DataFrame:
+            return self.getGamePlayColumns(schedule_game).toDataFrame(clear=True)
         return self._process(schedule_game, return_type)
 
+    def getGamePlayColumns(self, schedule_game : dict) -> ColumnTable:
+        """Get play data for a given game by column
+
+        This produces the same columns as `getGamePlay`, but appends
+        the values straight into a list per column rather than
+        building a dict per play and player statistic, which uses
+        much less memory for large numbers of games.
+
+        Parameters
+        ----------
+        schedule_game : dict
+            A schedule game dictionary returned by `Schedule.getSchedule`
+
+        Returns
+        -------
+        ColumnTable
+            Use its dataframe property to get a pandas.DataFrame
+        """
+        srcdata, basedata = self._getGameSource(schedule_game)
+        table = ColumnTable()
+        for driveid, drive in srcdata["drives"].items():
+            if self._isNumericKey(driveid):
+                for parts in self._iterDrivePlayParts(driveid, drive):
+                    table.append(basedata, *parts)
+        return table
+
     def _doParse(self, srcdata : dict, basedata : dict) -> list:
         data = []
         for driveid, drive in srcdata["drives"].items():
             # The drive contains children that do not correspond
             # to a drive. If the child key is all numeric then
             # it does contain drive data.
-            if re.search(r"^\d+$", driveid):
-                for dik, div in drive.items():
-                    if dik == "plays":
-                        # div is the plays dict which contains
-                        # the data we want
-                        for playid, playdict in div.items():
-                            ddata = basedata.copy()
-                            ddata["drive_id"] = driveid
-                            ddata["play_id"] = playid
-                            for pk, pv in playdict.items():
-                                if pk != "players":
-                                    # This is an atomic valued element
-                                    # so just add it as-is
-                                    ddata[pk] = pv
-                            if ddata["yrdln"] != "":
-                                # We need to get a normalized yardline like we
-                                # do in the game summary data.
-                                ddata["yrdln_norm"] = util.parseYardLine(ddata["yrdln"], ddata["posteam"])
-                            if "players" in playdict.keys():
-                                # We have player statistics listed, therefore, we need
-                                # to add a record for each player statistic
-                                for pldata in self._doPlayerParse(playdict["players"], ddata):
-                                    data.append(pldata)
-                            else:
-                                # No player statistics listed so just add the base record
-                                data.append(ddata)
+            if self._isNumericKey(driveid):
+                data.extend(self._doDrivePlayParse(driveid, drive, basedata))
         return data
 
+    def _doDrivePlayParse(self, driveid : str, drive : dict, basedata : dict) -> list:
+        data = []
+        for parts in self._iterDrivePlayParts(driveid, drive):
+            ddata = basedata.copy()
+            for part in parts:
+                ddata.update(part)
+            data.append(ddata)
+        return data
+
+    def _iterDrivePlayParts(self, driveid : str, drive : dict):
+        """Generate the parts of each play record of a drive
+
+        Each record is yielded as a tuple of dicts that together with
+        the base data make up the record: the play data and, when the
+        play lists player statistics, the data of one statistic.
+        """
+        for dik, div in drive.items():
+            if dik == "plays":
+                # div is the plays dict which contains
+                # the data we want
+                for playid, playdict in div.items():
+                    ddata = {"drive_id": driveid, "play_id": playid}
+                    for pk, pv in playdict.items():
+                        if pk != "players":
+                            # This is an atomic valued element
+                            # so just add it as-is
+                            ddata[pk] = pv
+                    if ddata["yrdln"] != "":
+                        # We need to get a normalized yardline like we
+                        # do in the game summary data.
+                        ddata["yrdln_norm"] = util.parseYardLine(ddata["yrdln"], ddata["posteam"])
+                    if "players" in playdict.keys():
+                        # We have player statistics listed, therefore, we need
+                        # to add a record for each player statistic
+                        for pldata in self._doPlayerParse(playdict["players"], {}):
+                            yield (ddata, pldata)
+                    else:
+                        # No player statistics listed so just add the base record
+                        yield (ddata,)
+
     def _doPlayerParse(self, srcdata : dict, basedata : dict) -> list:
         data = []
         for playerid, pllist in srcdata.items():
@@ -78,16 +126,13 @@ class GamePlay(GameDataParser):
         for k, v in srcdata.items():
             if k != "yards":
                 # Ignore the yards key at this level
-                k = re.sub(r"([a-z])([A-Z])", r"\1_\2", k)
-                k = k.lower()
+                k = self._normalizeKey(k)
                 if k == "stat_id":
                     try:
                         # Now we use the yards value in the srcdata
-                        # Add the statistic flags and the statistic yardage value
-                        vd = sm.values(v, srcdata["yards"])
-                        # Add the statistic metadata
-                        vd.update(util.getStatMetadata(v))
-                        data.update(vd)
+                        # Add the statistic flags, the statistic yardage
+                        # value and the statistic metadata
+                        util.expandStat(v, srcdata["yards"], data)
                     except AssertionError as e:
                         logging.warning("Statistic metadata retrieval failed for stat_id {}: {}".format(v, e))
                         logging.warning("Offending record was {}".format(srcdata))
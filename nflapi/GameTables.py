@@ -0,0 +1,89 @@
+import pandas
+from typing import List, Dict
+from nflapi.CachedAPI import ListOrDataFrame
+from nflapi.GameDataParser import GameDataParser
+from nflapi.GameSummary import GameSummary
+from nflapi.GameScore import GameScore
+from nflapi.GameDrive import GameDrive
+from nflapi.GamePlay import GamePlay
+
+class GameTables(GameDataParser):
+    """Retrieve several game tables from a single pass over the game data
+
+    The summary, score, drive and play tables are all derived from
+    the same game center document. This walks the document once and
+    produces each of the requested tables, rather than having each
+    of GameSummary, GameScore, GameDrive and GamePlay walk it in turn.
+    """
+
+    TABLES = ["summary", "score", "drive", "play"]
+
+    def __init__(self, use_shared_cache : bool = True):
+        """Constructor for the GameTables class
+
+        Parameters
+        ----------
+        use_shared_cache : bool
+            Should the shared GameData cache be used for the object [default: True]
+        """
+        super(GameTables, self).__init__(use_shared_cache)
+        # These provide the parsing logic for the individual tables.
+        # They never retrieve data themselves.
+        self._gmsummary = GameSummary(False)
+        self._gmscore = GameScore(False)
+        self._gmdrive = GameDrive(False)
+        self._gmplay = GamePlay(False)
+        self._tables : List[str] = GameTables.TABLES
+
+    def getGameTables(self, schedule_game : dict, tables : List[str] = None,
+                      return_type : ListOrDataFrame = list) -> Dict[str, ListOrDataFrame]:
+        """Get several tables of data for a given game
+
+        This will use the gsis_id value in the input `schedule_game`
+        to retrieve the game data and derive each requested table from it.
+
+        Parameters
+        ----------
+        schedule_game : dict
+            A schedule game dictionary returned by `Schedule.getSchedule`
+        tables : list of str {"summary", "score", "drive", "play"}
+            The tables to produce. If None then all tables are produced.
+        return_type : list or pandas.DataFrame
+            This defines the return type you would like for each table. If the
+            value is list then a list of dicts will be returned, if the value is
+            pandas.DataFrame then a pandas.DataFrame will be returned. The default is list.
+
+        Returns
+        -------
+        dict of list or pandas.DataFrame
+            The keys are the table names and the values are the table data.
+            Which type is returned is determined by the `return_type` parameter
+        """
+        if tables is None:
+            tables = GameTables.TABLES
+        assert all([t in GameTables.TABLES for t in tables]), f"tables {tables} not valid"
+        self._tables = tables
+        data = self._process(schedule_game, list)
+        if return_type == pandas.DataFrame:
+            data = dict((t, pandas.DataFrame(d)) for t, d in data.items())
+        return data
+
+    def _doParse(self, srcdata : dict, basedata : dict) -> Dict[str, list]:
+        data = dict((t, []) for t in self._tables)
+        # The summary and score tables only use the team level
+        # data so they do not need to visit the drives.
+        if "summary" in data:
+            data["summary"] = self._gmsummary._doParse(srcdata, basedata)
+        if "score" in data:
+            data["score"] = self._gmscore._doParse(srcdata, basedata)
+        if "drive" in data or "play" in data:
+            for driveid, drive in srcdata["drives"].items():
+                # The drive contains children that do not correspond
+                # to a drive. If the child key is all numeric then
+                # it does contain drive data.
+                if self._isNumericKey(driveid):
+                    if "drive" in data:
+                        data["drive"].append(self._gmdrive._doDriveParse(driveid, drive, basedata))
+                    if "play" in data:
+                        data["play"].extend(self._gmplay._doDrivePlayParse(driveid, drive, basedata))
+        return data
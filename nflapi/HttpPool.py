@@ -0,0 +1,258 @@
+import time
+import threading
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from urllib3.util.timeout import Timeout
+
+class PooledResponse(object):
+    """A response read by an HttpPool
+
+    This provides the subset of the urllib3 HTTPResponse interface
+    used by `API._queryAPI`. The data is the decompressed body, and
+    received the number of bytes of the body read from the connection.
+    """
+
+    def __init__(self, status : int, headers : dict, data : bytes, retries : Retry = None, received : int = None):
+        self.status = status
+        self.headers = headers
+        self.data = data
+        self.retries = retries
+        self.received = received
+
+class HttpPool(PoolManager):
+    """A urllib3 PoolManager with tunable pooling and retries, and metrics
+
+    This is the PoolManager shared by the API classes, see
+    `API.__http__`. Each host has a pool of up to `maxsize` kept
+    alive connections. When more requests than that are in flight
+    for a host, either the extra connections are closed once their
+    request completes (block False) or requests wait for a pooled
+    connection (block True).
+
+    Requests that fail to connect, time out reading or receive one
+    of the `retry_statuses` are retried up to `retries` times, waiting
+    backoff_factor * 2 ** (retry - 1) seconds between attempts, as
+    urllib3 does, or as long as a Retry-After header asks. When the
+    retries are exhausted the last response is returned, for which
+    `API._queryAPI` raises a ResponseStatusException.
+
+    Compressed responses are asked for, with gzip and deflate, and
+    brotli when the brotli package is installed. The body is read from
+    the connection and decompressed in chunks, so the compressed body is
+    never held whole. The decompressed chunks are then joined, so the
+    whole decompressed body is in memory before the `PooledResponse` is
+    returned and the document is parsed; decompression is not streamed
+    into the parsers. Pass preload_content=False to `request` to get
+    the urllib3 HTTPResponse and read it yourself instead.
+
+    The metrics of the requests sent, e.g. how many connections were
+    discarded because the pool was full, are given by `metrics`.
+    """
+
+    # The number of bytes read from a response at a time
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, maxsize : int = 10, block : bool = False, connect_timeout : float = 10.0,
+                 read_timeout : float = 30.0, retries : int = 3, backoff_factor : float = 0.5,
+                 retry_statuses : tuple = (500, 502, 503, 504), num_pools : int = 10,
+                 compress : bool = True, **connection_pool_kw):
+        """Constructor for the HttpPool class
+
+        Parameters
+        ----------
+        maxsize : int
+            The number of connections kept alive per host. Set it to at
+            least the max_workers of the Client using it. [default: 10]
+        block : bool
+            Should requests wait for a pooled connection rather than
+            open one that is discarded afterwards [default: False]
+        connect_timeout : float
+            The seconds to wait for a connection, or None to wait
+            indefinitely [default: 10.0]
+        read_timeout : float
+            The seconds to wait for data from the server, or None to
+            wait indefinitely [default: 30.0]
+        retries : int
+            The number of times a failed request is retried, or 0 to
+            not retry [default: 3]
+        backoff_factor : float
+            Scales the exponentially increasing wait between retries [default: 0.5]
+        retry_statuses : tuple
+            The response statuses that are retried [default: (500, 502, 503, 504)]
+        num_pools : int
+            The number of hosts whose pools are kept [default: 10]
+        compress : bool
+            Should compressed responses be asked for [default: True]
+        connection_pool_kw
+            Other arguments of the urllib3 connection pools
+        """
+        assert maxsize >= 1, f"maxsize {maxsize} is not valid"
+        assert retries >= 0, f"retries {retries} is not valid"
+        retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=retry_statuses,
+                      raise_on_status=False)
+        super(HttpPool, self).__init__(num_pools=num_pools, maxsize=maxsize, block=block,
+                                       timeout=Timeout(connect=connect_timeout, read=read_timeout),
+                                       retries=retry, **connection_pool_kw)
+        self.pool_classes_by_scheme = {"http": _MeteredHTTPConnectionPool, "https": _MeteredHTTPSConnectionPool}
+        self._maxsize = maxsize
+        self._block = block
+        self._acceptEncoding : str = None
+        if compress:
+            self._acceptEncoding = make_headers(accept_encoding=True)["accept-encoding"]
+        self._lock = threading.Lock()
+        self.clearMetrics()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def block(self) -> bool:
+        return self._block
+
+    @property
+    def accept_encoding(self) -> str:
+        """The Accept-Encoding header sent, or None if compressed responses are not asked for"""
+        return self._acceptEncoding
+
+    def request(self, method : str, url : str, fields : dict = None, headers : dict = None, **kwargs):
+        if self._acceptEncoding is not None and not _hasHeader(headers, "Accept-Encoding"):
+            # Headers given to a request replace the default headers
+            # of the PoolManager, so they are added to each request
+            headers = dict(headers or {})
+            headers["Accept-Encoding"] = self._acceptEncoding
+        preload = kwargs.pop("preload_content", True)
+        with self._lock:
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            self._requests += 1
+        try:
+            rslt = super(HttpPool, self).request(method, url, fields=fields, headers=headers,
+                                                 preload_content=False, **kwargs)
+            if preload:
+                rslt = self._read(rslt)
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        retries = getattr(rslt, "retries", None)
+        if retries is not None and len(retries.history) > 0:
+            with self._lock:
+                self._retries += len(retries.history)
+        return rslt
+
+    def _read(self, response) -> PooledResponse:
+        """Read and decompress the body of a response in chunks and join them"""
+        try:
+            data = b"".join(response.stream(HttpPool.CHUNK_SIZE, decode_content=True))
+            received = response.tell()
+        finally:
+            response.release_conn()
+        with self._lock:
+            self._bytes_received += received
+            self._bytes_decoded += len(data)
+        return PooledResponse(response.status, response.headers, data, getattr(response, "retries", None), received)
+
+    def metrics(self) -> dict:
+        """Get the metrics of the requests sent since the pool was created or cleared
+
+        Returns
+        -------
+        dict
+            - maxsize, block: the pool settings
+            - requests: requests sent, not counting retries
+            - errors: requests that raised an exception
+            - retries: retries of requests
+            - in_flight, max_in_flight: requests in progress, now and at most
+            - connections_opened: connections opened to the servers
+            - connections_discarded: connections closed because the pool was full
+            - waits, wait_seconds, max_wait_seconds: requests that waited for a
+              pooled connection, and how long, when block is True
+            - bytes_received, bytes_decoded: the size of the bodies read,
+              before and after decompression
+        """
+        with self._lock:
+            return {
+                "maxsize": self._maxsize, "block": self._block,
+                "requests": self._requests, "errors": self._errors, "retries": self._retries,
+                "in_flight": self._in_flight, "max_in_flight": self._max_in_flight,
+                "connections_opened": self._opened, "connections_discarded": self._discarded,
+                "waits": self._waits, "wait_seconds": self._wait_seconds, "max_wait_seconds": self._max_wait_seconds,
+                "bytes_received": self._bytes_received, "bytes_decoded": self._bytes_decoded
+            }
+
+    def clearMetrics(self):
+        with self._lock:
+            self._requests = 0
+            self._errors = 0
+            self._retries = 0
+            self._in_flight = 0
+            self._max_in_flight = 0
+            self._opened = 0
+            self._discarded = 0
+            self._waits = 0
+            self._wait_seconds = 0.0
+            self._max_wait_seconds = 0.0
+            self._bytes_received = 0
+            self._bytes_decoded = 0
+
+    def _new_pool(self, scheme : str, host : str, port : int, request_context : dict = None):
+        pool = super(HttpPool, self)._new_pool(scheme, host, port, request_context)
+        pool._httpPool = self
+        return pool
+
+    def _recordOpened(self):
+        with self._lock:
+            self._opened += 1
+
+    def _recordDiscarded(self):
+        with self._lock:
+            self._discarded += 1
+
+    def _recordWait(self, seconds : float):
+        with self._lock:
+            self._waits += 1
+            self._wait_seconds += seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, seconds)
+
+def _hasHeader(headers : dict, name : str) -> bool:
+    name = name.lower()
+    return headers is not None and any(k.lower() == name for k in headers.keys())
+
+class _MeteredPool(object):
+    """Records the connection metrics of an HttpPool's connection pools"""
+
+    _httpPool : HttpPool = None
+
+    def _new_conn(self):
+        conn = super(_MeteredPool, self)._new_conn()
+        if self._httpPool is not None:
+            self._httpPool._recordOpened()
+        return conn
+
+    def _get_conn(self, timeout : float = None):
+        if self._httpPool is None or not self.block or self.pool is None or not self.pool.empty():
+            return super(_MeteredPool, self)._get_conn(timeout)
+        # Every connection is in use, so this waits for one
+        start = time.perf_counter()
+        try:
+            return super(_MeteredPool, self)._get_conn(timeout)
+        finally:
+            self._httpPool._recordWait(time.perf_counter() - start)
+
+    def _put_conn(self, conn):
+        if self._httpPool is not None and self.pool is not None and self.pool.full():
+            # urllib3 closes the connection as there is no room for it
+            self._httpPool._recordDiscarded()
+        super(_MeteredPool, self)._put_conn(conn)
+
+class _MeteredHTTPConnectionPool(_MeteredPool, HTTPConnectionPool):
+    pass
+
+class _MeteredHTTPSConnectionPool(_MeteredPool, HTTPSConnectionPool):
+    pass
@@ -0,0 +1,69 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+from nflapi.AbstractContentHandler import AbstractContentHandler
+
+def _parseDocument(handler : AbstractContentHandler, docstr : str) -> List[dict]:
+    # This runs in a worker process, on a copy of the handler
+    handler.parse(docstr)
+    return handler.list
+
+class ParsePool(object):
+    """Parses documents in a pool of processes
+
+    Parsing html with BeautifulSoup is CPU bound, so threads that
+    retrieve documents concurrently still parse them one at a time
+    because of the GIL. A CachedAPI object given a ParsePool sends
+    each document it retrieves, along with a copy of its handler,
+    to a worker process and waits for the parsed rows. Documents
+    are still retrieved by the calling threads, so use this along
+    with a `Client` max_workers greater than 1.
+
+    Only the handler and the document are sent to the worker and
+    only the rows are sent back, therefore handlers must be
+    picklable and have a parse(docstr) method.
+    """
+
+    def __init__(self, max_workers : int = None, mp_context = None):
+        """Constructor for the ParsePool class
+
+        Parameters
+        ----------
+        max_workers : int
+            The number of worker processes. If None then it is the
+            number of processors. [default: None]
+        mp_context : multiprocessing.context.BaseContext
+            The context used to start the worker processes. If None
+            then the default context is used. [default: None]
+        """
+        assert max_workers is None or max_workers >= 1, f"max_workers {max_workers} is not valid"
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def parse(self, handler : AbstractContentHandler, docstr : str) -> List[dict]:
+        """Parse a document with a copy of a handler in a worker process
+
+        The calling thread waits for the rows, but the GIL is
+        released while it waits so other threads may proceed.
+
+        Parameters
+        ----------
+        handler : AbstractContentHandler
+            The handler to parse the document with. It is not modified.
+        docstr : str
+            The document text
+
+        Returns
+        -------
+        list of dict
+            The handler's list after parsing the document
+        """
+        return self._executor.submit(_parseDocument, handler, docstr).result()
+
+    def close(self):
+        """Shut down the worker processes"""
+        self._executor.shutdown(wait=True)
@@ -1,8 +1,10 @@
 from bs4 import BeautifulSoup
 import json
 import logging
+import datetime
 from nflapi.CachedAPI import CachedAPI, CachedRowFilter, ListOrDataFrame
 from nflapi.PlayerGameLogsContentHandler import PlayerGameLogsContentHandler
+import nflapi.Utilities as util
 
 class PlayerGameLogsRowFilter(CachedRowFilter):
     """Internal class used by the PlayerGameLogs class
@@ -13,6 +15,10 @@ class PlayerGameLogsRowFilter(CachedRowFilter):
         self._roster_data = roster_data
         self._season = season
 
+    @property
+    def key(self) -> tuple:
+        return (self._roster_data["profile_id"], self._season)
+
     def test(self, row : dict) -> bool:
         x = False
         if "profile_id" in row.keys():
@@ -22,10 +28,27 @@ class PlayerGameLogsRowFilter(CachedRowFilter):
         return x
 
 class PlayerGameLogs(CachedAPI):
+    _diskCacheResource = "gamelogs"
+    _urlPattern = "/player/{name}/{id}/gamelogs"
+    _parseInPool = True
+
+    def __init__(self, native_datetimes : bool = False):
+        """Constructor for the PlayerGameLogs class
+
+        Parameters
+        ----------
+        native_datetimes : bool
+            If True then the game_date of each game log is a timezone
+            aware (US Eastern) pandas.Timestamp, which becomes a datetime64
+            column in a pandas.DataFrame. If False then it is a
+            time.struct_time value. [default: False]
+        """
+        super(PlayerGameLogs, self).__init__(None, PlayerGameLogsContentHandler(native_datetimes=native_datetimes))
+        self._native_datetimes = native_datetimes
 
-    def __init__(self):
-        """Constructor for the PlayerGameLogs class"""
-        super(PlayerGameLogs, self).__init__(None, PlayerGameLogsContentHandler())
+    @property
+    def native_datetimes(self) -> bool:
+        return self._native_datetimes
     
     def getGameLogs(self, roster_data : dict, season : int, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
         """Get game logs (stats) for a player
@@ -63,8 +86,27 @@ class PlayerGameLogs(CachedAPI):
         self._roster_data_v = roster_data
         self._url = roster_data["gamelogs_url"]
 
+    def _diskCacheTTL(self, query_doc : dict = None) -> float:
+        ttl = super(PlayerGameLogs, self)._diskCacheTTL(query_doc)
+        if query_doc["season"] < util.getSeason(datetime.date.today()):
+            # The game logs of a past season will not change
+            ttl = None
+        return ttl
+
+    @property
+    def _parseVariant(self) -> str:
+        return "native_datetimes" if self._native_datetimes else None
+
     def _parseDocument(self, docstr : str):
         self._handler.parse(docstr)
+        self._mergeRosterData()
+
+    def _restoreParsed(self, rows : list):
+        super(PlayerGameLogs, self)._restoreParsed(rows)
+        # The rows may have been parsed for a different roster record
+        self._mergeRosterData()
+
+    def _mergeRosterData(self):
         xkeys = set(["first_name", "last_name", "profile_id", "team"])
         pd = dict((k, self._roster_data[k]) for k in xkeys if k in self._roster_data)
         if len(pd) < 4:
@@ -1,13 +1,16 @@
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 import pandas
-from nflapi.AbstractContentHandler import AbstractContentHandler
+from nflapi.BSContentHandler import BSContentHandler
 from nflapi.PlayerGameLogsFilter import PlayerGameLogsFilter
 from nflapi.PlayerGameLogsParser import PlayerGameLogsParser
+import nflapi.Utilities as util
 
-class PlayerGameLogsContentHandler(AbstractContentHandler):
+class PlayerGameLogsContentHandler(BSContentHandler):
 
-    def __init__(self, season : int = None):
+    def __init__(self, season : int = None, parser : str = None, native_datetimes : bool = False):
+        super(PlayerGameLogsContentHandler, self).__init__(parser)
         self._season = season
+        self._native_datetimes = native_datetimes
         self._data = []
     
     def parse(self, docstr : str):
@@ -18,8 +21,8 @@ class PlayerGameLogsContentHandler(AbstractContentHandler):
         docstr : str
             The html document as a string
         """
-        soup = BeautifulSoup(docstr, "html.parser")
         filter = PlayerGameLogsFilter()
+        soup = self._makeSoup(docstr, filter)
         self._data = []
         for tag in soup.find_all(filter.match):
             if tag.name == "select" and tag.has_attr("id") and tag["id"] == "season":
@@ -30,8 +33,24 @@ class PlayerGameLogsContentHandler(AbstractContentHandler):
                         break
             else:
                 # Parse data from the current table tag
-                parser = PlayerGameLogsParser(self._season)
+                parser = PlayerGameLogsParser(self._season, self._native_datetimes)
                 self._data.extend(parser.parse(tag))
+        if self._native_datetimes and len(self._data) > 0:
+            self._setGameDates()
+
+    def _setGameDates(self):
+        """Convert the game_date of every row to a timezone aware pandas.Timestamp
+
+        The dates of all rows are converted at once rather than row by row.
+        """
+        mdays = pandas.Series([d.get("game_date") for d in self._data], dtype=object)
+        # The game date is just {month}/{day}
+        parts = mdays.str.extract(r"^(\d+)/(\d+)$").astype(float)
+        # The year is season plus 1 for games in Jan. or Feb.
+        year = self._season + (parts[0] < 3).astype(int)
+        dts = util.localizeEastern(pandas.to_datetime(pandas.DataFrame({"year": year, "month": parts[0], "day": parts[1]})))
+        for d, dt in zip(self._data, dts):
+            d["game_date"] = dt
 
     @property
     def _season(self) -> int:
@@ -1,4 +1,4 @@
-from bs4 import Tag
+from bs4 import Tag, SoupStrainer
 from nflapi.BSTagFilter import BSTagFilter
 
 class PlayerGameLogsFilter(BSTagFilter):
@@ -19,4 +19,11 @@ class PlayerGameLogsFilter(BSTagFilter):
         return (tag.name == "table"
                 and tag.has_attr("class") and tag["class"] == ["data-table1"]
                 and tag.has_attr("summary") and tag["summary"].startswith("Game Logs")) \
-               or (tag.name == "select" and tag.has_attr("id") and tag["id"] == "season")
\ No newline at end of file
+               or (tag.name == "select" and tag.has_attr("id") and tag["id"] == "season")
+
+    @property
+    def strainer(self) -> SoupStrainer:
+        # A strainer cannot require different attributes of each
+        # tag name, so keep all tables and selects and leave the
+        # rest to match
+        return SoupStrainer(["table", "select"])
@@ -6,8 +6,11 @@ from nflapi.BSTagParser import BSTagParser
 
 class PlayerGameLogsParser(BSTagParser):
 
-    def __init__(self, season : int):
+    def __init__(self, season : int, native_datetimes : bool = False):
         self._ssn = season
+        # When True game dates are left as the {month}/{day} text
+        # for the caller to convert, see PlayerGameLogsContentHandler
+        self._native_datetimes = native_datetimes
         self._ssntype = ""
         self._hdrs = []
     
@@ -220,7 +223,7 @@ class PlayerGameLogsParser(BSTagParser):
 
     def _gmdt_parser(self, tdtag : Tag) -> float:
         v = self._str_parser(tdtag)
-        if v is not None:
+        if v is not None and not self._native_datetimes:
             # The game date is just {month}/{day}
             parts = v.split("/")
             # Determine the year based on the season
@@ -12,6 +12,10 @@ class PlayerProfileRowFilter(CachedRowFilter):
     def __init__(self, roster_data : dict):
         self._roster_data = roster_data
 
+    @property
+    def key(self) -> tuple:
+        return (self._roster_data["profile_id"],)
+
     def test(self, row : dict) -> bool:
         x = False
         if "profile_id" in row.keys():
@@ -19,6 +23,9 @@ class PlayerProfileRowFilter(CachedRowFilter):
         return x
 
 class PlayerProfile(CachedAPI):
+    _diskCacheResource = "profile"
+    _urlPattern = "/player/{name}/{id}/profile"
+    _parseInPool = True
 
     def __init__(self):
         """Constructor for the PlayerProfile class"""
@@ -60,6 +67,14 @@ class PlayerProfile(CachedAPI):
     def _parseDocument(self, docstr : str):
         # Parse the document with the handler
         self._handler.parse(docstr)
+        self._mergeRosterData()
+
+    def _restoreParsed(self, rows : list):
+        super(PlayerProfile, self)._restoreParsed(rows)
+        # The rows may have been parsed for a different roster record
+        self._mergeRosterData()
+
+    def _mergeRosterData(self):
         # Add some of the data from the provided roster record to the profile data
         xkeys = set(["first_name", "last_name", "number", "position", "profile_id", "team"])
         pd = dict((k, self._roster_data[k]) for k in xkeys if k in self._roster_data)
@@ -1,4 +1,4 @@
-from bs4 import Tag
+from bs4 import Tag, SoupStrainer
 from nflapi.BSTagFilter import BSTagFilter
 
 class PlayerProfileBioFilter(BSTagFilter):
@@ -17,3 +17,7 @@ class PlayerProfileBioFilter(BSTagFilter):
             False otherwise
         """
         return tag.name == "div" and tag.has_attr("id") and tag["id"] == "player-bio"
+
+    @property
+    def strainer(self) -> SoupStrainer:
+        return SoupStrainer("div", id="player-bio")
@@ -1,13 +1,13 @@
-from bs4 import BeautifulSoup
 import pandas
-from nflapi.AbstractContentHandler import AbstractContentHandler
+from nflapi.BSContentHandler import BSContentHandler
 from nflapi.PlayerProfileBioFilter import PlayerProfileBioFilter
 from nflapi.PlayerProfileInfoFilter import PlayerProfileInfoFilter
 from nflapi.PlayerProfileInfoParser import PlayerProfileInfoParser
 
-class PlayerProfileContentHandler(AbstractContentHandler):
+class PlayerProfileContentHandler(BSContentHandler):
 
-    def __init__(self):
+    def __init__(self, parser : str = None):
+        super(PlayerProfileContentHandler, self).__init__(parser)
         self._data = []
     
     def parse(self, docstr : str):
@@ -18,8 +18,8 @@ class PlayerProfileContentHandler(AbstractContentHandler):
         docstr : str
             The html document as a string
         """
-        soup = BeautifulSoup(docstr, "html.parser")
         pbfilter = PlayerProfileBioFilter()
+        soup = self._makeSoup(docstr, pbfilter)
         pifilter = PlayerProfileInfoFilter()
         parser = PlayerProfileInfoParser()
         self._data = []
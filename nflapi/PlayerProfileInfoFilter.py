@@ -1,4 +1,4 @@
-from bs4 import Tag
+from bs4 import Tag, SoupStrainer
 from nflapi.BSTagFilter import BSTagFilter
 
 class PlayerProfileInfoFilter(BSTagFilter):
@@ -17,3 +17,7 @@ class PlayerProfileInfoFilter(BSTagFilter):
             False otherwise
         """
         return tag.name == "div" and tag.has_attr("class") and tag["class"] == ["player-info"]
+
+    @property
+    def strainer(self) -> SoupStrainer:
+        return SoupStrainer("div", class_="player-info")
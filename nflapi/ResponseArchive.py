@@ -0,0 +1,227 @@
+import json
+import hashlib
+import zipfile
+import threading
+from typing import List
+from urllib3 import PoolManager
+from urllib3._collections import HTTPHeaderDict
+from nflapi.API import API
+from nflapi.Endpoints import Endpoints
+from nflapi.Exceptions import MissingRecordingException
+
+class ArchivedResponse(object):
+    """A response read from a ResponseArchive
+
+    This provides the subset of the urllib3 HTTPResponse interface
+    used by `API._queryAPI`.
+    """
+
+    def __init__(self, status : int, headers : dict, data : bytes):
+        self.status = status
+        # Header names are matched case insensitively, as in a response
+        self.headers = HTTPHeaderDict(headers)
+        self.data = data
+
+class ResponseArchive(object):
+    """A compressed archive of responses to requests
+
+    The archive is a zip file with two members per request: the
+    response body, and a JSON document of the request method, URL,
+    query fields and headers and the response status and headers.
+    Bodies are compressed, with deflate by default, and read
+    individually, so replaying from an archive does not load it
+    all into memory.
+
+    Requests for documents on the site are keyed by their path on
+    the site, e.g. /teams/roster, so that a recording made through
+    a proxy or a `StandInServer` replays against nfl.com, and vice
+    versa. The recorded body is the decoded one, so the
+    Content-Encoding and Content-Length headers are not recorded.
+
+    The first response recorded for a request is kept. The zip
+    central directory is written by `close`, so an archive that is
+    being recorded must be closed for it to be readable.
+    """
+
+    def __init__(self, path : str, mode : str = "r", compression : int = zipfile.ZIP_DEFLATED):
+        """Constructor for the ResponseArchive class
+
+        Parameters
+        ----------
+        path : str
+            The archive file
+        mode : str {"r", "a"}
+            Open the archive to read responses, or to read and add
+            responses, creating it if it does not exist [default: "r"]
+        compression : int
+            The zipfile compression method of added responses, e.g.
+            zipfile.ZIP_LZMA for smaller archives [default: zipfile.ZIP_DEFLATED]
+        """
+        assert mode in ["r", "a"], f"mode {mode} not valid"
+        self._path = path
+        self._zip = zipfile.ZipFile(path, mode, compression=compression)
+        self._names = set(self._zip.namelist())
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ResponseArchive":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def keys(self) -> List[str]:
+        """The keys of the recorded requests"""
+        with self._lock:
+            return sorted(n[:-5] for n in self._names if n.endswith(".json"))
+
+    def get(self, method : str, url : str, fields : dict = None) -> ArchivedResponse:
+        """Get the response recorded for a request
+
+        Returns
+        -------
+        ArchivedResponse
+            Or None if the request was not recorded
+        """
+        key = ResponseArchive.key(method, url, fields)
+        with self._lock:
+            if f"{key}.json" not in self._names:
+                return None
+            meta = json.loads(self._zip.read(f"{key}.json"))
+            data = self._zip.read(f"{key}.body")
+        return ArchivedResponse(meta["status"], meta["headers"], data)
+
+    def put(self, method : str, url : str, fields : dict, headers : dict, response) -> bool:
+        """Record the response to a request
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method, e.g. GET
+        url : str
+            The URL the request was sent to, or the path on the site
+        fields : dict
+            The query parameters of the request, or None
+        headers : dict
+            The headers sent with the request, or None
+        response : urllib3.HTTPResponse
+            Or any object with status, headers and data attributes
+
+        Returns
+        -------
+        bool
+            False if a response to the request was already recorded
+        """
+        key = ResponseArchive.key(method, url, fields)
+        rheaders = dict((k, v) for k, v in response.headers.items()
+                        if k.lower() not in ["content-encoding", "content-length"])
+        meta = {
+            "method": method, "url": Endpoints().name(url), "fields": fields, "request_headers": headers,
+            "status": response.status, "headers": rheaders
+        }
+        with self._lock:
+            if f"{key}.json" in self._names:
+                return False
+            self._zip.writestr(f"{key}.body", response.data or b"")
+            # The metadata is written last as its presence marks the
+            # response as recorded
+            self._zip.writestr(f"{key}.json", json.dumps(meta, default=str))
+            self._names.update([f"{key}.body", f"{key}.json"])
+        return True
+
+    def close(self):
+        """Close the archive, writing its directory if it was opened to add responses"""
+        with self._lock:
+            self._zip.close()
+
+    @staticmethod
+    def key(method : str, url : str, fields : dict = None) -> str:
+        """Get the key of a request
+
+        Requests differing only in field order, or in whether a document
+        on the site is given by its URL or path, have the same key.
+        """
+        kfields = None
+        if fields is not None:
+            kfields = sorted((str(k), str(v)) for k, v in fields.items())
+        return hashlib.sha256(json.dumps([method, Endpoints().name(url), kfields]).encode("utf-8")).hexdigest()
+
+class RecordingTransport(object):
+    """Sends requests and records their responses in a ResponseArchive
+
+    Use this in place of the urllib3 PoolManager of API objects,
+    e.g. with the transport parameter of `Client`. Responses with
+    status 304 are not recorded as they have no body.
+    """
+
+    def __init__(self, archive : ResponseArchive, http : PoolManager = None, base_url : str = Endpoints.SITE_URL):
+        """Constructor for the RecordingTransport class
+
+        Parameters
+        ----------
+        archive : ResponseArchive
+            The archive to record responses in, opened with mode "a"
+        http : PoolManager
+            The pool to send requests with. If None then the
+            pool shared by the API classes is used.
+        base_url : str
+            The base URL of the `Endpoints` the requests are sent to,
+            so that they are recorded by their path on the site
+            [default: Endpoints.SITE_URL]
+        """
+        if http is None:
+            http = API.__http__
+        self._archive = archive
+        self._http = http
+        self._endpoints = Endpoints(base_url)
+
+    @property
+    def archive(self) -> ResponseArchive:
+        return self._archive
+
+    def request(self, method : str, url : str, fields : dict = None, headers : dict = None, **kwargs):
+        rslt = self._http.request(method, url, fields=fields, headers=headers, **kwargs)
+        if rslt.status != 304:
+            self._archive.put(method, self._endpoints.name(url), fields, headers, rslt)
+        return rslt
+
+class ReplayTransport(object):
+    """Serves the responses recorded in a ResponseArchive
+
+    Use this in place of the urllib3 PoolManager of API objects,
+    e.g. with the transport parameter of `Client`, to run without
+    a network. A request that was not recorded raises a
+    MissingRecordingException.
+    """
+
+    def __init__(self, archive : ResponseArchive, base_url : str = Endpoints.SITE_URL):
+        """Constructor for the ReplayTransport class
+
+        Parameters
+        ----------
+        archive : ResponseArchive
+            The archive to serve responses from
+        base_url : str
+            The base URL of the `Endpoints` the requests are sent to
+            [default: Endpoints.SITE_URL]
+        """
+        self._archive = archive
+        self._endpoints = Endpoints(base_url)
+
+    @property
+    def archive(self) -> ResponseArchive:
+        return self._archive
+
+    def request(self, method : str, url : str, fields : dict = None, headers : dict = None, **kwargs) -> ArchivedResponse:
+        # Conditional request headers are ignored; the recorded
+        # response is always served in full.
+        rslt = self._archive.get(method, self._endpoints.name(url), fields)
+        if rslt is None:
+            raise MissingRecordingException("no response recorded for {} {} {}".format(method, url, fields))
+        return rslt
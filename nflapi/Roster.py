@@ -14,6 +14,10 @@ class RosterRowFilter(CachedRowFilter):
     def __init__(self, team : str):
         self._team = team
 
+    @property
+    def key(self) -> tuple:
+        return (self._team,)
+
     def test(self, row : dict) -> bool:
         x = False
         if "team" in row.keys():
@@ -29,10 +33,13 @@ class Roster(CachedAPI):
     -------
     getRoster(team : str, return_type : ListOrDataFrame = list) -> ListOrDataFrame
     """
+    _diskCacheResource = "roster"
+    _urlPattern = "/teams/roster"
+    _parseInPool = True
     
     def __init__(self):
         """Constructor for the Roster class"""
-        super(Roster, self).__init__("http://www.nfl.com/teams/roster", RosterContentHandler())
+        super(Roster, self).__init__("/teams/roster", RosterContentHandler())
 
     def getRoster(self, team : str, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
         """Retrieve team roster
@@ -1,8 +1,9 @@
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag, SoupStrainer
 import pandas
-from nflapi.AbstractContentHandler import AbstractContentHandler
+from nflapi.BSContentHandler import BSContentHandler
 from nflapi.BSTagFilter import BSTagFilter
 from nflapi.RosterParser import RosterParser
+from nflapi.Endpoints import Endpoints
 
 class RosterFilter(BSTagFilter):
     def match(self, tag : Tag) -> bool:
@@ -10,9 +11,14 @@ class RosterFilter(BSTagFilter):
                 and tag.has_attr("class") and tag["class"] == ["data-table1"]
                 and tag.has_attr("id") and tag["id"] == "result")
 
-class RosterContentHandler(AbstractContentHandler):
+    @property
+    def strainer(self) -> SoupStrainer:
+        return SoupStrainer("table", id="result")
+
+class RosterContentHandler(BSContentHandler):
 
-    def __init__(self, team : str = None, domain : str = "http://www.nfl.com"):
+    def __init__(self, team : str = None, domain : str = Endpoints.SITE_URL, parser : str = None):
+        super(RosterContentHandler, self).__init__(parser)
         self._domain = domain
         self._team = team
         self._data = []
@@ -33,8 +39,8 @@ class RosterContentHandler(AbstractContentHandler):
         docstr : str
             The html document as a string
         """
-        soup = BeautifulSoup(docstr, "html.parser")
         filter = RosterFilter()
+        soup = self._makeSoup(docstr, filter)
         tags = soup.find_all(filter.match)
         # Parse data from the table tag
         parser = RosterParser(self._domain, self._team)
@@ -2,8 +2,11 @@ import os
 from urllib3 import PoolManager
 import pandas
 import xml.sax
+import datetime
+from typing import Union
 from nflapi.CachedAPI import CachedAPI, CachedRowFilter, ListOrDataFrame
 from nflapi.ScheduleContentHandler import ScheduleContentHandler
+import nflapi.Utilities as util
 
 class ScheduleRowFilter(CachedRowFilter):
     """Internal class used by the Schedule class
@@ -15,6 +18,10 @@ class ScheduleRowFilter(CachedRowFilter):
         self._season_type = season_type
         self._week = week
 
+    @property
+    def key(self) -> tuple:
+        return (self._season, self._season_type, self._week)
+
     def test(self, row : dict) -> bool:
         x = False
         if all([_ in row.keys() for _ in ["season", "season_type", "week"]]):
@@ -33,10 +40,28 @@ class Schedule(CachedAPI):
     getSchedule(season : int, season_type : str, week : int,
                 return_type : ListOrDataFrame = list) -> ListOrDataFrame
     """
+    _diskCacheResource = "schedule"
+    # Documents are parsed from bytes by the SAX parser
+    _parseBytes = True
+    _urlPattern = "/ajax/scorestrip"
 
-    def __init__(self):
-        """Constructor for the Schedule class"""
-        super(Schedule, self).__init__("http://www.nfl.com/ajax/scorestrip", ScheduleContentHandler())
+    def __init__(self, native_datetimes : bool = False):
+        """Constructor for the Schedule class
+
+        Parameters
+        ----------
+        native_datetimes : bool
+            If True then the start_time and date of each game are the
+            timezone aware (US Eastern) pandas.Timestamp of the kickoff,
+            which become datetime64 columns in a pandas.DataFrame. If
+            False then they are time.struct_time values. [default: False]
+        """
+        super(Schedule, self).__init__("/ajax/scorestrip", ScheduleContentHandler(native_datetimes))
+        self._native_datetimes = native_datetimes
+
+    @property
+    def native_datetimes(self) -> bool:
+        return self._native_datetimes
 
     def getSchedule(self, season : int, season_type : str, week : int, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
         """Retrieve games played or to be played for a given week
@@ -65,6 +90,17 @@ class Schedule(CachedAPI):
         list or pandas.DataFrame
             Which type is returned is determined by the `return_type` parameter
         """
+        return self._fetch(*self._weekQuery(season, season_type, week), return_type)
+
+    def _weekQuery(self, season : int, season_type : str, week : int) -> tuple:
+        """Get the query and row filter for a week's schedule
+
+        Parameters are as for `getSchedule`.
+
+        Returns
+        -------
+        tuple of (dict, ScheduleRowFilter)
+        """
         assert season_type in ["preseason", "regular_season", "postseason"]
         wrng = range(1, 18)
         if season_type == "preseason":
@@ -82,8 +118,18 @@ class Schedule(CachedAPI):
                 week += 1
         st = {"preseason": "PRE", "regular_season": "REG", "postseason": "POST"}
         query = {"season": season, "seasonType": st[season_type], "week": week}
-        rf = ScheduleRowFilter(season, season_type, week)
-        return self._fetch(query, rf, return_type)
+        return (query, ScheduleRowFilter(season, season_type, week))
+
+    def _diskCacheTTL(self, query_doc : dict = None) -> float:
+        ttl = super(Schedule, self)._diskCacheTTL(query_doc)
+        if query_doc["season"] < util.getSeason(datetime.date.today()):
+            # The schedule of a past season will not change
+            ttl = None
+        return ttl
+
+    @property
+    def _parseVariant(self) -> str:
+        return "native_datetimes" if self._native_datetimes else None
 
-    def _parseDocument(self, docstr : str):
+    def _parseDocument(self, docstr : Union[str, bytes]):
         xml.sax.parseString(docstr, self._handler)
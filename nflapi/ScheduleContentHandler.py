@@ -1,13 +1,26 @@
 import xml.sax
+import numpy
 import pandas
 import time
 import re
 from nflapi.AbstractContentHandler import AbstractContentHandler
+import nflapi.Utilities as util
 
 class ScheduleContentHandler(AbstractContentHandler, xml.sax.ContentHandler):
     """SAX content handler for parsing a schedule XML file"""
 
-    def __init__(self):
+    def __init__(self, native_datetimes : bool = False):
+        """Constructor for the ScheduleContentHandler class
+
+        Parameters
+        ----------
+        native_datetimes : bool
+            If True then start_time and date are both the timezone aware
+            (US Eastern) pandas.Timestamp of the kickoff, computed for all
+            games of the document at once. If False then they are
+            time.struct_time values. [default: False]
+        """
+        self._native_datetimes = native_datetimes
         self._reset()
 
     @property
@@ -35,6 +48,11 @@ class ScheduleContentHandler(AbstractContentHandler, xml.sax.ContentHandler):
         # We reset our data so as to not be tainted by previous uses of the handler
         self._reset()
 
+    def endDocument(self):
+        # This is called by the sax parser when it has finished processing a document
+        if self._native_datetimes and len(self._data) > 0:
+            self._set_datetimes()
+
     def startElement(self, name, attrs):
         # This is called by the sax parser when a new element is started
         if name == "gms":
@@ -96,10 +114,11 @@ class ScheduleContentHandler(AbstractContentHandler, xml.sax.ContentHandler):
         d["week"] = self.week
         d["finished"] = d["quarter"] in ["F", "FO"]
         
-        # Need to parse the start time to a datetime
-        d = self._update_start_time(d)
-        # Now set the game date
-        d = self._set_game_date(d)
+        if not self._native_datetimes:
+            # Need to parse the start time to a datetime
+            d = self._update_start_time(d)
+            # Now set the game date
+            d = self._set_game_date(d)
 
         if self._season_type is None:
             # We couldn't determine season type from the gms element
@@ -120,6 +139,24 @@ class ScheduleContentHandler(AbstractContentHandler, xml.sax.ContentHandler):
         d["start_time"] = time.strptime("{} {} -0500".format(rtime, meridiem), "%I:%M %p %z")
         return d
 
+    def _set_datetimes(self):
+        """Set start_time and date of every game to its kickoff time
+
+        The date and time strings of all the games are built and
+        parsed at once rather than game by game.
+        """
+        gms = pandas.DataFrame(self._data, columns=["gsis_id", "start_time"])
+        # As in _update_start_time we have to guess whether the
+        # start time is AM or PM
+        hour = gms["start_time"].str.split(":").str[0].astype(int)
+        meridiem = numpy.where(hour > 8, " AM", " PM")
+        # The first 8 digits of the gsis_id are the date
+        dtstrs = gms["gsis_id"].str.slice(0, 8) + " " + gms["start_time"] + meridiem
+        dts = util.localizeEastern(pandas.to_datetime(dtstrs, format="%Y%m%d %I:%M %p"))
+        for d, dt in zip(self._data, dts):
+            d["start_time"] = dt
+            d["date"] = dt
+
     def _set_game_date(self, d : dict) -> dict:
         # Add date to the game dictionary
         # We can determine the value from the gsis_id value and the start time
@@ -0,0 +1,233 @@
+import os
+import re
+import glob
+import time
+import zlib
+import gzip
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from urllib3 import PoolManager
+from nflapi.Endpoints import Endpoints
+
+class StandInServer(object):
+    """A local HTTP server that stands in for nfl.com
+
+    The server serves documents from a directory of files named like
+    those in the package tests/data directory at the URLs the API
+    classes request them from:
+
+    - /ajax/scorestrip?season=2018&seasonType=REG&week=16
+      serves schedule_2018_reg_16.xml
+    - /teams/roster?team=KC serves roster_kc.html
+    - /player/patrickmahomes/2558125/profile serves profile_patrick_mahomes.html
+    - /player/patrickmahomes/2558125/gamelogs?season=2018
+      serves gamelogs_patrick_mahomes_2018.html
+    - /liveupdate/game-center/2018122314/2018122314_gtd.json
+      serves game_2018122314_gtd.json
+
+    A schedule week with no file is served as a week with no games,
+    as nfl.com does, and other documents with no file are not found.
+    With substitute True another file of the same kind is served
+    instead, so that a whole season can be retrieved from a few files.
+
+    Each response may be delayed, to simulate the network, and a
+    proportion of requests may be answered with an error status.
+    Documents are gzip compressed for clients that accept it, as
+    nfl.com does, unless compress is False.
+    """
+
+    def __init__(self, data_dir : str, host : str = "127.0.0.1", port : int = 0,
+                 latency : float = 0.0, jitter : float = 0.0, error_rate : float = 0.0,
+                 error_status : int = 503, substitute : bool = False, seed : int = None,
+                 compress : bool = True):
+        """Constructor for the StandInServer class
+
+        Parameters
+        ----------
+        data_dir : str
+            The directory of the files to serve
+        host : str
+            The address to listen on [default: "127.0.0.1"]
+        port : int
+            The port to listen on. If 0 then a free port is chosen. [default: 0]
+        latency : float
+            The seconds to wait before each response [default: 0.0]
+        jitter : float
+            Up to this many more seconds, chosen at random, are waited [default: 0.0]
+        error_rate : float
+            The proportion of requests answered with error_status [default: 0.0]
+        error_status : int
+            The status of injected errors [default: 503]
+        substitute : bool
+            Should another file of the same kind be served for documents
+            that have no file [default: False]
+        seed : int
+            Seeds the random delays and errors [default: None]
+        compress : bool
+            Should documents be gzip compressed for clients that send
+            Accept-Encoding: gzip [default: True]
+        """
+        assert 0 <= error_rate <= 1, f"error_rate {error_rate} is not valid"
+        self._data_dir = data_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.substitute = substitute
+        self.compress = compress
+        self._gzipped = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._files = self._indexFiles(data_dir)
+        self._server = ThreadingHTTPServer((host, port), _StandInRequestHandler)
+        self._server.daemon_threads = True
+        self._server.standin = self
+        self._thread : threading.Thread = None
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server, e.g. http://127.0.0.1:8080"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        with self._lock:
+            return self._request_count
+
+    def start(self):
+        """Serve requests in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving requests"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def endpoints(self, http : PoolManager = None) -> Endpoints:
+        """Get the Endpoints that send requests for nfl.com to this server
+
+        Use it with the endpoints parameter of `Client`.
+
+        Parameters
+        ----------
+        http : PoolManager
+            The pool to send requests with. If None then the API
+            objects keep their own. [default: None]
+        """
+        return Endpoints(self.url, http)
+
+    def _indexFiles(self, data_dir : str) -> dict:
+        """Index the files by kind and the values in their names"""
+        files = {"schedule": {}, "roster": {}, "profile": {}, "gamelogs": {}, "game": {}}
+        patterns = [
+            ("schedule", r"^schedule_(\d{4})_(pre|reg|post)_(\d+)\.xml$"),
+            ("roster", r"^roster_([a-z]+)\.html$"),
+            ("profile", r"^profile_([a-z_]+)\.html$"),
+            ("gamelogs", r"^gamelogs_([a-z_]+?)_(\d{4})\.html$"),
+            ("game", r"^game_(\d+)_gtd\.json$")
+        ]
+        for path in sorted(glob.glob(os.path.join(data_dir, "*"))):
+            fname = os.path.basename(path)
+            for kind, pattern in patterns:
+                m = re.search(pattern, fname)
+                if m is not None:
+                    # Player pages are requested by the player's
+                    # name without separators, e.g. patrickmahomes
+                    key = tuple(g.replace("_", "") for g in m.groups())
+                    files[kind][key] = path
+        return files
+
+    def _route(self, path : str, query : dict) -> tuple:
+        """Get the kind of document and key of the file for a request"""
+        m = re.search(r"^/player/([^/]+)/\d+/(profile|gamelogs)$", path)
+        if path == "/ajax/scorestrip":
+            route = ("schedule", (query.get("season"), query.get("seasonType", "").lower(), query.get("week")))
+        elif path == "/teams/roster":
+            route = ("roster", (query.get("team", "").lower(),))
+        elif m is not None and m.group(2) == "profile":
+            route = ("profile", (m.group(1),))
+        elif m is not None:
+            route = ("gamelogs", (m.group(1), query.get("season")))
+        else:
+            m = re.search(r"^/liveupdate/game-center/(\d+)/\d+_gtd\.json$", path)
+            route = ("game", (m.group(1),)) if m is not None else (None, None)
+        return route
+
+    def _respond(self, path : str, query : dict, accept_encoding : str = None) -> tuple:
+        """Get the (status, content type, body, content encoding) of the response to a request"""
+        with self._lock:
+            self._request_count += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            return (self.error_status, "text/plain", b"injected error", None)
+        kind, key = self._route(path, query)
+        if kind is None:
+            return (404, "text/plain", b"not found", None)
+        files = self._files[kind]
+        fpath = files.get(key)
+        if fpath is None and self.substitute and len(files) > 0:
+            # Choose the same file each time for the same document
+            fpath = sorted(files.values())[zlib.crc32(repr(key).encode("utf-8")) % len(files)]
+        ctype = {"schedule": "text/xml", "game": "application/json"}.get(kind, "text/html")
+        if fpath is None:
+            if kind == "schedule":
+                season, _, week = key
+                body = f'<?xml version="1.0" encoding="UTF-8"?>\n<ss><gms gd="0" w="{week}" y="{season}" t="R"></gms></ss>'
+                return (200, "text/xml; charset=UTF-8", body.encode("utf-8"), None)
+            return (404, "text/plain", b"not found", None)
+        if self.compress and accept_encoding is not None and "gzip" in accept_encoding:
+            return (200, f"{ctype}; charset=UTF-8", self._gzip(fpath), "gzip")
+        with open(fpath, "rb") as fp:
+            return (200, f"{ctype}; charset=UTF-8", fp.read(), None)
+
+    def _gzip(self, fpath : str) -> bytes:
+        """Get the gzip compressed content of a file, compressing it once"""
+        with self._lock:
+            body = self._gzipped.get(fpath)
+        if body is None:
+            with open(fpath, "rb") as fp:
+                body = gzip.compress(fp.read())
+            with self._lock:
+                self._gzipped[fpath] = body
+        return body
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    # Keep connections alive, as nfl.com does
+    protocol_version = "HTTP/1.1"
+    # Send the body without waiting for the headers to be
+    # acknowledged, which delays small responses by ~40 ms
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        status, ctype, body, encoding = self.server.standin._respond(url.path, query,
+                                                                      self.headers.get("Accept-Encoding"))
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Requests are not logged to stderr
+        pass
@@ -0,0 +1,187 @@
+import re
+import time
+import logging
+import datetime
+import pandas
+from typing import Dict, List
+import nflgame.statmap as sm
+
+class TableSchema(object):
+    """The column types of a table of data returned by the Client
+
+    A column's type is a pandas dtype name, e.g. "Int64", "float64",
+    "string" or "boolean", which map to the corresponding Arrow and
+    Parquet types, or one of
+
+    - "timestamp": a struct_time or datetime, stored as a UTC timestamp
+    - "timeofday": a struct_time or datetime, stored as a "HH:MM" string
+    - None: the column is left as pandas infers it
+
+    Columns are looked up by name, then matched against the rules,
+    which are (regex, dtype) tuples tried in order, and otherwise
+    given the default type. The named columns are always present
+    in the output and come first.
+    """
+
+    def __init__(self, name : str, columns : Dict[str, str], rules : List[tuple] = None, default : str = None):
+        """Constructor for the TableSchema class
+
+        Parameters
+        ----------
+        name : str
+            The name of the table
+        columns : dict
+            The type of each of the table's fixed columns by column name
+        rules : list of tuple
+            (regex, dtype) tuples giving the type of columns that are
+            not named in `columns`, e.g. game statistics [default: None]
+        default : str
+            The type of columns matched by neither `columns` nor
+            `rules` [default: None]
+        """
+        self._name = name
+        self._columns = columns
+        self._rules = [(re.compile(p), t) for p, t in (rules or [])]
+        self._default = default
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def columns(self) -> Dict[str, str]:
+        return dict(self._columns)
+
+    def dtype(self, column : str) -> str:
+        """Get the type of a column"""
+        if column in self._columns:
+            return self._columns[column]
+        for pattern, dtype in self._rules:
+            if pattern.search(column):
+                return dtype
+        return self._default
+
+    def apply(self, data) -> pandas.DataFrame:
+        """Convert table data to its typed columns
+
+        Parameters
+        ----------
+        data : list of dict or pandas.DataFrame
+            The data as returned by the Client
+
+        Returns
+        -------
+        pandas.DataFrame
+            A new frame with the columns converted to their types
+        """
+        df = pandas.DataFrame(data)
+        typed = {}
+        # The named columns come first, in the order of the schema,
+        # so that every file written for the table has the same layout
+        for column in list(self._columns) + [c for c in df.columns if c not in self._columns]:
+            dtype = self.dtype(column)
+            if column in df.columns:
+                values = df[column]
+            else:
+                values = pandas.Series([None] * len(df), index=df.index, dtype=object)
+            if dtype is not None:
+                try:
+                    values = self._cast(values, dtype)
+                except (TypeError, ValueError) as e:
+                    if column in self._columns:
+                        raise
+                    # The column was typed by a rule, which may not
+                    # suit a statistic we have not seen before
+                    logging.warning("{} column {} not converted to {}: {}".format(self._name, column, dtype, e))
+            typed[column] = values
+        return pandas.DataFrame(typed, index=df.index)
+
+    def _cast(self, values : pandas.Series, dtype : str) -> pandas.Series:
+        if dtype == "timestamp":
+            return pandas.Series(pandas.to_datetime([_toDatetime(v) for v in values], utc=True),
+                                 index=values.index)
+        if dtype == "timeofday":
+            return pandas.Series([_toTimeOfDay(v) for v in values], index=values.index, dtype="string")
+        if dtype.startswith("datetime64"):
+            return pandas.to_datetime(values).astype(dtype)
+        if values.dtype == object:
+            # Missing values may be None or NaN
+            values = values.where(values.notna(), None)
+        return values.astype(dtype)
+
+def _toDatetime(v) -> datetime.datetime:
+    if isinstance(v, time.struct_time):
+        tz = None
+        if v.tm_gmtoff is not None:
+            tz = datetime.timezone(datetime.timedelta(seconds=v.tm_gmtoff))
+        v = datetime.datetime(*v[:6], tzinfo=tz)
+    elif v is None or pandas.isna(v):
+        v = None
+    return v
+
+def _toTimeOfDay(v) -> str:
+    if isinstance(v, time.struct_time):
+        v = time.strftime("%H:%M", v)
+    elif v is None or pandas.isna(v):
+        v = None
+    elif isinstance(v, datetime.datetime):
+        v = v.strftime("%H:%M")
+    return v
+
+# The game statistic fields whose values may be fractional,
+# e.g. defense_sk as sacks may be split between players
+_float_stats = sorted(set(f for info in sm.idmap.values() if info.get("value", 1) != int(info.get("value", 1))
+                          for f in info["fields"]))
+
+SCHEMAS : Dict[str, TableSchema] = dict((s.name, s) for s in [
+    TableSchema("schedule", {
+        "gsis_id": "string", "gamekey": "string", "season": "Int64", "season_type": "string",
+        "week": "Int64", "day_of_week": "string", "date": "timestamp", "start_time": "timeofday",
+        "quarter": "string", "finished": "boolean",
+        "home_team": "string", "home_team_name": "string", "home_team_score": "Int64",
+        "away_team": "string", "away_team_name": "string", "away_team_score": "Int64"
+    }),
+    TableSchema("roster", {
+        "team": "string", "number": "Int64", "last_name": "string", "first_name": "string",
+        "profile_id": "Int64", "profile_name": "string", "profile_url": "string",
+        "careerstats_url": "string", "gamelogs_url": "string", "gamesplits_url": "string",
+        "position": "string", "status": "string", "height": "string", "weight": "Int64",
+        "birthdate": "datetime64[ns]", "exp": "Int64", "college": "string"
+    }),
+    TableSchema("profile", {
+        "profile_id": "Int64", "first_name": "string", "last_name": "string", "team": "string",
+        "number": "Int64", "position": "string", "height": "string", "weight": "Int64",
+        "age": "Int64", "born": "string", "college": "string", "experience": "string",
+        "high_school": "string"
+    }, default="string"),
+    TableSchema("gamelogs", {
+        "profile_id": "Int64", "first_name": "string", "last_name": "string", "team": "string",
+        "season": "Int64", "season_type": "string", "wk": "Int64", "game_date": "timestamp",
+        "opp": "string", "result": "string"
+    }, rules=[(r"_(pct|avg|rate)$", "float64")], default="Int64"),
+    TableSchema("play", {
+        "gsis_id": "string", "drive_id": "string", "play_id": "string", "sp": "Int64",
+        "qtr": "Int64", "down": "Int64", "time": "string", "yrdln": "string", "yrdln_norm": "Int64",
+        "ydstogo": "Int64", "ydsnet": "Int64", "posteam": "string", "desc": "string", "note": "string",
+        "player_id": "string", "player_abrv_name": "string", "team": "string", "sequence": "Int64",
+        "stat_id": "Int64", "stat_cat": "string", "stat_desc": "string", "stat_desc_long": "string",
+        "stat_value": "float64", "stat_also": None
+    }, rules=[("^({})$".format("|".join(_float_stats)), "float64")], default="Int64"),
+    TableSchema("drive", {
+        "gsis_id": "string", "drive_id": "string", "posteam": "string", "qtr": "Int64",
+        "redzone": "boolean", "fds": "Int64", "result": "string", "penyds": "Int64",
+        "ydsgained": "Int64", "numplays": "Int64", "postime": "string",
+        "start_qtr": "Int64", "start_time": "string", "start_yrdln": "string",
+        "start_yrdln_norm": "Int64", "start_team": "string",
+        "end_qtr": "Int64", "end_time": "string", "end_yrdln": "string",
+        "end_yrdln_norm": "Int64", "end_team": "string"
+    }),
+    TableSchema("summary", {
+        "gsis_id": "string", "team": "string", "team_type": "string",
+        "player_id": "string", "player_abrv_name": "string", "team_top": "string"
+    }, rules=[("^({})$".format("|".join(_float_stats)), "float64")], default="Int64"),
+    TableSchema("score", {
+        "gsis_id": "string", "team": "string", "team_type": "string",
+        "q1": "Int64", "q2": "Int64", "q3": "Int64", "q4": "Int64", "q5": "Int64", "final": "Int64"
+    })
+])
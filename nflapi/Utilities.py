@@ -1,9 +1,13 @@
 import re
 import calendar
 import datetime
+import pandas
 from typing import List
 import nflgame.statmap as sm
 
+# The time zone of the times given by nfl.com
+EASTERN_TZ = "America/New_York"
+
 def parseYardLine(ydl : str, posteam : str) -> int:
     """Convert recorded yard line to a signed int
 
@@ -55,6 +59,46 @@ def getStatMetadata(statId : int) -> dict:
     dict
         See the description
     """
+    return dict(_statMetadata[statId])
+
+def expandStat(statId : int, yards, data : dict = None) -> dict:
+    """Get the values and metadata of a game play statistic
+
+    This gives the same result as `nflgame.statmap.values` updated
+    with `getStatMetadata`, but from tables computed once at import,
+    so that expanding a statistic is a single lookup and merge.
+
+    Parameters
+    ----------
+    statId : int
+        The statId from the NFL API
+    yards
+        The yards value of the statistic; values that are not
+        integers are taken as 0
+    data : dict
+        If given then the values are added to this dict rather
+        than to a new one [default: None]
+
+    Returns
+    -------
+    dict
+        The statistic field values and the metadata
+    """
+    exp = _statExpansions.get(statId)
+    assert exp is not None, f"Category identifier {statId} is not known."
+    if data is None:
+        data = {}
+    ydsfield, consts = exp
+    if ydsfield is not None:
+        try:
+            yards = int(yards)
+        except (ValueError, TypeError):
+            yards = 0
+        data[ydsfield] = yards
+    data.update(consts)
+    return data
+
+def _makeStatMetadata(statId : int) -> dict:
     d = {"stat_id": statId}
     for k, v in sm.idmap[statId].items():
         if not k in ["fields", "yds"]:
@@ -65,6 +109,57 @@ def getStatMetadata(statId : int) -> dict:
             d[fk] = v
     return d
 
+def _makeStatExpansion(statId : int) -> tuple:
+    """Get the (yards field, constant values) of a statistic
+
+    The yards field is None when the statistic has no yardage.
+    The constant values are the statistic fields, which always
+    have the same value, followed by the metadata.
+    """
+    info = sm.idmap[statId]
+    consts = dict((f, info.get("value", 1)) for f in info["fields"])
+    consts.update(_statMetadata[statId])
+    return (info["yds"] or None, consts)
+
+_statMetadata = dict((statId, _makeStatMetadata(statId)) for statId in sm.idmap)
+_statExpansions = dict((statId, _makeStatExpansion(statId)) for statId in sm.idmap)
+
+def getSeason(dt : datetime.date) -> int:
+    """Get the season a date falls in
+
+    The NFL season begins in August or September and ends in
+    January or February of the following year.
+
+    Parameters
+    ----------
+    dt : datetime.date
+        The date
+
+    Returns
+    -------
+    int
+        The four digit year at the beginning of the season
+    """
+    syear = dt.year
+    if dt.month < 8:
+        syear -= 1
+    return syear
+
+def localizeEastern(dts : pandas.Series) -> list:
+    """Make US Eastern local times timezone aware
+
+    Parameters
+    ----------
+    dts : pandas.Series
+        datetime64 values in US Eastern local time
+
+    Returns
+    -------
+    list of pandas.Timestamp
+        The timezone aware times; missing values are NaT
+    """
+    return list(pandas.Series(dts).dt.tz_localize(EASTERN_TZ, ambiguous="NaT", nonexistent="shift_forward"))
+
 def getFirstDate(year : int, month : int, day_of_week : int) -> datetime.date:
     dm : List[list] = calendar.monthcalendar(year, month)
     fdar = [i for i in range(0, len(dm[0])) if dm[0][i] > 0]
@@ -1,8 +1,10 @@
 import unittest
+import tempfile
 import pandas
 from nflapi.API import API
 from nflapi.AbstractContentHandler import AbstractContentHandler
-from nflapi.Exceptions import MissingDocumentException
+from nflapi.Exceptions import MissingDocumentException, ResponseStatusException
+from nflapi.DiskCache import DiskCache
 
 class TestAPI(unittest.TestCase):
 
@@ -12,16 +14,106 @@ class TestAPI(unittest.TestCase):
         with self.assertRaisesRegex(MissingDocumentException, "document {} does not exist".format(url)):
             api._processQuery()
 
+    def test__queryAPI_error_status(self):
+        api = MockAPI("http://localhost/doc", MockContentHandler())
+        api._http = MockHttp(b"injected error", 503)
+        with self.assertRaisesRegex(ResponseStatusException, "document http://localhost/doc failed with status 503"):
+            api._queryAPI()
+        self.assertIsNone(api.getDocumentText())
+
+    def test__queryAPI_disk_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            api = MockAPI("http://localhost/doc", MockContentHandler())
+            api._http = MockHttp(b"<doc/>")
+            api._diskCache = DiskCache(tmpdir, ttls={"mock": None})
+            api._diskCacheResource = "mock"
+            api._processQuery({"q": 1})
+            self.assertEqual(api.getDocumentText(), "<doc/>")
+            # A new object sharing the directory need not send the request
+            api2 = MockAPI("http://localhost/doc", MockContentHandler())
+            api2._http = MockHttp(b"<other/>")
+            api2._diskCache = DiskCache(tmpdir, ttls={"mock": None})
+            api2._diskCacheResource = "mock"
+            self.assertEqual(api2._queryAPI({"q": 1}), "<doc/>")
+            self.assertEqual(api2._http.count, 0, "request count not expected")
+            self.assertEqual(api2._queryAPI({"q": 2}), "<other/>")
+            self.assertEqual(api2._http.count, 1, "request count not expected")
+
+    def test__processQuery_disk_cache_not_stored(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir, ttls={"mock": None})
+            api = MockAPI("http://localhost/doc", MockContentHandler())
+            api._http = MockHttp(b"injected error", 503)
+            api._diskCache = cache
+            api._diskCacheResource = "mock"
+            with self.assertRaises(ResponseStatusException):
+                api._processQuery()
+            self.assertEqual(cache._files(), [], "error response stored")
+            # Nor is a document that cannot be parsed
+            api._http = MockHttp(b"<doc>")
+            api._parseError = ValueError("not well formed")
+            with self.assertRaises(ValueError):
+                api._processQuery()
+            self.assertEqual(cache._files(), [], "document that cannot be parsed stored")
+            api._parseError = None
+            api._processQuery()
+            self.assertEqual(len(cache._files()), 1)
+
+    def test__queryAPI_bytes(self):
+        api = MockAPI("http://localhost/doc", MockContentHandler())
+        api._http = MockHttp("<doc>caf\u00e9</doc>".encode("utf-8"))
+        self.assertEqual(api._queryAPI(), "<doc>caf\u00e9</doc>")
+        api._parseBytes = True
+        self.assertEqual(api._queryAPI(), "<doc>caf\u00e9</doc>".encode("utf-8"))
+        # Other charsets are always decoded
+        rslt = MockResponse(200, "<doc>caf\u00e9</doc>".encode("iso-8859-1"))
+        rslt.headers = {"Content-Type": "text/xml; charset=\"ISO-8859-1\"; q=1"}
+        self.assertEqual(api._getResponseCharset(rslt), "iso-8859-1")
+        self.assertEqual(api._document(rslt.data, "iso-8859-1"), "<doc>caf\u00e9</doc>")
+        rslt.headers = {"Content-Type": "text/xml"}
+        self.assertIsNone(api._getResponseCharset(rslt))
+
+    def test__queryAPI_disk_cache_ttl_zero(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            api = MockAPI("http://localhost/doc", MockContentHandler())
+            api._http = MockHttp(b"<doc/>")
+            api._diskCache = DiskCache(tmpdir)
+            api._queryAPI()
+            api._queryAPI()
+            self.assertEqual(api._http.count, 2, "request count not expected")
+
+class MockResponse(object):
+
+    def __init__(self, status : int, data : bytes):
+        self.status = status
+        self.data = data
+        self.headers = {"Content-Type": "text/xml; charset=utf-8"}
+
+class MockHttp(object):
+    """Stands in for the urllib3 PoolManager"""
+
+    def __init__(self, data : bytes, status : int = 200):
+        self.data = data
+        self.status = status
+        self.count = 0
+
+    def request(self, method : str, url : str, fields : dict = None, **kwargs) -> MockResponse:
+        self.count += 1
+        return MockResponse(self.status, self.data)
+
 class MockAPI(API):
 
     def __init__(self, srcurl : str, handler : AbstractContentHandler):
         super(MockAPI, self).__init__(srcurl, handler)
         self._doc_string : str = None
+        self._parseError : Exception = None
 
     def getDocumentText(self) -> str:
         return self._doc_string
 
     def _parseDocument(self, docstr : str):
+        if self._parseError is not None:
+            raise self._parseError
         self._doc_string = docstr
 
 class MockContentHandler(AbstractContentHandler):
@@ -0,0 +1,115 @@
+import unittest
+import tempfile
+from nflapi.APIStats import APIStats
+from nflapi.Client import Client
+from nflapi.DiskCache import DiskCache
+from nflapi.HttpPool import HttpPool
+from nflapi.Schedule import Schedule
+from nflapi.StandInServer import StandInServer
+from tests.TestAPI import MockHttp
+
+class TestAPIStats(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/schedule_2018_reg_15.xml", "rb") as fp:
+            self.xmlbytes = fp.read()
+
+    def getSchedule(self, stats : APIStats) -> Schedule:
+        sched = Schedule()
+        sched._http = MockHttp(self.xmlbytes)
+        sched._stats = stats
+        return sched
+
+    def test_record(self):
+        stats = APIStats()
+        events = []
+        stats.subscribe(events.append)
+        stats.recordFetch("/a", 0.5, 100, 200)
+        stats.recordFetch("/a", 1.5, 0, 503)
+        stats.recordFetch("/b", 0.25, 0, None)
+        stats.recordParse("/a", 0.125)
+        stats.recordCache("/a", "memory", True)
+        got = dict((s["pattern"], s) for s in stats.summary())
+        self.assertEqual(list(got.keys()), ["/a", "/b"])
+        self.assertEqual(got["/a"]["requests"], 2)
+        self.assertEqual(got["/a"]["errors"], 1)
+        self.assertEqual(got["/a"]["bytes"], 100)
+        self.assertEqual(got["/a"]["fetch_seconds"], 2.0)
+        self.assertEqual(got["/a"]["fetch_mean_seconds"], 1.0)
+        self.assertEqual(got["/a"]["fetch_max_seconds"], 1.5)
+        self.assertEqual(got["/a"]["status"], {200: 1, 503: 1})
+        self.assertEqual(got["/a"]["parse_seconds"], 0.125)
+        self.assertEqual(got["/a"]["memory_hits"], 1)
+        self.assertEqual(got["/b"]["errors"], 1)
+        self.assertEqual([e["event"] for e in events], ["fetch", "fetch", "fetch", "parse", "cache"])
+        self.assertEqual(events[-1], {"pattern": "/a", "event": "cache", "cache": "memory", "hit": True})
+        stats.clear()
+        self.assertEqual(stats.summary(), [])
+
+    def test_schedule(self):
+        stats = APIStats()
+        sched = self.getSchedule(stats)
+        sched.getSchedule(2018, "regular_season", 15)
+        sched.getSchedule(2018, "regular_season", 15)
+        got = stats.summary()
+        self.assertEqual(len(got), 1)
+        got = got[0]
+        self.assertEqual(got["pattern"], "/ajax/scorestrip")
+        self.assertEqual(got["requests"], 1)
+        self.assertEqual(got["bytes"], len(self.xmlbytes))
+        self.assertEqual(got["status"], {200: 1})
+        self.assertEqual(got["parses"], 1)
+        self.assertEqual((got["memory_hits"], got["memory_misses"]), (1, 1))
+        self.assertGreater(got["parse_seconds"], 0)
+
+    def test_schedule_compressed(self):
+        stats = APIStats()
+        with StandInServer("tests/data") as server:
+            http = HttpPool()
+            sched = Schedule()
+            sched._endpoints = server.endpoints(http)
+            sched._stats = stats
+            sched.getSchedule(2018, "regular_season", 15)
+        got = stats.summary()[0]
+        # The size received is recorded rather than that decompressed
+        self.assertEqual(got["bytes"], http.metrics()["bytes_received"])
+        self.assertLess(got["bytes"], len(self.xmlbytes) / 3)
+
+    def test_schedule_disk_cache(self):
+        stats = APIStats()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for _ in range(2):
+                sched = self.getSchedule(stats)
+                sched._diskCache = DiskCache(tmpdir, ttls={"schedule": None})
+                sched.getSchedule(2018, "regular_season", 15)
+        got = stats.summary()[0]
+        self.assertEqual(got["requests"], 1)
+        self.assertEqual((got["disk_hits"], got["disk_misses"]), (1, 1))
+        self.assertEqual(got["parses"], 1, "rows stored with the document not restored")
+
+    def test_client_getStats(self):
+        client = Client()
+        sched = self.getSchedule(client.stats)
+        client._schedule = sched
+        client.getSchedule(2018, "regular_season", 15)
+        got = client.getStats()
+        self.assertEqual([s["pattern"] for s in got], ["/ajax/scorestrip"])
+        self.assertEqual(got[0]["requests"], 1)
+
+    def test_fetch_error(self):
+        stats = APIStats()
+        sched = self.getSchedule(stats)
+        sched._http = FailingHttp()
+        with self.assertRaises(ConnectionError):
+            sched.getSchedule(2018, "regular_season", 15)
+        got = stats.summary()[0]
+        self.assertEqual((got["requests"], got["errors"]), (1, 1))
+        self.assertEqual(got["status"], {None: 1})
+
+class FailingHttp(object):
+
+    def request(self, method : str, url : str, fields : dict = None, **kwargs):
+        raise ConnectionError("no route to host")
+
+if __name__ == "__main__":
+    unittest.main()
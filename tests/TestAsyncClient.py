@@ -0,0 +1,90 @@
+import unittest
+import asyncio
+import json
+import pandas
+from nflapi.AsyncClient import AsyncClient
+from nflapi.AsyncTransport import AsyncTransport, AsyncResponse
+from nflapi.GameData import GameData
+import tests.TestSchedule as tsch
+
+class TestAsyncClient(unittest.TestCase):
+
+    def setUp(self):
+        GameData.__cache__.clear()
+
+    def tearDown(self):
+        GameData.__cache__.clear()
+
+    def getSchedules(self, gsis_ids : list) -> list:
+        with open("tests/data/schedule_2018_reg_16.json", "rt") as rfp:
+            sch = dict((s["gsis_id"], s) for s in json.load(rfp))
+        return [sch[g] for g in gsis_ids]
+
+    def run_client(self, transport : AsyncTransport, fun : callable):
+        async def run():
+            async with AsyncClient(transport, max_concurrency=2) as client:
+                return await fun(client)
+        return asyncio.run(run())
+
+    def test_getSchedule(self):
+        transport = MockTransport({"http://www.nfl.com/ajax/scorestrip": "tests/data/schedule_2018_reg_16.xml"})
+        got = self.run_client(transport, lambda c: c.getSchedule(2018, "regular_season", 16))
+        exp = tsch.getExpectedResults("tests/data/schedule_2018_reg_16.json", list)
+        self.assertEqual(got, exp)
+        self.assertEqual(transport.fields, [{"season": 2018, "seasonType": "REG", "week": 16}])
+
+    def test_getGamePlay_order(self):
+        gsis_ids = ["2018122314", "2018122313"]
+        url = "http://www.nfl.com/liveupdate/game-center/{g}/{g}_gtd.json"
+        transport = MockTransport(dict((url.format(g=g), f"tests/data/game_{g}_gtd.json") for g in gsis_ids))
+        got = self.run_client(transport, lambda c: c.getGamePlay(self.getSchedules(gsis_ids)))
+        exp = []
+        for g in gsis_ids:
+            with open(f"tests/data/game_{g}_play.json", "rt") as fp:
+                exp.extend(json.load(fp))
+        self.assertEqual(got, exp)
+        self.assertEqual(transport.max_in_flight, 2, "concurrency not expected")
+
+    def test_getGamePlay_columnar(self):
+        gsis_ids = ["2018122314", "2018122313", "2018122314"]
+        url = "http://www.nfl.com/liveupdate/game-center/{g}/{g}_gtd.json"
+        transport = MockTransport(dict((url.format(g=g), f"tests/data/game_{g}_gtd.json") for g in gsis_ids))
+        got = self.run_client(transport, lambda c: c.getGamePlay(self.getSchedules(gsis_ids), pandas.DataFrame, True))
+        exp = []
+        for g in gsis_ids:
+            with open(f"tests/data/game_{g}_play.json", "rt") as fp:
+                exp.extend(json.load(fp))
+        exp = pandas.DataFrame(exp)
+        pandas.testing.assert_frame_equal(got[exp.columns], exp)
+        self.assertEqual(transport.max_in_flight, 2, "concurrency not expected")
+
+    def test_getGameTables(self):
+        gsis_ids = ["2018122313"]
+        url = "http://www.nfl.com/liveupdate/game-center/{g}/{g}_gtd.json"
+        transport = MockTransport(dict((url.format(g=g), f"tests/data/game_{g}_gtd.json") for g in gsis_ids))
+        got = self.run_client(transport, lambda c: c.getGameTables(self.getSchedules(gsis_ids), ["score"]))
+        with open("tests/data/game_2018122313_score.json", "rt") as fp:
+            exp = {"score": json.load(fp)}
+        self.assertEqual(got, exp)
+
+class MockTransport(AsyncTransport):
+    """Serves the file mapped to the requested URL"""
+
+    def __init__(self, pathmap : dict):
+        self._pathmap = pathmap
+        self.fields = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request(self, method : str, url : str, fields : dict = None, headers : dict = None) -> AsyncResponse:
+        self.fields.append(fields)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Yield so that other requests may start
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        with open(self._pathmap[url], "rb") as fp:
+            return AsyncResponse(200, {"Content-Type": "text/plain; charset=utf-8"}, fp.read())
+
+if __name__ == "__main__":
+    unittest.main()
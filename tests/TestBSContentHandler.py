@@ -0,0 +1,78 @@
+import unittest
+from nflapi.BSContentHandler import BSContentHandler
+from nflapi.RosterContentHandler import RosterContentHandler
+from nflapi.PlayerProfileContentHandler import PlayerProfileContentHandler
+from nflapi.PlayerGameLogsContentHandler import PlayerGameLogsContentHandler
+
+try:
+    import lxml
+    has_lxml = True
+except ImportError:
+    has_lxml = False
+
+class TestBSContentHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.default_parser = BSContentHandler.DEFAULT_PARSER
+        self.strain_pages = BSContentHandler.STRAIN_PAGES
+
+    def tearDown(self):
+        BSContentHandler.DEFAULT_PARSER = self.default_parser
+        BSContentHandler.STRAIN_PAGES = self.strain_pages
+
+    def test_parser_default(self):
+        handler = RosterContentHandler("KC")
+        BSContentHandler.DEFAULT_PARSER = "html.parser"
+        self.assertEqual(handler.parser, "html.parser")
+        handler.parser = "lxml"
+        self.assertEqual(handler.parser, "lxml")
+
+    def parseWith(self, handler : BSContentHandler, htmlpath : str, parser : str) -> list:
+        handler.parser = parser
+        with open(htmlpath, "rt") as fp:
+            handler.parse(fp.read())
+        return handler.list
+
+    @unittest.skipUnless(has_lxml, "lxml is not installed")
+    def test_roster_lxml(self):
+        handler = RosterContentHandler("KC")
+        exp = self.parseWith(handler, "tests/data/roster_kc.html", "html.parser")
+        self.assertEqual(self.parseWith(handler, "tests/data/roster_kc.html", "lxml"), exp)
+
+    @unittest.skipUnless(has_lxml, "lxml is not installed")
+    def test_profile_lxml(self):
+        handler = PlayerProfileContentHandler()
+        exp = self.parseWith(handler, "tests/data/profile_tyreek_hill.html", "html.parser")
+        self.assertEqual(self.parseWith(handler, "tests/data/profile_tyreek_hill.html", "lxml"), exp)
+
+    @unittest.skipUnless(has_lxml, "lxml is not installed")
+    def test_gamelogs_lxml(self):
+        handler = PlayerGameLogsContentHandler(2018)
+        exp = self.parseWith(handler, "tests/data/gamelogs_harrison_butker_2018.html", "html.parser")
+        self.assertEqual(self.parseWith(handler, "tests/data/gamelogs_harrison_butker_2018.html", "lxml"), exp)
+
+    def parseStrained(self, handler : BSContentHandler, htmlpath : str, strain : bool) -> list:
+        BSContentHandler.STRAIN_PAGES = strain
+        return self.parseWith(handler, htmlpath, "html.parser")
+
+    def test_roster_strained(self):
+        handler = RosterContentHandler("KC")
+        exp = self.parseStrained(handler, "tests/data/roster_kc.html", False)
+        self.assertEqual(self.parseStrained(handler, "tests/data/roster_kc.html", True), exp)
+
+    def test_profile_strained(self):
+        handler = PlayerProfileContentHandler()
+        exp = self.parseStrained(handler, "tests/data/profile_patrick_mahomes.html", False)
+        self.assertEqual(self.parseStrained(handler, "tests/data/profile_patrick_mahomes.html", True), exp)
+
+    def test_gamelogs_strained(self):
+        handler = PlayerGameLogsContentHandler(2018)
+        exp = self.parseStrained(handler, "tests/data/gamelogs_patrick_mahomes_2018.html", False)
+        self.assertEqual(self.parseStrained(handler, "tests/data/gamelogs_patrick_mahomes_2018.html", True), exp)
+
+    def test_gamelogs_strained_other_season(self):
+        handler = PlayerGameLogsContentHandler(2017)
+        self.assertEqual(self.parseStrained(handler, "tests/data/gamelogs_patrick_mahomes_2018.html", True), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import os
+import json
+import tempfile
+import datetime
+from nflapi.Backfill import Backfill
+from nflapi.Client import Client
+from nflapi.GameTables import GameTables
+from tests.TestClient import MockWeekSchedule
+
+class TestBackfill(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.storedir = os.path.join(self._tmpdir.name, "store")
+        # A week 16 schedule of just the games we have game center data for
+        self.xmlpath = os.path.join(self._tmpdir.name, "schedule.xml")
+        with open("tests/data/schedule_2018_reg_16.xml", "rt") as ifp, open(self.xmlpath, "wt") as ofp:
+            for line in ifp:
+                if "<g " not in line or 'eid="2018122313"' in line or 'eid="2018122314"' in line:
+                    ofp.write(line)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def getClient(self, failing : set) -> Client:
+        client = Client(max_workers=2)
+        client._schedule = MockWeekSchedule({16: self.xmlpath})
+        client._gmtables = MockGsisGameTables(failing)
+        return client
+
+    def getExpected(self, table : str, gsis_ids : list) -> list:
+        data = []
+        for gsis_id in gsis_ids:
+            with open(f"tests/data/game_{gsis_id}_{table}.json", "rt") as fp:
+                data.extend(json.load(fp))
+        return data
+
+    def test_run_resume(self):
+        client = self.getClient({"2018122314"})
+        bf = Backfill(self.storedir, client)
+        counts = bf.run([2018], ["schedule", "play", "score"])
+        self.assertEqual(counts, {"completed": 2, "skipped": 0, "failed": 1})
+        self.assertEqual(sorted(bf.completed), ["game/2018122313", "schedule/2018"])
+        self.assertEqual(list(bf.failed.keys()), ["game/2018122314"])
+        self.assertEqual(len(bf.read("schedule", season=2018)), 2)
+        self.assertEqual(bf.read("play"), self.getExpected("play", ["2018122313"]))
+        self.assertEqual(bf.read("drive"), [], "table not requested was stored")
+        self.assertEqual(len(client._schedule.queried), len(client._scheduleWeeks(2018)))
+        self.assertEqual(client.schedule_latencies, {})
+        self.assertFalse(client._schedule._isInCache(client._schedule._weekQuery(2018, "regular_season", 16)[1]),
+                         "schedule retained in the client cache")
+
+        # A new run, e.g. after a restart, only retrieves the failed game
+        client = self.getClient(set())
+        bf = Backfill(self.storedir, client)
+        self.assertEqual(list(bf.failed.keys()), ["game/2018122314"])
+        counts = bf.run([2018], ["schedule", "play", "score"])
+        self.assertEqual(counts, {"completed": 1, "skipped": 2, "failed": 0})
+        self.assertEqual(bf.failed, {})
+        self.assertEqual(len(client._schedule.queried), 0, "completed schedule retrieved again")
+        self.assertEqual(client._gmtables.queried, ["2018122314"])
+        self.assertEqual(bf.read("score"), self.getExpected("score", ["2018122313", "2018122314"]))
+
+    def test_run_added_table(self):
+        bf = Backfill(self.storedir, self.getClient(set()))
+        self.assertEqual(bf.run([2018], ["score"]), {"completed": 3, "skipped": 0, "failed": 0})
+        self.assertEqual(bf.read("play"), [])
+        # The games are retrieved again for the table they have not written
+        client = self.getClient(set())
+        bf = Backfill(self.storedir, client)
+        self.assertEqual(bf.run([2018], ["score", "play"]), {"completed": 2, "skipped": 1, "failed": 0})
+        self.assertEqual(sorted(client._gmtables.queried), ["2018122313", "2018122314"])
+        self.assertEqual(bf.read("play"), self.getExpected("play", ["2018122313", "2018122314"]))
+        # Either table alone is now complete
+        self.assertEqual(bf.run([2018], ["play"]), {"completed": 0, "skipped": 3, "failed": 0})
+        self.assertEqual(bf.run([2018], ["score"]), {"completed": 0, "skipped": 3, "failed": 0})
+
+    def test_run_current_season(self):
+        client = self.getClient(set())
+        client._curdt = datetime.date(2018, 12, 24)
+        bf = Backfill(self.storedir, client, snapshot_ttls={"schedule": 0})
+        self.assertEqual(bf.run([2018], ["schedule"]), {"completed": 1, "skipped": 0, "failed": 0})
+        self.assertEqual(bf.completed, [], "current season schedule is complete")
+        # The schedule of the current season is retrieved again
+        client = self.getClient(set())
+        client._curdt = datetime.date(2018, 12, 24)
+        bf = Backfill(self.storedir, client, snapshot_ttls={"schedule": 0})
+        self.assertEqual(bf.run([2018], ["schedule"]), {"completed": 1, "skipped": 0, "failed": 0})
+        self.assertGreater(len(client._schedule.queried), 0)
+        # Once the season is over it is complete for good
+        client._curdt = datetime.date(2019, 10, 1)
+        bf = Backfill(self.storedir, client, snapshot_ttls={"schedule": 0})
+        self.assertEqual(bf.run([2018], ["schedule"]), {"completed": 1, "skipped": 0, "failed": 0})
+        self.assertEqual(bf.run([2018], ["schedule"]), {"completed": 0, "skipped": 1, "failed": 0})
+        # With the default TTL it is complete until it expires
+        client._curdt = datetime.date(2018, 12, 24)
+        bf = Backfill(os.path.join(self._tmpdir.name, "other"), client)
+        self.assertEqual(bf.run([2018], ["schedule"]), {"completed": 1, "skipped": 0, "failed": 0})
+        self.assertEqual(bf.run([2018], ["schedule"]), {"completed": 0, "skipped": 1, "failed": 0})
+        self.assertEqual(bf.completed, ["schedule/2018"])
+        self.assertEqual(bf._unitTTL("roster/KC"), Backfill.SNAPSHOT_TTLS["roster"])
+        self.assertEqual(bf._unitTTL("gamelogs/2018/2558125"), Backfill.SNAPSHOT_TTLS["gamelogs"])
+        self.assertIsNone(bf._unitTTL("gamelogs/2017/2558125"))
+
+    def test_run_invalid_table(self):
+        bf = Backfill(self.storedir, self.getClient(set()))
+        with self.assertRaises(AssertionError):
+            bf.run([2018], ["plays"])
+
+class MockGsisGameTables(GameTables):
+    """Serves the game center fixture of the game being queried"""
+    def __init__(self, failing : set):
+        super(MockGsisGameTables, self).__init__(False)
+        self._failing = failing
+        # Shared by the copies made for worker threads
+        self.queried = []
+
+    def _queryAPI(self, query_doc : dict) -> str:
+        gsisid = self._url.split("/")[-2]
+        self.queried.append(gsisid)
+        if gsisid in self._failing:
+            raise ConnectionError(f"game {gsisid} not available")
+        with open(f"tests/data/game_{gsisid}_gtd.json", "rt") as fh:
+            return fh.read()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,9 @@ from dateutil import relativedelta
 from nflapi.Client import Client
 from nflapi.Schedule import Schedule
 from nflapi.PlayerProfile import PlayerProfile
+from nflapi.GamePlay import GamePlay
+from nflapi.PlayerGameLogs import PlayerGameLogs
+import pandas
 import tests.TestSchedule as tsch
 import tests.TestPlayerProfile as tpprof
 
@@ -106,12 +109,150 @@ class TestClient(unittest.TestCase):
         for st, tester in tstmap.items():
             self.assertTrue(tester(wkmap[st]), f"{st} test failed")
 
+    def test_getSeasonSchedule(self):
+        self.client._schedule = MockWeekSchedule({
+            15: "tests/data/schedule_2018_reg_15.xml",
+            16: "tests/data/schedule_2018_reg_16.xml"
+        })
+        self.client.max_workers = 4
+        exp = tsch.getExpectedResults("tests/data/schedule_2018_reg_15.json", list)
+        exp.extend(tsch.getExpectedResults("tests/data/schedule_2018_reg_16.json", list))
+        got = self.client.getSeasonSchedule([2018], "regular_season")
+        self.assertEqual(got, exp)
+        self.assertEqual(sorted(self.client.schedule_latencies.keys()),
+                         [(2018, "regular_season", wk) for wk in range(1, 18)])
+        self.assertTrue(all(t >= 0 for t in self.client.schedule_latencies.values()))
+        self.assertEqual(len(self.client._schedule.queried), 17)
+        # The weeks with games are now cached and are not retrieved again
+        got = self.client.getSchedule(season=2018, season_type="regular_season")
+        self.assertEqual(got, exp)
+        self.assertEqual(len(self.client.schedule_latencies), 15)
+        self.assertEqual(len(self.client._schedule.queried), 32)
+
     def test_getPlayerProfile_invalid(self):
         self.client._playerProfile = tpprof.MockPlayerProfile("tests/data/invalid_profile.html")
         with open("tests/data/roster_kc.json", "rt") as fp:
             rosters = [r for r in json.load(fp) if r["profile_name"] == "nickallegretti"]
         self.assertEqual(self.client.getPlayerProfile(rosters, list), [])
 
+    def test_getPlayerProfile_max_workers(self):
+        with open("tests/data/roster_kc.json", "rt") as fp:
+            rosters = dict((r["profile_name"], r) for r in json.load(fp))
+        htmlmap = {
+            rosters["patrickmahomes"]["profile_url"]: "tests/data/profile_patrick_mahomes.html",
+            rosters["tyreekhill"]["profile_url"]: "tests/data/profile_tyreek_hill.html"
+        }
+        rlist = [rosters[n] for n in ["tyreekhill", "patrickmahomes"] * 3]
+        self.client._playerProfile = MockUrlPlayerProfile(htmlmap)
+        exp = self.client.getPlayerProfile(rlist, list)
+        self.client._playerProfile = MockUrlPlayerProfile(htmlmap)
+        self.client.max_workers = 4
+        got = self.client.getPlayerProfile(rlist, list)
+        self.assertEqual([d["last_name"] for d in got], ["Hill", "Mahomes"] * 3, "order not expected")
+        self.assertEqual(got, exp)
+        self.assertEqual(set(self.client._playerProfile._cacheIndex.keys()),
+                         {(rosters["patrickmahomes"]["profile_id"],), (rosters["tyreekhill"]["profile_id"],)},
+                         "cache not shared with workers")
+
+    def getGameSchedules(self) -> list:
+        with open("tests/data/schedule_2018_reg_16.json", "rt") as fp:
+            sch = dict((s["gsis_id"], s) for s in json.load(fp))
+        return [sch[g] for g in ["2018122314", "2018122313"] * 2]
+
+    def test_iterGamePlay(self):
+        self.client._gmplay = MockGsisGamePlay()
+        schedules = self.getGameSchedules()
+        exp = self.client.getGamePlay(schedules, list)
+        self.client._gmplay = MockGsisGamePlay()
+        self.client.max_workers = 2
+        it = self.client.iterGamePlay(iter(schedules), list)
+        self.assertEqual(next(it), exp[0])
+        self.assertEqual([exp[0]] + list(it), exp)
+        self.assertEqual(len(self.client._gmplay.cache), 0, "streamed games retained in cache")
+
+    def test_getGamePlay_columnar(self):
+        self.client._gmplay = MockGsisGamePlay()
+        schedules = self.getGameSchedules()
+        exp = self.client.getGamePlay(schedules, pandas.DataFrame)
+        self.client._gmplay = MockGsisGamePlay()
+        self.client.max_workers = 2
+        got = self.client.getGamePlay(schedules, pandas.DataFrame, columnar=True)
+        pandas.testing.assert_frame_equal(got[exp.columns], exp)
+        self.assertEqual(len(self.client._gmplay.cache), 0, "merged games retained in cache")
+
+    def test_iterGamePlay_dataframe(self):
+        self.client._gmplay = MockGsisGamePlay()
+        schedules = self.getGameSchedules()
+        chunks = list(self.client.iterGamePlay(schedules, pandas.DataFrame))
+        self.assertEqual(len(chunks), len(schedules))
+        for sched, chunk in zip(schedules, chunks):
+            self.assertEqual(set(chunk["gsis_id"]), {sched["gsis_id"]})
+        exp = self.client.getGamePlay(schedules, pandas.DataFrame)
+        got = pandas.concat(chunks, ignore_index=True)
+        pandas.testing.assert_frame_equal(got[exp.columns], exp)
+
+    def test_iterPlayerGameLog(self):
+        with open("tests/data/roster_kc.json", "rt") as fp:
+            rosters = dict((r["profile_name"], r) for r in json.load(fp))
+        htmlmap = {
+            rosters["patrickmahomes"]["gamelogs_url"]: "tests/data/gamelogs_patrick_mahomes_2018.html",
+            rosters["tyreekhill"]["gamelogs_url"]: "tests/data/gamelogs_tyreek_hill_2018.html"
+        }
+        rlist = [rosters[n] for n in ["tyreekhill", "patrickmahomes"] * 2]
+        self.client._plgmlog = MockUrlPlayerGameLogs(htmlmap)
+        exp = self.client.getPlayerGameLog(rlist, 2018, list)
+        self.client._plgmlog = MockUrlPlayerGameLogs(htmlmap)
+        self.client.max_workers = 3
+        self.assertEqual(list(self.client.iterPlayerGameLog(rlist, 2018, list)), exp)
+        self.assertEqual(self.client._plgmlog._cache, [], "streamed game logs retained in cache")
+        chunks = list(self.client.iterPlayerGameLog(rlist, 2018, pandas.DataFrame))
+        self.assertEqual([c["last_name"].iloc[0] for c in chunks], ["Hill", "Mahomes"] * 2)
+
+class MockGsisGamePlay(GamePlay):
+    """Serves the game center fixture of the game being queried"""
+    def __init__(self):
+        super(MockGsisGamePlay, self).__init__(False)
+
+    def _queryAPI(self, query_doc : dict) -> str:
+        gsisid = self._url.split("/")[-2]
+        with open(f"tests/data/game_{gsisid}_gtd.json", "rt") as fh:
+            return fh.read()
+
+class MockUrlPlayerGameLogs(PlayerGameLogs):
+    """Serves the html file mapped to the game logs URL being queried"""
+    def __init__(self, htmlmap : dict):
+        super(MockUrlPlayerGameLogs, self).__init__()
+        self._htmlmap = htmlmap
+
+    def _queryAPI(self, query_doc : dict) -> str:
+        with open(self._htmlmap[self._url], "rt") as fh:
+            return fh.read()
+
+class MockUrlPlayerProfile(PlayerProfile):
+    """Serves the html file mapped to the profile URL being queried"""
+    def __init__(self, htmlmap : dict):
+        super(MockUrlPlayerProfile, self).__init__()
+        self._htmlmap = htmlmap
+
+    def _queryAPI(self, query_doc : dict) -> str:
+        with open(self._htmlmap[self._url], "rt") as fh:
+            return fh.read()
+
+class MockWeekSchedule(Schedule):
+
+    def __init__(self, xmlmap : dict):
+        super(MockWeekSchedule, self).__init__()
+        self._xmlmap = xmlmap
+        # Shared by the copies made for worker threads
+        self.queried = []
+
+    def _queryAPI(self, query_doc : dict) -> str:
+        self.queried.append(query_doc)
+        if query_doc["week"] in self._xmlmap:
+            with open(self._xmlmap[query_doc["week"]], "rt") as fh:
+                return fh.read()
+        return '<ss><gms gd="0" w="{week}" y="{season}" t="R"></gms></ss>'.format(**query_doc)
+
 class MockClient(Client):
 
     def __init__(self):
@@ -0,0 +1,45 @@
+import unittest
+import pandas
+from nflapi.ColumnTable import ColumnTable
+
+class TestColumnTable(unittest.TestCase):
+
+    def test_append(self):
+        rows = [{"a": 1, "b": "x"}, {"b": None, "c": True}, {"a": 2.5}, {"d": "y"}]
+        table = ColumnTable()
+        for row in rows:
+            table.append(row)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.columns, ["a", "b", "c", "d"])
+        pandas.testing.assert_frame_equal(table.dataframe, pandas.DataFrame(rows))
+
+    def test_append_parts(self):
+        table = ColumnTable()
+        table.append({"a": 1, "b": 2}, {"b": 3, "c": 4})
+        table.append({"a": 5}, {"c": 6})
+        exp = pandas.DataFrame([{"a": 1, "b": 3, "c": 4}, {"a": 5, "c": 6}])
+        pandas.testing.assert_frame_equal(table.dataframe, exp)
+
+    def test_extend(self):
+        t1 = ColumnTable()
+        t1.append({"a": 1, "b": "x"})
+        t2 = ColumnTable()
+        t2.append({"c": 2})
+        t2.append({"a": 3})
+        t1.extend(t2)
+        t1.append({"b": "y"})
+        exp = pandas.DataFrame([{"a": 1, "b": "x"}, {"c": 2}, {"a": 3}, {"b": "y"}])
+        pandas.testing.assert_frame_equal(t1.dataframe, exp)
+
+    def test_toDataFrame_clear(self):
+        table = ColumnTable()
+        table.append({"a": 1, "b": "x"})
+        table.append({"a": 2})
+        exp = table.dataframe
+        got = table.toDataFrame(clear=True)
+        pandas.testing.assert_frame_equal(got, exp)
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.columns, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import os
+import tempfile
+from nflapi.DiskCache import DiskCache
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_put_get(self):
+        cache = DiskCache(self.tmpdir.name)
+        cache.put("http://a/b", {"season": 2018}, "<doc/>", None)
+        self.assertEqual(cache.get("http://a/b", {"season": 2018}), "<doc/>")
+        self.assertIsNone(cache.get("http://a/b", {"season": 2017}))
+        self.assertIsNone(cache.get("http://a/b"))
+
+    def test_get_other_instance(self):
+        DiskCache(self.tmpdir.name).put("http://a/b", None, "doc", None)
+        self.assertEqual(DiskCache(self.tmpdir.name).get("http://a/b"), "doc")
+
+    def test_field_order(self):
+        cache = DiskCache(self.tmpdir.name)
+        cache.put("http://a/b", {"x": 1, "y": 2}, "doc", None)
+        self.assertEqual(cache.get("http://a/b", {"y": 2, "x": 1}), "doc")
+
+    def test_expired(self):
+        cache = DiskCache(self.tmpdir.name)
+        cache.put("http://a/b", None, "doc", 0.000001)
+        self.assertIsNone(cache.get("http://a/b"))
+
+    def test_ttl_zero_not_stored(self):
+        cache = DiskCache(self.tmpdir.name)
+        cache.put("http://a/b", None, "doc", 0)
+        self.assertIsNone(cache.get("http://a/b"))
+        self.assertEqual(cache._files(), [])
+
+    def test_ttl(self):
+        cache = DiskCache(self.tmpdir.name, ttls={"roster": 5})
+        self.assertEqual(cache.ttl("roster"), 5)
+        self.assertEqual(cache.ttl("profile"), DiskCache.TTLS["profile"])
+        self.assertEqual(cache.ttl("unknown"), 0)
+
+    def test_max_bytes_evicts_least_recently_used(self):
+        cache = DiskCache(self.tmpdir.name)
+        cache.put("http://a/1", None, "x" * 100, None)
+        fsize = cache._files()[0][1]
+        cache = DiskCache(self.tmpdir.name, max_bytes=fsize * 2)
+        cache.put("http://a/2", None, "x" * 100, None)
+        path1 = cache._path("http://a/1")
+        os.utime(path1, (1, 1))
+        cache.get("http://a/2")
+        cache.put("http://a/3", None, "x" * 100, None)
+        self.assertIsNone(cache.get("http://a/1"))
+        self.assertIsNotNone(cache.get("http://a/2"))
+        self.assertIsNotNone(cache.get("http://a/3"))
+
+    def test_getEntry_metadata(self):
+        cache = DiskCache(self.tmpdir.name)
+        digest = cache.put("http://a/b", None, "doc", 0.000001, "\"v1\"", "Sat, 05 Oct 2019 00:00:00 GMT")
+        self.assertIsNone(cache.getEntry("http://a/b"))
+        meta, docstr = cache.getEntry("http://a/b", include_expired=True)
+        self.assertEqual(docstr, "doc")
+        self.assertEqual(meta["digest"], digest)
+        self.assertEqual(meta["etag"], "\"v1\"")
+        self.assertEqual(meta["last_modified"], "Sat, 05 Oct 2019 00:00:00 GMT")
+
+    def test_put_bytes(self):
+        cache = DiskCache(self.tmpdir.name)
+        body = "<doc>caf\u00e9</doc>".encode("iso-8859-1")
+        digest = cache.put("http://a/b", None, body, None, charset="iso-8859-1")
+        meta, data = cache.getEntry("http://a/b", binary=True)
+        self.assertEqual((meta["charset"], meta["digest"], data), ("iso-8859-1", digest, body))
+        self.assertEqual(cache.get("http://a/b"), "<doc>caf\u00e9</doc>")
+        cache.refresh("http://a/b", None, None)
+        self.assertEqual(cache.getEntry("http://a/b", binary=True)[1], body)
+
+    def test_refresh(self):
+        cache = DiskCache(self.tmpdir.name)
+        digest = cache.put("http://a/b", None, "doc", 0.000001, "\"v1\"")
+        self.assertEqual(cache.refresh("http://a/b", None, None), digest)
+        meta, docstr = cache.getEntry("http://a/b")
+        self.assertEqual(meta["etag"], "\"v1\"")
+        self.assertIsNone(cache.refresh("http://a/c", None, None))
+
+    def test_rows(self):
+        cache = DiskCache(self.tmpdir.name)
+        digest = cache.put("http://a/b", None, "doc", None)
+        cache.putRows("http://a/b", None, digest, [{"a": 1}])
+        self.assertEqual(cache.getRows("http://a/b", None, digest), [{"a": 1}])
+        digest2 = cache.put("http://a/b", None, "doc2", None)
+        self.assertIsNone(cache.getRows("http://a/b", None, digest2))
+
+    def test_clear(self):
+        cache = DiskCache(self.tmpdir.name)
+        cache.put("http://a/b", None, "doc", None)
+        cache.clear()
+        self.assertIsNone(cache.get("http://a/b"))
+
+if __name__ == "__main__":
+    unittest.main()
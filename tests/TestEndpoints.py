@@ -0,0 +1,47 @@
+import unittest
+import tempfile
+from nflapi.Client import Client
+from nflapi.DiskCache import DiskCache
+from nflapi.Endpoints import Endpoints
+from tests.TestResponseArchive import MockFileHttp
+
+class TestEndpoints(unittest.TestCase):
+
+    def test_url(self):
+        ep = Endpoints("http://proxy.local:8080/nfl/")
+        self.assertEqual(ep.base_url, "http://proxy.local:8080/nfl")
+        self.assertEqual(ep.url("/teams/roster"), "http://proxy.local:8080/nfl/teams/roster")
+        self.assertEqual(ep.url("http://www.nfl.com/player/a/1/profile"), "http://proxy.local:8080/nfl/player/a/1/profile")
+        self.assertEqual(ep.url("http://example.com/doc"), "http://example.com/doc")
+        self.assertEqual(Endpoints().url("/teams/roster"), "http://www.nfl.com/teams/roster")
+        self.assertEqual(Endpoints.siteUrl("/teams/roster"), "http://www.nfl.com/teams/roster")
+        self.assertEqual(Endpoints.siteUrl("http://example.com/doc"), "http://example.com/doc")
+
+    def test_name(self):
+        ep = Endpoints("http://proxy.local:8080/nfl/")
+        self.assertEqual(ep.name("http://proxy.local:8080/nfl/teams/roster"), "/teams/roster")
+        self.assertEqual(ep.name("http://www.nfl.com/teams/roster"), "/teams/roster")
+        self.assertEqual(ep.name("http://example.com/doc"), "http://example.com/doc")
+
+    def test_client(self):
+        base = "http://proxy.local:8080"
+        http = MockFileHttp({
+            (base + "/ajax/scorestrip", 16): "tests/data/schedule_2018_reg_16.xml",
+            (base + "/teams/roster", "KC"): "tests/data/roster_kc.html",
+            (base + "/player/patrickmahomes/2558125/gamelogs", 2018): "tests/data/gamelogs_patrick_mahomes_2018.html"
+        })
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir)
+            client = Client(disk_cache=cache, endpoints=Endpoints(base, http))
+            self.assertEqual(len(client.getSchedule(2018, "regular_season", 16)), 16)
+            rosters = client.getRoster(["KC"])
+            mahomes = [r for r in rosters if r["profile_name"] == "patrickmahomes"]
+            # Rows name documents by their URL on the site
+            self.assertTrue(mahomes[0]["gamelogs_url"].startswith(Endpoints.SITE_URL + "/"))
+            self.assertGreater(len(client.getPlayerGameLog(mahomes, 2018)), 0)
+            self.assertEqual(http.count, 3)
+            # So does the disk cache, whichever base URL they came from
+            self.assertIsNotNone(cache.getEntry("http://www.nfl.com/teams/roster", {"team": "KC"}))
+
+if __name__ == "__main__":
+    unittest.main()
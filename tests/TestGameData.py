@@ -68,3 +68,13 @@ class TestGameData(unittest.TestCase):
         self.assertEqual(gd._qapi_count, 2, "query count not expected")
         self.assertEqual(gd._url, gd._url_base.format(gsisid=gsis_id1), "URL not expected")
         self.assertEqual(got, exp)
+
+    def test_getGameData_cache_counts(self):
+        gsis_id = "2018122314"
+        sch = self.getSchedule(gsis_id)
+        gd = MockGameData("tests/data/game_2018122314_gtd.json")
+        gd.getGameData(sch)
+        gd.getGameData(sch)
+        self.assertEqual(gd._qapi_count, 1, "query count not expected")
+        self.assertEqual(gd.cache.hits, 1, "hit count not expected")
+        self.assertEqual(gd.cache.misses, 1, "miss count not expected")
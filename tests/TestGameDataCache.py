@@ -0,0 +1,51 @@
+import unittest
+from nflapi.GameDataCache import GameDataCache
+
+class TestGameDataCache(unittest.TestCase):
+
+    def test_get_counts(self):
+        cache = GameDataCache()
+        self.assertIsNone(cache.get("2018122314"))
+        cache.put("2018122314", {"2018122314": {}})
+        self.assertEqual(cache.get("2018122314"), {"2018122314": {}})
+        self.assertEqual(cache.hits, 1, "hit count not expected")
+        self.assertEqual(cache.misses, 1, "miss count not expected")
+
+    def test_peek_does_not_count(self):
+        cache = GameDataCache()
+        cache.put("2018122314", {})
+        cache.peek("2018122314")
+        cache.peek("2018122313")
+        self.assertEqual(cache.hits, 0, "hit count not expected")
+        self.assertEqual(cache.misses, 0, "miss count not expected")
+
+    def test_put_evicts_least_recently_used(self):
+        cache = GameDataCache(2)
+        cache.put("1", {"1": {}})
+        cache.put("2", {"2": {}})
+        # Using 1 makes 2 the least recently used
+        cache.get("1")
+        cache.put("3", {"3": {}})
+        self.assertEqual(len(cache), 2)
+        self.assertIn("1", cache)
+        self.assertNotIn("2", cache)
+        self.assertIn("3", cache)
+
+    def test_max_size_shrinks(self):
+        cache = GameDataCache()
+        for k in ["1", "2", "3"]:
+            cache.put(k, {k: {}})
+        cache.max_size = 1
+        self.assertEqual(len(cache), 1)
+        self.assertIn("3", cache)
+
+    def test_clear(self):
+        cache = GameDataCache()
+        cache.put("1", {})
+        cache.get("1")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0, "hit count not expected")
+
+if __name__ == "__main__":
+    unittest.main()
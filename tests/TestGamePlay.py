@@ -158,6 +158,26 @@ class TestGamePlay(unittest.TestCase):
         got = gd.getGamePlay(sch, pandas.DataFrame)
         self.assertTrue(all(got.eq(exp)))
     
+    def test_getGamePlay_columnar(self):
+        gsis_id = "2018122314"
+        sch = self.getSchedule(gsis_id)
+        gd = MockGamePlay("tests/data/game_2018122314_gtd.json")
+        exp = gd.getGamePlay(sch, pandas.DataFrame)
+        got = gd.getGamePlay(sch, pandas.DataFrame, columnar=True)
+        pandas.testing.assert_frame_equal(got, exp)
+
+    def test_getGamePlayColumns_extend(self):
+        gd = MockGamePlay("tests/data/game_2018122314_gtd.json")
+        sch14 = self.getSchedule("2018122314")
+        exp = gd.getGamePlay(sch14)
+        got = gd.getGamePlayColumns(sch14)
+        gd.srcpath = "tests/data/game_2018122313_gtd.json"
+        sch13 = self.getSchedule("2018122313")
+        exp.extend(gd.getGamePlay(sch13))
+        got.extend(gd.getGamePlayColumns(sch13))
+        self.assertEqual(len(got), len(exp))
+        pandas.testing.assert_frame_equal(got.dataframe, pandas.DataFrame(exp))
+
     def test_getGamePlay_2nd_call(self):
         gsis_id = "2018122314"
         sch = self.getSchedule(gsis_id)
@@ -0,0 +1,56 @@
+import unittest
+import json
+import pandas
+from tests.MockGameData import MockGameData
+from nflapi.GameTables import GameTables
+
+class TestGameTables(unittest.TestCase):
+    def getSchedule(self, gsis_id : str) -> dict:
+        with open("tests/data/schedule_2018_reg_16.json", "rt") as rfp:
+            sch = json.load(rfp)
+            il = [i for i in range(0, len(sch)) if sch[i]["gsis_id"] == gsis_id]
+            return sch[il[0]]
+
+    def getExpected(self, gsis_id : str, table : str) -> list:
+        with open(f"tests/data/game_{gsis_id}_{table}.json", "rt") as fp:
+            return json.load(fp)
+
+    def test_getGameTables_list(self):
+        gsis_id = "2018122314"
+        sch = self.getSchedule(gsis_id)
+        gt = MockGameTables("tests/data/game_2018122314_gtd.json")
+        got = gt.getGameTables(sch)
+        self.assertEqual(list(got.keys()), ["summary", "score", "drive", "play"])
+        for table in got.keys():
+            self.assertEqual(got[table], self.getExpected(gsis_id, table), f"{table} not expected")
+        self.assertEqual(gt._qapi_count, 1, "query count not expected")
+
+    def test_getGameTables_subset(self):
+        gsis_id = "2018122313"
+        sch = self.getSchedule(gsis_id)
+        gt = MockGameTables("tests/data/game_2018122313_gtd.json")
+        got = gt.getGameTables(sch, ["drive", "score"])
+        self.assertEqual(set(got.keys()), {"drive", "score"})
+        self.assertEqual(got["drive"], self.getExpected(gsis_id, "drive"))
+        self.assertEqual(got["score"], self.getExpected(gsis_id, "score"))
+
+    def test_getGameTables_dataframe(self):
+        gsis_id = "2018122314"
+        sch = self.getSchedule(gsis_id)
+        gt = MockGameTables("tests/data/game_2018122314_gtd.json")
+        got = gt.getGameTables(sch, ["play"], pandas.DataFrame)
+        exp = pandas.DataFrame(self.getExpected(gsis_id, "play"))
+        self.assertTrue(all(got["play"].eq(exp)))
+
+    def test_getGameTables_invalid(self):
+        gt = MockGameTables("tests/data/game_2018122314_gtd.json")
+        with self.assertRaises(AssertionError):
+            gt.getGameTables(self.getSchedule("2018122314"), ["plays"])
+
+class MockGameTables(MockGameData, GameTables):
+
+    def __init__(self, srcpath : str):
+        super(MockGameTables, self).__init__(srcpath)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.exceptions import MaxRetryError
+from nflapi.HttpPool import HttpPool
+from nflapi.StandInServer import StandInServer
+
+class TestHttpPool(unittest.TestCase):
+
+    def getRoster(self, http : HttpPool, server : StandInServer) -> int:
+        return http.request("GET", server.url + "/teams/roster", fields={"team": "KC"}).status
+
+    def getRosters(self, http : HttpPool, server : StandInServer, count : int) -> list:
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return list(executor.map(lambda _: self.getRoster(http, server), range(count)))
+
+    def test_retries(self):
+        with StandInServer("tests/data", error_rate=0.5, seed=1) as server:
+            http = HttpPool(retries=0)
+            statuses = [self.getRoster(http, server) for _ in range(10)]
+            self.assertIn(503, statuses)
+            http = HttpPool(retries=10, backoff_factor=0)
+            statuses = [self.getRoster(http, server) for _ in range(10)]
+            self.assertEqual(statuses, [200] * 10)
+        got = http.metrics()
+        self.assertEqual(got["requests"], 10)
+        self.assertGreater(got["retries"], 0)
+        self.assertEqual(got["errors"], 0)
+
+    def test_discarded(self):
+        with StandInServer("tests/data", latency=0.2) as server:
+            http = HttpPool(maxsize=1)
+            self.assertEqual(self.getRosters(http, server, 4), [200] * 4)
+        got = http.metrics()
+        self.assertEqual((got["requests"], got["in_flight"], got["max_in_flight"]), (4, 0, 4))
+        self.assertEqual(got["connections_opened"], 4)
+        self.assertEqual(got["connections_discarded"], 3)
+        self.assertEqual(got["waits"], 0)
+
+    def test_block(self):
+        with StandInServer("tests/data", latency=0.1) as server:
+            http = HttpPool(maxsize=1, block=True)
+            self.assertEqual(self.getRosters(http, server, 4), [200] * 4)
+        got = http.metrics()
+        self.assertEqual((got["connections_opened"], got["connections_discarded"]), (1, 0))
+        self.assertEqual(got["waits"], 3)
+        self.assertGreater(got["max_wait_seconds"], 0.05)
+        http.clearMetrics()
+        self.assertEqual(http.metrics()["requests"], 0)
+
+    def test_compressed(self):
+        with open("tests/data/roster_kc.html", "rb") as fp:
+            exp = fp.read()
+        with StandInServer("tests/data") as server:
+            http = HttpPool()
+            rslt = http.request("GET", server.url + "/teams/roster", fields={"team": "KC"})
+            self.assertEqual(rslt.headers["Content-Encoding"], "gzip")
+            self.assertEqual(rslt.data, exp)
+            got = http.metrics()
+            self.assertEqual(got["bytes_decoded"], len(exp))
+            self.assertLess(got["bytes_received"], len(exp) / 3, "response not compressed")
+            self.assertEqual(rslt.received, got["bytes_received"])
+            http = HttpPool(compress=False)
+            rslt = http.request("GET", server.url + "/teams/roster", fields={"team": "KC"})
+            self.assertNotIn("Content-Encoding", rslt.headers)
+            self.assertEqual(http.metrics()["bytes_received"], len(exp))
+            # The response is not read when preload_content is False
+            rslt = HttpPool().request("GET", server.url + "/teams/roster", fields={"team": "KC"}, preload_content=False)
+            self.assertEqual(rslt.read(), exp)
+            rslt.release_conn()
+
+    def test_read_timeout(self):
+        with StandInServer("tests/data", latency=0.5) as server:
+            http = HttpPool(read_timeout=0.05, retries=0)
+            with self.assertRaises(MaxRetryError):
+                self.getRoster(http, server)
+        self.assertEqual(http.metrics()["errors"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import json
+from nflapi.Client import Client
+from nflapi.ParsePool import ParsePool
+from nflapi.PlayerGameLogsContentHandler import PlayerGameLogsContentHandler
+from tests.TestClient import MockUrlPlayerGameLogs, MockUrlPlayerProfile
+
+class TestParsePool(unittest.TestCase):
+
+    def getRosters(self) -> dict:
+        with open("tests/data/roster_kc.json", "rt") as fp:
+            return dict((r["profile_name"], r) for r in json.load(fp))
+
+    def test_parse(self):
+        with open("tests/data/gamelogs_patrick_mahomes_2018.html", "rt") as fp:
+            doc = fp.read()
+        handler = PlayerGameLogsContentHandler(2018)
+        with ParsePool(2) as pool:
+            got = pool.parse(handler, doc)
+        self.assertEqual(handler.list, [], "handler modified")
+        handler.parse(doc)
+        self.assertEqual(got, handler.list)
+
+    def test_client_parse_processes(self):
+        rosters = self.getRosters()
+        gmlogmap = {
+            rosters["patrickmahomes"]["gamelogs_url"]: "tests/data/gamelogs_patrick_mahomes_2018.html",
+            rosters["tyreekhill"]["gamelogs_url"]: "tests/data/gamelogs_tyreek_hill_2018.html"
+        }
+        profmap = {
+            rosters["patrickmahomes"]["profile_url"]: "tests/data/profile_patrick_mahomes.html",
+            rosters["tyreekhill"]["profile_url"]: "tests/data/profile_tyreek_hill.html"
+        }
+        rlist = [rosters[n] for n in ["tyreekhill", "patrickmahomes"]]
+        client = Client()
+        client._plgmlog = MockUrlPlayerGameLogs(gmlogmap)
+        client._plprof = MockUrlPlayerProfile(profmap)
+        exp_logs = client.getPlayerGameLog(rlist, 2018, list)
+        exp_profs = client.getPlayerProfile(rlist, list)
+
+        client = Client(max_workers=2, parse_processes=2)
+        try:
+            client._plgmlog = MockUrlPlayerGameLogs(gmlogmap)
+            client._plgmlog._parsePool = client._parsePool
+            client._plprof = MockUrlPlayerProfile(profmap)
+            client._plprof._parsePool = client._parsePool
+            self.assertEqual(client.getPlayerGameLog(rlist, 2018, list), exp_logs)
+            self.assertEqual(client.getPlayerProfile(rlist, list), exp_profs)
+        finally:
+            client.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,21 @@ class TestPlayerGameLogsContentHandler(unittest.TestCase):
         exp = self.getExpectedList("tests/data/gamelogs_harrison_butker_2018_parse.json")
         self.assertEqual(self.handler.list, exp)
 
+    def test_parse_native_datetimes(self):
+        with open("tests/data/gamelogs_patrick_mahomes_2018.html", "rt") as fp:
+            doc = fp.read()
+        handler = PlayerGameLogsContentHandler(2018, native_datetimes=True)
+        handler.parse(doc)
+        exp = self.getExpectedList()
+        got = handler.dataframe
+        self.assertEqual(str(got["game_date"].dt.tz), "America/New_York")
+        self.assertEqual(list(got["game_date"].dt.strftime("%Y-%m-%d")),
+                         [time.strftime("%Y-%m-%d", d["game_date"]) for d in exp])
+        rows = handler.list
+        for d in exp + rows:
+            del d["game_date"]
+        self.assertEqual(rows, exp)
+
 if __name__ == "__main__":
     unittest.main()
 
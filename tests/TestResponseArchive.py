@@ -0,0 +1,89 @@
+import unittest
+import os
+import tempfile
+from nflapi.Client import Client
+from nflapi.Endpoints import Endpoints
+from nflapi.HttpPool import HttpPool
+from nflapi.Exceptions import MissingRecordingException
+from nflapi.ResponseArchive import ResponseArchive, RecordingTransport, ReplayTransport
+from nflapi.StandInServer import StandInServer
+from tests.TestAPI import MockResponse
+
+class TestResponseArchive(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmpdir.name, "responses.zip")
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def getHttp(self) -> "MockFileHttp":
+        return MockFileHttp({
+            ("http://www.nfl.com/ajax/scorestrip", 16): "tests/data/schedule_2018_reg_16.xml",
+            ("http://www.nfl.com/teams/roster", "KC"): "tests/data/roster_kc.html",
+            ("http://www.nfl.com/player/patrickmahomes/2558125/gamelogs", 2018): "tests/data/gamelogs_patrick_mahomes_2018.html"
+        })
+
+    def getData(self, client : Client) -> list:
+        rosters = client.getRoster(["KC"])
+        mahomes = [r for r in rosters if r["profile_name"] == "patrickmahomes"]
+        return [client.getSchedule(2018, "regular_season", 16), rosters,
+                client.getPlayerGameLog(mahomes, 2018)]
+
+    def test_record_replay(self):
+        http = self.getHttp()
+        with ResponseArchive(self.path, "a") as archive:
+            exp = self.getData(Client(transport=RecordingTransport(archive, http)))
+            self.assertEqual(len(archive), 3)
+        self.assertEqual(http.count, 3)
+        self.assertLess(os.path.getsize(self.path), http.nbytes / 3, "responses not compressed")
+
+        with ResponseArchive(self.path) as archive:
+            client = Client(max_workers=2, transport=ReplayTransport(archive))
+            self.assertEqual(self.getData(client), exp)
+            with self.assertRaises(MissingRecordingException):
+                client.getSchedule(2018, "regular_season", 15)
+
+    def test_record_server_replay_site(self):
+        with StandInServer("tests/data") as server:
+            with ResponseArchive(self.path, "a") as archive:
+                transport = RecordingTransport(archive, HttpPool(), server.url)
+                exp = self.getData(Client(endpoints=Endpoints(server.url, transport)))
+        with ResponseArchive(self.path) as archive:
+            # The bodies were recorded decoded, so must not be marked compressed
+            rslt = archive.get("GET", "/teams/roster", {"team": "KC"})
+            self.assertNotIn("Content-Encoding", rslt.headers)
+            self.assertNotIn("Content-Length", rslt.headers)
+            self.assertEqual(self.getData(Client(transport=ReplayTransport(archive))), exp)
+
+    def test_put_first_kept(self):
+        with ResponseArchive(self.path, "a") as archive:
+            self.assertTrue(archive.put("GET", "http://localhost/doc", {"a": 1, "b": 2}, None, MockResponse(200, b"first")))
+            self.assertFalse(archive.put("GET", "http://localhost/doc", {"b": 2, "a": 1}, None, MockResponse(200, b"second")))
+        with ResponseArchive(self.path) as archive:
+            rslt = archive.get("GET", "http://localhost/doc", {"b": "2", "a": "1"})
+            self.assertEqual((rslt.status, rslt.data), (200, b"first"))
+            self.assertEqual(rslt.headers["content-type"], "text/xml; charset=utf-8")
+            self.assertIsNone(archive.get("GET", "http://localhost/doc"))
+
+class MockFileHttp(object):
+    """Stands in for the urllib3 PoolManager, serving files by URL and first query value"""
+
+    def __init__(self, filemap : dict):
+        self._filemap = filemap
+        self.count = 0
+        self.nbytes = 0
+
+    def request(self, method : str, url : str, fields : dict = None, **kwargs) -> MockResponse:
+        self.count += 1
+        key = (url, None if fields is None else list(fields.values())[-1])
+        if key not in self._filemap:
+            return MockResponse(404, b"")
+        with open(self._filemap[key], "rb") as fp:
+            data = fp.read()
+        self.nbytes += len(data)
+        return MockResponse(200, data)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 import unittest
+import tempfile
 import json
 import pandas
 import datetime
 from nflapi.CachedAPI import ListOrDataFrame
 from nflapi.Roster import Roster
+from nflapi.DiskCache import DiskCache
 
 class TestRoster(unittest.TestCase):
 
@@ -34,6 +36,34 @@ class TestRoster(unittest.TestCase):
         xrostd = getExpectedResults("tests/data/roster_kc_20191005.json")
         self.assertEqual(rostd, xrostd)
 
+    def test_getRoster_revalidated(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # The stored response expires immediately so that
+            # the next request must be revalidated
+            cache = DiskCache(tmpdir, ttls={"roster": 0.000001})
+            http = MockConditionalHttp("tests/data/roster_kc.html", "\"v1\"")
+            obj = CountingRoster(cache, http)
+            obj.getRoster("KC")
+            self.assertEqual(obj.parse_count, 1, "parse count not expected")
+            # A new object has nothing cached in memory
+            obj = CountingRoster(cache, http)
+            rostd = obj.getRoster("KC")
+            self.assertEqual(http.headers[-1], {"If-None-Match": "\"v1\""}, "request headers not expected")
+            self.assertEqual(http.statuses, [200, 304], "response statuses not expected")
+            self.assertEqual(obj.parse_count, 0, "parse count not expected")
+            self.assertEqual(rostd, getExpectedResults("tests/data/roster_kc.json"))
+
+    def test_getRoster_changed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir, ttls={"roster": 0.000001})
+            http = MockConditionalHttp("tests/data/roster_kc.html", "\"v1\"")
+            CountingRoster(cache, http).getRoster("KC")
+            http.etag = "\"v2\""
+            obj = CountingRoster(cache, http)
+            obj.getRoster("KC")
+            self.assertEqual(http.statuses, [200, 200], "response statuses not expected")
+            self.assertEqual(obj.parse_count, 1, "parse count not expected")
+
 def getExpectedResults(jspath : str, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
     with open(jspath, "rt") as jfh:
         xschd = json.load(jfh)
@@ -68,6 +98,41 @@ class MockRoster(Roster):
         self._qapi_count += 1
         return self._htmlstr
 
+class CountingRoster(Roster):
+    def __init__(self, cache : DiskCache, http : object):
+        super(CountingRoster, self).__init__()
+        self._diskCache = cache
+        self._http = http
+        self.parse_count = 0
+
+    def _parseDocument(self, docstr : str):
+        self.parse_count += 1
+        super(CountingRoster, self)._parseDocument(docstr)
+
+class MockConditionalResponse(object):
+    def __init__(self, status : int, data : bytes, etag : str):
+        self.status = status
+        self.data = data
+        self.headers = {"Content-Type": "text/html; charset=utf-8", "ETag": etag}
+
+class MockConditionalHttp(object):
+    """Stands in for the urllib3 PoolManager, honoring If-None-Match"""
+    def __init__(self, htmlpath : str, etag : str):
+        with open(htmlpath, "rb") as fh:
+            self.data = fh.read()
+        self.etag = etag
+        self.headers = []
+        self.statuses = []
+
+    def request(self, method : str, url : str, fields : dict = None, headers : dict = None) -> MockConditionalResponse:
+        self.headers.append(headers)
+        if headers is not None and headers.get("If-None-Match") == self.etag:
+            rslt = MockConditionalResponse(304, b"", self.etag)
+        else:
+            rslt = MockConditionalResponse(200, self.data, self.etag)
+        self.statuses.append(rslt.status)
+        return rslt
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -6,6 +6,8 @@ import pandas
 import time
 from nflapi.CachedAPI import ListOrDataFrame
 from nflapi.Schedule import Schedule
+from nflapi.DiskCache import DiskCache
+import tempfile
 
 class TestSchedule(unittest.TestCase):
     """ Test the Schedule class """
@@ -75,6 +77,41 @@ class TestSchedule(unittest.TestCase):
         xschdf = getExpectedResults("tests/data/schedule_2018_reg_16.json", pandas.DataFrame)
         self.assertTrue(all(schdf.eq(xschdf, axis="columns")), "data does not match")
 
+    def test_getSchedule_two_week_cache_index(self):
+        obj = MockSchedule("tests/data/schedule_2018_reg_16.xml")
+        obj.getSchedule(2018, "regular_season", 16)
+        obj.xmlpath = "tests/data/schedule_2018_reg_15.xml"
+        obj.getSchedule(2018, "regular_season", 15)
+        self.assertEqual(set(obj._cacheIndex.keys()),
+                         {(2018, "regular_season", 15), (2018, "regular_season", 16)},
+                         "cache index keys not expected")
+        xschd = getExpectedResults("tests/data/schedule_2018_reg_16.json")
+        self.assertEqual(obj._cacheIndex[(2018, "regular_season", 16)], xschd)
+
+    def test_getSchedule_native_datetimes(self):
+        obj = MockSchedule("tests/data/schedule_2018_reg_16.xml", True)
+        df = obj.getSchedule(2018, "regular_season", 16, pandas.DataFrame)
+        self.assertEqual(str(df["date"].dt.tz), "America/New_York")
+        xschd = getExpectedResults("tests/data/schedule_2018_reg_16.json")
+        exp = [time.strftime("%Y-%m-%d %H:%M", d["date"]) for d in xschd]
+        self.assertEqual(list(df["date"].dt.strftime("%Y-%m-%d %H:%M")), exp)
+        self.assertTrue(df["date"].equals(df["start_time"]))
+
+    def test_getSchedule_native_datetimes_disk_rows(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(tmpdir)
+            obj = MockSchedule("tests/data/schedule_2018_reg_16.xml")
+            obj._diskCache = cache
+            query = {"season": 2018, "seasonType": "REG", "week": 16}
+            # Rows stored by an object parsing struct_time values
+            cache.putRows(obj._siteUrl, query, "digest", [{"stale": True}])
+            obj = MockSchedule("tests/data/schedule_2018_reg_16.xml", True)
+            obj._diskCache = cache
+            obj._reuseDigest = "digest"
+            got = obj.getSchedule(2018, "regular_season", 16)
+            self.assertEqual(len(got), 16)
+            self.assertEqual(cache.getRows(obj._siteUrl, query, "digest/native_datetimes"), got)
+
 def getExpectedResults(jspath : str, return_type : ListOrDataFrame = list) -> ListOrDataFrame:
     with open(jspath, "rt") as jfh:
         xschd = json.load(jfh)
@@ -86,10 +123,11 @@ def getExpectedResults(jspath : str, return_type : ListOrDataFrame = list) -> Li
     return xschd
 
 class MockSchedule(Schedule):
-    def __init__(self, xmlpath : str):
-        super(MockSchedule, self).__init__()
+    def __init__(self, xmlpath : str, native_datetimes : bool = False):
+        super(MockSchedule, self).__init__(native_datetimes)
         self.xmlpath = xmlpath
         self._qapi_count = 0
+        self._reuseDigest = None
 
     @property
     def queryAPI_count(self):
@@ -108,6 +146,9 @@ class MockSchedule(Schedule):
     def _queryAPI(self, query_doc : dict) -> str:
         self._qapi_count += 1
         self._queryDoc = query_doc
+        # Act as though the document was found in the disk cache
+        self._diskCacheDigest = self._reuseDigest
+        self._diskCacheReused = self._reuseDigest is not None
         return self._xmlstr
 
     @property
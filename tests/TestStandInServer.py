@@ -0,0 +1,43 @@
+import unittest
+from urllib3 import PoolManager
+from nflapi.Client import Client
+from nflapi.StandInServer import StandInServer
+
+class TestStandInServer(unittest.TestCase):
+
+    def setUp(self):
+        self.http = PoolManager()
+
+    def test_client(self):
+        with StandInServer("tests/data") as server:
+            client = Client(endpoints=server.endpoints(self.http))
+            sched = client.getSchedule(2018, "regular_season", 16)
+            self.assertEqual(len(sched), 16)
+            self.assertEqual(client.getSchedule(2018, "regular_season", 3), [])
+            rosters = client.getRoster(["KC"])
+            self.assertGreater(len(rosters), 0)
+            mahomes = [r for r in rosters if r["profile_name"] == "patrickmahomes"]
+            self.assertGreater(len(client.getPlayerGameLog(mahomes, 2018)), 0)
+            self.assertEqual(server.request_count, 4)
+
+    def test_not_found(self):
+        with StandInServer("tests/data") as server:
+            self.assertEqual(self.http.request("GET", server.url + "/teams/roster", fields={"team": "XX"}).status, 404)
+            self.assertEqual(self.http.request("GET", server.url + "/nothing").status, 404)
+        with StandInServer("tests/data", substitute=True) as server:
+            rslt = self.http.request("GET", server.url + "/teams/roster", fields={"team": "XX"})
+            self.assertEqual(rslt.status, 200)
+            self.assertEqual(rslt.data, self.http.request("GET", server.url + "/teams/roster", fields={"team": "XX"}).data)
+
+    def test_errors(self):
+        with StandInServer("tests/data", error_rate=0.5, error_status=502, seed=1) as server:
+            statuses = [self.http.request("GET", server.url + "/teams/roster", fields={"team": "KC"}).status
+                        for _ in range(40)]
+        self.assertEqual(set(statuses), {200, 502})
+        with StandInServer("tests/data", error_rate=0.5, error_status=502, seed=1) as server:
+            again = [self.http.request("GET", server.url + "/teams/roster", fields={"team": "KC"}).status
+                     for _ in range(40)]
+        self.assertEqual(statuses, again, "errors not reproduced with the same seed")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import json
+import os
+import tempfile
+import xml.sax
+import pandas
+from nflapi.Client import Client
+from nflapi.TableSchema import TableSchema, SCHEMAS
+from nflapi.ScheduleContentHandler import ScheduleContentHandler
+
+try:
+    import pyarrow
+    has_pyarrow = True
+except ImportError:
+    has_pyarrow = False
+
+class TestTableSchema(unittest.TestCase):
+
+    def getSchedule(self) -> list:
+        handler = ScheduleContentHandler()
+        with open("tests/data/schedule_2018_reg_16.xml", "rb") as fp:
+            xml.sax.parseString(fp.read(), handler)
+        return handler.list
+
+    def test_apply_schedule(self):
+        df = SCHEMAS["schedule"].apply(self.getSchedule())
+        self.assertEqual(str(df["week"].dtype), "Int64")
+        self.assertEqual(str(df["finished"].dtype), "boolean")
+        self.assertEqual(str(df["date"].dt.tz), "UTC")
+        # 4:30 PM US Eastern
+        self.assertEqual(df["date"].iloc[0], pandas.Timestamp("2018-12-22 21:30", tz="UTC"))
+        self.assertEqual(df["start_time"].iloc[0], "16:30")
+
+    def test_apply_nullable_int(self):
+        with open("tests/data/roster_kc.json", "rt") as fp:
+            rosters = json.load(fp)
+        df = SCHEMAS["roster"].apply(rosters)
+        self.assertEqual(str(df["number"].dtype), "Int64")
+        self.assertEqual(df["number"].isna().sum(), sum(1 for r in rosters if r["number"] is None))
+
+    def test_apply_play_stats(self):
+        with open("tests/data/game_2018122314_play.json", "rt") as fp:
+            df = SCHEMAS["play"].apply(json.load(fp))
+        self.assertEqual(str(df["rushing_yds"].dtype), "Int64")
+        self.assertEqual(str(df["defense_sk"].dtype), "float64")
+        self.assertEqual(str(df["play_id"].dtype), "string")
+
+    def test_apply_missing_columns(self):
+        df = SCHEMAS["score"].apply([{"gsis_id": "2018122314", "team": "KC", "q1": 7}])
+        self.assertEqual(list(df.columns), list(SCHEMAS["score"].columns.keys()))
+        self.assertTrue(df["final"].isna().all())
+        self.assertEqual(str(df["final"].dtype), "Int64")
+
+    def test_apply_rule_fallback(self):
+        schema = TableSchema("test", {"a": "Int64"}, default="Int64")
+        with self.assertLogs(level="WARNING"):
+            df = schema.apply([{"a": 1, "b": "x"}])
+        self.assertEqual(df["b"].iloc[0], "x")
+        with self.assertRaises((TypeError, ValueError)):
+            schema.apply([{"a": "x"}])
+
+    def test_export_csv(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "schedule.csv")
+            Client().export(self.getSchedule(), "schedule", path, "csv")
+            df = pandas.read_csv(path)
+        self.assertEqual(len(df), 16)
+        self.assertEqual(df["date"].iloc[0], "2018-12-22 21:30:00+00:00")
+
+    @unittest.skipUnless(has_pyarrow, "pyarrow is not installed")
+    def test_export_parquet(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "schedule.parquet")
+            Client().export(self.getSchedule(), "schedule", path)
+            schema = pyarrow.parquet.read_schema(path)
+        self.assertEqual(str(schema.field("week").type), "int64")
+        self.assertEqual(str(schema.field("gsis_id").type), "string")
+
+    def test_export_invalid(self):
+        with self.assertRaises(AssertionError):
+            Client().export([], "games", "games.parquet")
+        with self.assertRaises(AssertionError):
+            Client().export([], "schedule", "schedule.xlsx", "xlsx")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import datetime
 import nflapi.Utilities as util
+import nflgame.statmap as sm
 
 class TestUtilities(unittest.TestCase):
 
@@ -31,6 +32,28 @@ class TestUtilities(unittest.TestCase):
         }
         self.assertEqual(util.getStatMetadata(5), exp)
 
+    def test_expandStat(self):
+        for statId in sm.idmap.keys():
+            for yards in [12.0, None, "x"]:
+                exp = sm.values(statId, yards)
+                exp.update(util.getStatMetadata(statId))
+                got = util.expandStat(statId, yards)
+                self.assertEqual(got, exp)
+                self.assertEqual(list(got.keys()), list(exp.keys()))
+
+    def test_expandStat_data(self):
+        data = {"player_id": 0}
+        got = util.expandStat(10, 7.0, data)
+        self.assertIs(got, data)
+        self.assertEqual(got["rushing_yds"], 7)
+        self.assertEqual(got["stat_cat"], "rushing")
+
+    def test_expandStat_unknown(self):
+        data = {"player_id": 0}
+        with self.assertRaises(AssertionError):
+            util.expandStat(-1, 0, data)
+        self.assertEqual(data, {"player_id": 0})
+
     def test_getFirstDate(self):
         dt = util.getFirstDate(2019, 9, 4)
         self.assertEqual(dt, datetime.date(2019, 9, 6))